@@ -0,0 +1,78 @@
+"""Compare the payload size and round trip time of the wire formats.
+
+Run from the repository root:
+
+    python -m benchmarks.pickling
+"""
+
+import pickle
+import timeit
+from rebase.core import Model, Object, unpackb
+from rebase.core.stream import iter_records
+
+
+class Room(Object):
+    def properties(self):
+        return {
+            'id': 'id',
+            'price': ('price', lambda x: round(x * 1.19, 2)),
+            'currency': 'currency',
+        }
+
+
+class Hotel(Model):
+    def properties(self):
+        return {
+            'name': 'name',
+            'stars': ('rating.stars', int),
+            'city': 'location.city',
+            'country': 'location.country',
+            'rooms': ('rooms', lambda x: [Room(**r) for r in x]),
+        }
+
+
+RECORD = {
+    'name': 'Hotel Paris',
+    'rating': {'stars': 4},
+    'location': {'city': 'Paris', 'country': 'France'},
+    'rooms': [
+        {'id': i, 'price': 100 + i, 'currency': 'EUR'} for i in range(10)
+    ],
+}
+
+FORMATS = {
+    'raw + mapped pickle': (
+        lambda h: pickle.dumps(
+            (h._raw_attributes, h.attributes), pickle.HIGHEST_PROTOCOL),
+        pickle.loads,
+    ),
+    'pickle': (
+        lambda h: pickle.dumps(h, pickle.HIGHEST_PROTOCOL),
+        pickle.loads,
+    ),
+    'to_bytes() + decode': (
+        lambda h: h.to_bytes(),
+        lambda data: next(iter_records([data])),
+    ),
+    'to_msgpack() + unpackb': (
+        lambda h: h.to_msgpack(),
+        unpackb,
+    ),
+}
+
+
+def round_trip(dumps, loads, hotel, number=5000):
+    """Return the payload size and the time in microseconds of a round trip."""
+    size = len(dumps(hotel))
+    seconds = timeit.timeit(
+        'loads(dumps(hotel))',
+        globals={'dumps': dumps, 'loads': loads, 'hotel': hotel},
+        number=number)
+    return size, seconds / number * 1e6
+
+
+if __name__ == '__main__':
+    hotel = Hotel(**RECORD)
+    for label, (dumps, loads) in FORMATS.items():
+        size, latency = round_trip(dumps, loads, hotel)
+        print(f'{label:>24}: {size:5d} bytes, {latency:7.2f} us/round trip')
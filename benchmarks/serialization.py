@@ -0,0 +1,55 @@
+"""Compare `str()` with `to_json()` and `to_bytes()` for every encoder.
+
+Run from the repository root:
+
+    python -m benchmarks.serialization
+"""
+
+import timeit
+from rebase.core import Encoder, Model, Object
+
+
+class Room(Object):
+    def properties(self):
+        return {
+            'id': 'id',
+            'price': 'price',
+            'currency': 'currency',
+        }
+
+
+class Hotel(Model):
+    def properties(self):
+        return {
+            'name': 'name',
+            'stars': ('rating.stars', int),
+            'city': 'location.city',
+            'country': 'location.country',
+            'rooms': ('rooms', lambda x: [Room(**r) for r in x]),
+        }
+
+
+RECORD = {
+    'name': 'Hotel Paris',
+    'rating': {'stars': 4},
+    'location': {'city': 'Paris', 'country': 'France'},
+    'rooms': [
+        {'id': i, 'price': 100 + i, 'currency': 'EUR'} for i in range(10)
+    ],
+}
+
+
+def latency(statement, hotel, number=20000):
+    """Return the time in microseconds of one serialization."""
+    return timeit.timeit(statement, globals={'hotel': hotel}, number=number) \
+        / number * 1e6
+
+
+if __name__ == '__main__':
+    hotel = Hotel(**RECORD)
+    print(f'{"str()":>22}: {latency("str(hotel)", hotel):6.2f} us')
+    for name in sorted(Encoder._registry):
+        for method in ('to_json', 'to_bytes'):
+            label = f'{method}({name!r})'
+            statement = f'hotel.{method}({name!r})'
+            print(f'{label:>22}: {latency(statement, hotel):6.2f} us')
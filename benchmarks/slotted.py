@@ -0,0 +1,59 @@
+"""Compare dict-backed and `slotted` objects.
+
+Run from the repository root:
+
+    python -m benchmarks.slotted
+"""
+
+import timeit
+import tracemalloc
+from rebase.core import Model, slotted
+
+
+class Hotel(Model):
+    def properties(self):
+        return {
+            'name': 'name',
+            'stars': ('rating.stars', int),
+            'city': 'location.city',
+            'country': 'location.country',
+            'price': 'price',
+            'currency': 'currency',
+        }
+
+
+SlottedHotel = slotted(Hotel)
+
+RECORD = {
+    'name': 'Hotel Paris',
+    'rating': {'stars': 4},
+    'location': {'city': 'Paris', 'country': 'France'},
+    'price': 120,
+    'currency': 'EUR',
+}
+
+
+def retained_bytes(cls, count=10000):
+    """Return the bytes retained per instance, excluding the raw input."""
+    records = [dict(RECORD) for _ in range(count)]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [cls(**record) for record in records]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del objects
+    return size / count
+
+
+def read_latency(cls, number=200000):
+    """Return the time in nanoseconds of one attribute read."""
+    obj = cls(**RECORD)
+    return timeit.timeit('obj.city', globals={'obj': obj}, number=number) \
+        / number * 1e9
+
+
+if __name__ == '__main__':
+    for label, cls in (('dict-backed', Hotel), ('slotted', SlottedHotel)):
+        print(f'{label:>12}: {retained_bytes(cls):8.1f} bytes/instance, '
+              f'{read_latency(cls):6.1f} ns/read')
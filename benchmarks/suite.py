@@ -0,0 +1,339 @@
+"""Benchmark the hot paths of `Object`, `Model` and the validators.
+
+Run from the repository root:
+
+    python -m benchmarks.suite                    # run every case
+    python -m benchmarks.suite -k nested          # only the cases matching
+    python -m benchmarks.suite --save baseline    # save the timings
+    python -m benchmarks.suite --compare baseline --threshold 0.2
+
+Timings are saved to `benchmarks/baselines/<name>.json`. With `--compare`,
+the run fails (exit status 1) when a case is slower than its baseline by
+more than the threshold, 20% by default. Baselines are only comparable on
+the same machine and Python version, which are stored along with them.
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import platform
+import sys
+import timeit
+from rebase.core import Model, Object, TableLoader
+from rebase.validators import (AlnumValidator, BoolValidator,
+                               IntegerValidator, NestedValidator,
+                               RangeValidator, StringValidator)
+
+BASELINES = os.path.join(os.path.dirname(__file__), 'baselines')
+CASES = {}
+
+
+def case(name):
+    """Register a case: a function returning the callable to time."""
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+class Rate(Object):
+    def properties(self):
+        return {
+            'amount': 'price.amount',
+            'currency': 'price.currency',
+        }
+
+
+class Room(Model):
+    def properties(self):
+        return {
+            'id': 'id',
+            'name': 'name',
+            'beds': ('beds', int),
+            'rate': ('rate', Rate),
+        }
+
+    def rules(self):
+        return {
+            'name': [StringValidator(required=True)],
+            'beds': [RangeValidator(min=1, max=4)],
+        }
+
+
+class Hotel(Model):
+    def properties(self):
+        return {
+            'name': 'name',
+            'stars': ('rating.stars', int),
+            'city': 'location.city',
+            'country': 'location.country',
+            'code': 'location.codes.0',
+            'open': 'open',
+            'rooms': ('rooms', lambda x: [Room(**r) for r in x]),
+        }
+
+    def rules(self):
+        return {
+            'name': [StringValidator(required=True)],
+            'code': [AlnumValidator()],
+            'stars': [IntegerValidator(), RangeValidator(min=1, max=5)],
+            'open': [BoolValidator()],
+            'rooms': [NestedValidator()],
+        }
+
+
+class Flat(Model):
+    def properties(self):
+        return {
+            'name': 'name',
+            'stars': 'stars',
+            'city': 'city',
+            'country': 'country',
+            'open': 'open',
+        }
+
+
+FLAT = {
+    'name': 'Hotel Paris',
+    'stars': 4,
+    'city': 'Paris',
+    'country': 'France',
+    'open': True,
+}
+
+
+def hotel_record(rooms):
+    return {
+        'name': 'Hotel Paris',
+        'rating': {'stars': 4},
+        'location': {'city': 'Paris', 'country': 'France', 'codes': ['PAR1']},
+        'open': True,
+        'rooms': [{
+            'id': i,
+            'name': f'Room {i}',
+            'beds': 1 + i % 4,
+            'rate': {'price': {'amount': 100 + i, 'currency': 'EUR'}},
+        } for i in range(rooms)],
+    }
+
+
+@case('construct.flat')
+def construct_flat():
+    return lambda: Flat(**FLAT)
+
+
+@case('construct.nested')
+def construct_nested():
+    record = hotel_record(20)
+    return lambda: Hotel(**record)
+
+
+@case('construct.from_records')
+def construct_from_records():
+    records = [dict(FLAT) for _ in range(100)]
+    return lambda: Flat.from_records(records)
+
+
+@case('mapping.dotted_path')
+def mapping_dotted_path():
+    record = hotel_record(0)
+    return lambda: Hotel(**record)
+
+
+@case('attribute.read')
+def attribute_read():
+    hotel = Flat(**FLAT)
+    return lambda: hotel.city
+
+
+@case('attribute.write')
+def attribute_write():
+    hotel = Flat(**FLAT)
+
+    def write():
+        hotel.stars = 5
+    return write
+
+
+@case('attributes.nested')
+def attributes_nested():
+    hotel = Hotel(**hotel_record(20))
+    return lambda: hotel.attributes
+
+
+def validator_case(name, validator, value):
+    @case(f'validate.{name}')
+    def setup():
+        return lambda: validator.check(value)
+
+
+validator_case('bool', BoolValidator(), True)
+validator_case('integer', IntegerValidator(), 4)
+validator_case('string', StringValidator(), 'Paris')
+validator_case('alnum', AlnumValidator(), 'PAR1')
+validator_case('range', RangeValidator(min=1, max=5), 4)
+
+
+@case('validate.model')
+def validate_model():
+    hotel = Hotel(**hotel_record(0))
+    return hotel.validate
+
+
+@case('validate.nested_large')
+def validate_nested_large():
+    hotel = Hotel(**hotel_record(1000))
+    return hotel.validate
+
+
+class CompiledRoom(Room):
+    compile_rules = True
+
+
+class CompiledHotel(Hotel):
+    compile_rules = True
+
+    def properties(self):
+        return {
+            **super().properties(),
+            'rooms': ('rooms', lambda x: [CompiledRoom(**r) for r in x]),
+        }
+
+
+@case('validate.compiled')
+def validate_compiled():
+    hotel = CompiledHotel(**hotel_record(0))
+    return hotel.validate
+
+
+@case('validate.compiled_nested')
+def validate_compiled_nested_large():
+    hotel = CompiledHotel(**hotel_record(1000))
+    return hotel.validate
+
+
+@case('serialize.str')
+def serialize_str():
+    hotel = Hotel(**hotel_record(20))
+    return lambda: str(hotel)
+
+
+@case('serialize.to_json')
+def serialize_to_json():
+    hotel = Hotel(**hotel_record(20))
+    return hotel.to_json
+
+
+CSV = 'name,stars,city,country,open\n' + ''.join(
+    f'Hotel {i},{i % 5},Paris,France,true\n' for i in range(100))
+
+
+class TypedFlat(Model):
+    def properties(self):
+        return {
+            'name': 'name',
+            'stars': ('stars', int),
+            'city': 'city',
+            'country': 'country',
+            'open': ('open', bool),
+        }
+
+
+@case('tabular.dict_reader')
+def tabular_dict_reader():
+    return lambda: [TypedFlat(**r) for r in csv.DictReader(io.StringIO(CSV))]
+
+
+@case('tabular.loader')
+def tabular_loader():
+    loader = TableLoader(TypedFlat)
+    return lambda: list(loader.load(io.StringIO(CSV)))
+
+
+def measure(func, repeat=5, min_time=0.2):
+    """Return the best time in seconds of one call to `func`."""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(pattern=None, repeat=5):
+    """Time every case whose name contains `pattern`."""
+    return {
+        name: measure(setup(), repeat)
+        for name, setup in CASES.items()
+        if not pattern or pattern in name
+    }
+
+
+def compare(results, baseline, threshold):
+    """Return the cases slower than `baseline` by more than `threshold`."""
+    return {
+        name: seconds / baseline[name] - 1
+        for name, seconds in results.items()
+        if baseline.get(name) and seconds > baseline[name] * (1 + threshold)
+    }
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'node': platform.node(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.suite',
+        description='Benchmark the hot paths of rebase.')
+    parser.add_argument('-k', dest='pattern',
+                        help='only run the cases whose name contains this')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--save', metavar='NAME',
+                        help='save the timings as a baseline')
+    parser.add_argument('--compare', metavar='NAME',
+                        help='fail if slower than this baseline')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='the tolerated slowdown, 0.2 for 20%%')
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.compare:
+        with open(os.path.join(BASELINES, f'{args.compare}.json')) as f:
+            saved = json.load(f)
+        if saved['environment'] != environment():
+            print(f'warning: baseline recorded on {saved["environment"]}',
+                  file=sys.stderr)
+        baseline = saved['results']
+
+    results = run(args.pattern, args.repeat)
+    regressions = compare(results, baseline, args.threshold)
+    for name, seconds in results.items():
+        line = f'{name:<26} {seconds * 1e6:12.3f} us'
+        if name in baseline:
+            change = seconds / baseline[name] - 1
+            line += f' {change:+8.1%}'
+            if name in regressions:
+                line += '  REGRESSION'
+        print(line)
+
+    if args.save:
+        os.makedirs(BASELINES, exist_ok=True)
+        with open(os.path.join(BASELINES, f'{args.save}.json'), 'w') as f:
+            json.dump({'environment': environment(), 'results': results},
+                      f, indent=2, sort_keys=True)
+
+    if regressions:
+        print(f'{len(regressions)} case(s) slower than {args.compare} by more '
+              f'than {args.threshold:.0%}', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
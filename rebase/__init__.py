@@ -1 +1,3 @@
 name = "rebase"
+
+from rebase.core.profiling import stats
@@ -1,3 +1,17 @@
+from .path import Path, MISSING
+from .schema import Schema
 from .object import Object
+from .validation_result import ValidationResult
 from .validator import Validator
-from .model import Model
+from .async_validator import AsyncValidator
+from .model import Model, ValidationPass
+from .slotted import slotted
+from .model_batch import ModelBatch
+from .parallel import map_many, validate_many
+from .stream import iter_records, iter_validate, Progress
+from .encoder import Encoder, write_json
+from .binary import packb, unpackb
+from .dataset import Dataset
+from .tabular import TableLoader, ConversionError, read_csv, read_tsv
+from .identity import Pool
+from .selection import Selection, View, SequenceView
@@ -0,0 +1,68 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import asyncio
+from typing import Dict, Hashable
+from rebase.core import Validator, ValidationResult
+from rebase.core.validation_result import VALID
+
+
+class AsyncValidator(Validator):
+    """A validator whose check needs I/O, such as a lookup in a remote store.
+
+    Subclasses implement the coroutine `_acheck()` instead of `_check()`.
+    `Model.avalidate()` runs them concurrently; calling the synchronous
+    `check()` or `validate()` runs the coroutine in a new event loop, which
+    is only possible outside of a running loop.
+    """
+
+    __slots__ = ()
+
+    async def acheck(self, value, memo: Dict[Hashable, ValidationResult] = None) -> ValidationResult:
+        key = None
+        if memo is not None:
+            key = self.signature()
+            if key is not None and key in memo:
+                return memo[key]
+
+        result = await self._acheck(value, memo)
+
+        if key is not None:
+            memo[key] = result
+        return result
+
+    async def _acheck(self, value, memo: Dict[Hashable, ValidationResult] = None) -> ValidationResult:
+        """Return the result of the validation of `value`.
+
+        Args:
+            value (Any): the value to validate
+            memo (dict): see `Validator.check()`
+
+        Returns:
+            ValidationResult: the validity and error messages
+
+        """
+        result = VALID
+        for validator in self.dependencies():
+            if isinstance(validator, Validator):
+                result &= await validator.acheck(value, memo)
+            else:
+                result &= Validator.result(validator, value, memo)
+        return result
+
+    def _check(self, value, memo: Dict[Hashable, ValidationResult] = None) -> ValidationResult:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.acheck(value, memo))
+
+        raise RuntimeError(
+            f'{self.classname} is asynchronous; use `Model.avalidate()` or '
+            f'`await {self.classname}.acheck()` inside an event loop.')
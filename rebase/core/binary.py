@@ -0,0 +1,64 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+from typing import Any, Callable
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+
+def packb(value: Any, default: Callable[[Any], Any] = None) -> bytes:
+    """Encode `value` in the MessagePack format.
+
+    Requires the `msgpack` package, installed with the `msgpack` extra.
+    Values which cannot be encoded natively are converted by `default`
+    first.
+
+    Args:
+        value (Any): the value to encode
+        default (callable): converts the values which cannot be encoded
+
+    Returns:
+        bytes: the encoded value
+
+    Raises:
+        ImportError: If `msgpack` is not installed
+        TypeError: If a value cannot be encoded and `default` is not set
+        OverflowError: If an integer does not fit in 64 bits
+
+    """
+    return _msgpack().packb(value, default=default, use_bin_type=True)
+
+
+def unpackb(data: bytes) -> Any:
+    """Decode a value encoded by `packb()`.
+
+    Args:
+        data (bytes): the encoded value
+
+    Returns:
+        Any: the value, with arrays decoded as lists
+
+    Raises:
+        ImportError: If `msgpack` is not installed
+        ValueError: If the data is truncated or has trailing bytes
+
+    """
+    return _msgpack().unpackb(data, raw=False, strict_map_key=False)
+
+
+def _msgpack():
+    if msgpack is None:
+        raise ImportError(
+            'MessagePack encoding requires the `msgpack` package; install '
+            'it with `pip install rebase[msgpack]`.')
+    return msgpack
@@ -0,0 +1,289 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import mmap
+import os
+import re
+import sys
+from array import array
+from struct import Struct
+from typing import Any, Callable, Dict, Iterator, Union
+import simplejson as json
+from rebase.core import Object, Path
+from rebase.core.stream import _decode
+
+INDEX_HEADER = Struct('<4sBQQQ')
+INDEX_MAGIC = b'RBIX'
+INDEX_VERSION = 1
+_NON_BLANK = re.compile(rb'\S')
+CHUNK_SIZE = 1 << 20
+
+
+class Dataset(object):
+    """A JSON Lines file accessed like a sequence of models.
+
+    The file is memory-mapped and the offset of every line is indexed once,
+    so that `ds[i]` and `ds[a:b]` only decode and map the records actually
+    read. The index is persisted next to the file (`<path>.idx`) and reused
+    as long as the size and modification time of the file are unchanged.
+
+    ```python
+    with Dataset('hotels.jsonl', Hotel) as hotels:
+        hotel = hotels[123456]
+        for hotel in hotels.filter(where={'location.city': 'Paris'}):
+            ...
+    ```
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], model_class: type = Object,
+                 index_path: Union[str, os.PathLike] = None,
+                 persist_index: bool = True, **kwargs):
+        """Open the file and load or build its index.
+
+        Args:
+            path (str|PathLike): the JSON Lines file
+            model_class (type): the subclass of `rebase.core.Object` built
+            from each record
+            index_path (str|PathLike): where to persist the index,
+            `<path>.idx` by default
+            persist_index (bool): write the index when it had to be built;
+            failures to write it are ignored
+            **kwargs: arguments passed to the constructor of every model
+
+        """
+        self.path = os.fspath(path)
+        self.model_class = model_class
+        self.index_path = os.fspath(index_path or self.path + '.idx')
+        self._kwargs = kwargs
+        self._file = open(self.path, 'rb')
+        stat = os.fstat(self._file.fileno())
+        self._stamp = (stat.st_size, stat.st_mtime_ns)
+        self._mmap = mmap.mmap(
+            self._file.fileno(), 0, access=mmap.ACCESS_READ) \
+            if stat.st_size else b''
+
+        self._offsets = self._load_index()
+        if self._offsets is None:
+            self._offsets = self._build_index()
+            if persist_index:
+                try:
+                    self.save_index()
+                except OSError:
+                    pass
+        self._rows = range(len(self._offsets))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[Object, 'Dataset']:
+        """Return the model at a row, or a lazy view over a slice of rows."""
+        if isinstance(item, slice):
+            view = object.__new__(type(self))
+            view.__dict__.update(self.__dict__)
+            view._rows = self._rows[item]
+            return view
+        return self._build(self.record(item))
+
+    def __iter__(self) -> Iterator[Object]:
+        build = self._build
+        for row in self._rows:
+            yield build(self._decode(row))
+
+    def __enter__(self) -> 'Dataset':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Unmap and close the file, for this dataset and all its views.
+
+        Returns:
+            void
+
+        """
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._file.close()
+
+    def raw(self, row: int) -> bytes:
+        """Return the undecoded line of a row, without its line ending.
+
+        Args:
+            row (int): the row, negative to count from the end
+
+        Returns:
+            bytes: the line
+
+        Raises:
+            IndexError: If the row is out of range
+
+        """
+        return self._line(self._rows[row])
+
+    def record(self, row: int) -> Dict[str, Any]:
+        """Return the decoded record of a row, without building the model.
+
+        Args:
+            row (int): the row, negative to count from the end
+
+        Returns:
+            dict: the record
+
+        Raises:
+            IndexError: If the row is out of range
+            ValueError: If the line is not valid JSON
+
+        """
+        return self._decode(self._rows[row])
+
+    def filter(self, where: Dict[str, Any] = None,
+               contains: Union[bytes, str] = None,
+               predicate: Callable[[Dict[str, Any]], bool] = None) -> Iterator[Object]:
+        """Yield the models whose record matches every condition.
+
+        Rows whose raw line cannot match `contains` or `where` are skipped
+        without being decoded: the line must contain `contains` and, for
+        integers, booleans, None and plain ASCII strings of `where`, the
+        value as `json.dumps()` writes it.
+
+        Args:
+            where (dict): the values expected at source paths of the
+            record, e.g. `{'location.city': 'Paris'}`
+            contains (bytes|str): a substring of the raw line
+            predicate (callable): called with each decoded record
+
+        Returns:
+            Iterator: the matching models, in file order
+
+        """
+        where = [(Path.compile(k), v) for k, v in (where or {}).items()]
+        tokens = [_token(v) for _, v in where]
+        if contains is not None:
+            tokens.append(
+                contains.encode('utf-8') if isinstance(contains, str) else contains)
+        tokens = [t for t in tokens if t is not None]
+
+        build, line_of, decode = self._build, self._line, self._decode
+        for row in self._rows:
+            line = line_of(row)
+            if not all(t in line for t in tokens):
+                continue
+            record = decode(row, line)
+            if all(p.resolve(record, None) == v for p, v in where) \
+                    and (predicate is None or predicate(record)):
+                yield build(record)
+
+    def build_index(self):
+        """Scan the file again, e.g. after it was appended to.
+
+        Returns:
+            void
+
+        """
+        stat = os.fstat(self._file.fileno())
+        if stat.st_size != len(self._mmap):
+            if isinstance(self._mmap, mmap.mmap):
+                self._mmap.close()
+            self._mmap = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ) \
+                if stat.st_size else b''
+        self._stamp = (stat.st_size, stat.st_mtime_ns)
+        self._offsets = self._build_index()
+        self._rows = range(len(self._offsets))
+
+    def save_index(self):
+        """Write the index to `index_path`.
+
+        Returns:
+            void
+
+        Raises:
+            OSError: If the index cannot be written
+
+        """
+        offsets = self._offsets
+        if sys.byteorder == 'big':
+            offsets = array('Q', offsets)
+            offsets.byteswap()
+        tmp = self.index_path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(INDEX_HEADER.pack(
+                INDEX_MAGIC, INDEX_VERSION, *self._stamp, len(offsets)))
+            offsets.tofile(f)
+        os.replace(tmp, self.index_path)
+
+    def _build_index(self) -> array:
+        data = self._mmap
+        size = len(data)
+        offsets = array('Q')
+        append, find, non_blank = offsets.append, data.find, _NON_BLANK.search
+        start = 0
+        while start < size:
+            end = find(b'\n', start)
+            if end == -1:
+                end = size
+            if non_blank(data, start, end):
+                append(start)
+            start = end + 1
+        return offsets
+
+    def _load_index(self) -> Union[array, None]:
+        try:
+            with open(self.index_path, 'rb') as f:
+                header = f.read(INDEX_HEADER.size)
+                if len(header) != INDEX_HEADER.size:
+                    return None
+                magic, version, size, mtime, count = INDEX_HEADER.unpack(header)
+                if (magic, version) != (INDEX_MAGIC, INDEX_VERSION) \
+                        or (size, mtime) != self._stamp:
+                    return None
+                offsets = array('Q')
+                offsets.fromfile(f, count)
+        except (OSError, EOFError):
+            return None
+
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+        return offsets
+
+    def _line(self, row: int) -> bytes:
+        data = self._mmap
+        start = self._offsets[row]
+        end = data.find(b'\n', start)
+        return data[start:end if end != -1 else len(data)].rstrip(b'\r')
+
+    def _decode(self, row: int, line: bytes = None) -> Dict[str, Any]:
+        if line is None:
+            line = self._line(row)
+        try:
+            return json.loads(line)
+        except ValueError:
+            return _decode(line, self._line_number(row))
+
+    def _line_number(self, row: int) -> int:
+        """Return the line number of a row, blank lines included."""
+        data, end = self._mmap, self._offsets[row]
+        return 1 + sum(
+            data[start:min(start + CHUNK_SIZE, end)].count(b'\n')
+            for start in range(0, end, CHUNK_SIZE))
+
+    def _build(self, record: Dict[str, Any]) -> Object:
+        return self.model_class.from_records((record,), **self._kwargs)[0]
+
+
+def _token(value: Any) -> Union[bytes, None]:
+    """Return the bytes any JSON line holding `value` contains, if known."""
+    if value is None or type(value) in (bool, int):
+        return json.dumps(value).encode('ascii')
+    if type(value) is str and value.isascii() and value.isprintable() \
+            and not any(c in value for c in '"\\/'):
+        return json.dumps(value).encode('ascii')
+    return None
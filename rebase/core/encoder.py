@@ -0,0 +1,201 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import io
+import json as stdlib_json
+import simplejson
+from itertools import islice
+from typing import Any, BinaryIO, Callable, Iterable, TextIO, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+SEPARATORS = (',', ':')
+
+
+class Encoder(object):
+    """A JSON encoding function used by `Object.to_json()`.
+
+    Encoders are registered by name; `simplejson` and the standard library
+    `json` are always available, `orjson` when it is installed. Every encoder
+    produces compact JSON and calls `default` for the values it does not know,
+    such as nested objects, so that no intermediate dict is built.
+    """
+
+    _registry = {}
+
+    def __init__(self, dumps: Callable[[Any, Callable, bool], Union[str, bytes]],
+                 binary: bool = False, decimal: bool = False):
+        """Initialize the encoder.
+
+        Args:
+            dumps (callable): called with `(value, default, use_decimal)`
+            binary (bool): whether `dumps` returns bytes rather than str
+            decimal (bool): whether `dumps` encodes `Decimal` values exactly
+
+        """
+        self.dumps = dumps
+        self.binary = binary
+        self.decimal = decimal
+
+    def encode(self, value: Any, default: Callable[[Any], Any],
+               use_decimal: bool = False) -> Union[str, bytes]:
+        """Encode `value`, as returned by `dumps`.
+
+        Args:
+            value (Any): the value to encode
+            default (callable): converts the values unknown to the encoder
+            use_decimal (bool): encode `Decimal` values as exact numbers
+            instead of floats
+
+        Returns:
+            str|bytes: the JSON document
+
+        Raises:
+            ValueError: If `use_decimal` is set and the encoder does not
+            support it
+
+        """
+        if use_decimal and not self.decimal:
+            raise ValueError('This encoder cannot encode exact decimals; '
+                             'use the `simplejson` encoder.')
+        return self.dumps(value, default, use_decimal)
+
+    @classmethod
+    def register(cls, name: str, encoder: 'Encoder') -> 'Encoder':
+        """Make `encoder` available under `name`.
+
+        Args:
+            name (string): the name passed as `encoder=` or set as
+            `Object.json_encoder`
+            encoder (Encoder): the encoder
+
+        Returns:
+            Encoder: the encoder passed as argument
+
+        """
+        cls._registry[name] = encoder
+        return encoder
+
+    @classmethod
+    def get(cls, name: Union[str, 'Encoder'] = None,
+            use_decimal: bool = False) -> 'Encoder':
+        """Return the encoder registered under `name`.
+
+        Without a name, the fastest encoder installed is returned: `orjson`,
+        then `json`, or `simplejson` when `use_decimal` is set.
+
+        Args:
+            name (string|Encoder): the name of an encoder, or an encoder
+            use_decimal (bool): whether exact decimals are needed
+
+        Returns:
+            Encoder: the encoder
+
+        Raises:
+            ValueError: If no encoder is registered under `name`
+
+        """
+        if isinstance(name, Encoder):
+            return name
+        if name is None:
+            name = 'simplejson' if use_decimal \
+                else 'orjson' if 'orjson' in cls._registry else 'json'
+        encoder = cls._registry.get(name)
+        if encoder is None:
+            raise ValueError(f'Unknown JSON encoder `{name}`; use one of '
+                             f'{", ".join(sorted(cls._registry))}.')
+        return encoder
+
+
+Encoder.register('simplejson', Encoder(
+    lambda value, default, use_decimal: simplejson.dumps(
+        value, default=default, use_decimal=use_decimal,
+        separators=SEPARATORS),
+    decimal=True
+))
+Encoder.register('json', Encoder(
+    lambda value, default, use_decimal: stdlib_json.dumps(
+        value, default=default, separators=SEPARATORS)
+))
+if orjson is not None:
+    Encoder.register('orjson', Encoder(
+        lambda value, default, use_decimal: orjson.dumps(
+            value, default=default, option=orjson.OPT_NON_STR_KEYS),
+        binary=True
+    ))
+
+
+def write_json(objects: Iterable[Any], fp: Union[TextIO, BinaryIO],
+               lines: bool = False, chunk_size: int = 1000,
+               encoder: Union[str, Encoder] = None,
+               use_decimal: bool = False) -> int:
+    """Write many objects to a file object as a JSON array or JSON Lines.
+
+    Objects are encoded `chunk_size` at a time with a single call to the
+    encoder, and every chunk is written at once, so only one chunk is in
+    memory whatever the number of objects.
+
+    Args:
+        objects (Iterable): the `rebase.core.Object` instances, or a
+        generator of them
+        fp (file): a text or binary file object
+        lines (bool): write one object per line instead of a JSON array
+        chunk_size (int): the number of objects encoded at once
+        encoder (string|Encoder): the encoder, `Object.json_encoder` of the
+        first object by default, see `Encoder.get()`
+        use_decimal (bool): see `Encoder.encode()`
+
+    Returns:
+        int: the number of objects written
+
+    """
+    binary = not isinstance(fp, io.TextIOBase)
+    objects = iter(objects)
+    count = 0
+    first = True
+    while True:
+        chunk = list(islice(objects, chunk_size))
+        if not chunk:
+            break
+
+        head = chunk[0]
+        if first:
+            encoder = Encoder.get(encoder or head.json_encoder, use_decimal)
+        fields = [o._json_fields() for o in chunk]
+        if lines:
+            data = [
+                encoder.encode(f, head._json_default, use_decimal)
+                for f in fields
+            ]
+            data = (b'\n' if encoder.binary else '\n').join(data)
+            data += b'\n' if encoder.binary else '\n'
+        else:
+            data = encoder.encode(fields, head._json_default, use_decimal)
+            data = data[1:-1]
+            if first:
+                data = (b'[' if encoder.binary else '[') + data
+            else:
+                data = (b',' if encoder.binary else ',') + data
+
+        if binary and not encoder.binary:
+            data = data.encode('utf-8')
+        elif not binary and encoder.binary:
+            data = data.decode('utf-8')
+        fp.write(data)
+        count += len(chunk)
+        first = False
+
+    if not lines:
+        end = '[]' if first else ']'
+        fp.write(end.encode('utf-8') if binary else end)
+    return count
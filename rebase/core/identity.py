@@ -0,0 +1,173 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import hashlib
+import itertools
+import uuid
+import weakref
+from decimal import Decimal
+from typing import Any, Callable, Hashable
+import simplejson as json
+from rebase.core import profiling
+from rebase.core.lazy import Lazy
+from rebase.core.path import MISSING
+
+_counter = itertools.count(1)
+_SCALARS = (int, float, bool, complex, Decimal, bytes)
+
+
+def uuid_id(obj: Any) -> str:
+    """Return a random UUID, unique across processes."""
+    return str(uuid.uuid4())
+
+
+def counter_id(obj: Any) -> str:
+    """Return the next value of a counter, unique within the process."""
+    return str(next(_counter))
+
+
+def content_id(obj: Any) -> str:
+    """Return a hash of the class and the mapped attributes of `obj`.
+
+    Objects of the same class holding equal attributes get the same id, in
+    any process. The id is computed when first requested: later changes
+    of the object do not change it.
+    """
+    cls = type(obj)
+    data = json.dumps(
+        [f'{cls.__module__}.{cls.__qualname__}', obj._json_fields()],
+        default=obj._json_default, use_decimal=True, sort_keys=True,
+        separators=(',', ':'))
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+
+STRATEGIES = {
+    'uuid': uuid_id,
+    'counter': counter_id,
+    'content': content_id,
+}
+"""dict: The id strategies available by name to `Object.id_strategy`."""
+
+
+class Pool(object):
+    """Share one instance between structurally identical nested objects.
+
+    Classes setting `Object.interned` are interned when their parent builds
+    them from `properties()`: the first instance built with given mapped
+    attributes is kept in a pool, and every later equal instance is
+    replaced by it. Interned instances are shared and must be treated as
+    read-only; the pool only holds weak references to them.
+    """
+
+    _pools = {}
+
+    @classmethod
+    def intern(cls, obj: Any) -> Any:
+        """Return the pooled instance equal to `obj`, pooling `obj` if none.
+
+        Args:
+            obj (Object): the object to intern
+
+        Returns:
+            Object: the pooled instance, or `obj` itself if its attributes
+            are not hashable
+
+        """
+        try:
+            key = _freeze(obj._attributes)
+        except TypeError:
+            return obj
+
+        pool = cls._pools.get(type(obj))
+        if pool is None:
+            pool = cls._pools.setdefault(
+                type(obj), weakref.WeakValueDictionary())
+        pooled = pool.get(key)
+        if profiling.enabled:
+            profiling.count('intern', pooled is not None)
+        if pooled is None:
+            pool[key] = pooled = obj
+        return pooled
+
+    @classmethod
+    def size(cls, data_type: type = None) -> int:
+        """Return the number of pooled instances.
+
+        Args:
+            data_type (type): count the instances of this class only
+
+        Returns:
+            int: the number of instances
+
+        """
+        if data_type is not None:
+            return len(cls._pools.get(data_type, ()))
+        return sum(len(pool) for pool in list(cls._pools.values()))
+
+    @classmethod
+    def clear(cls):
+        """Drop every pooled instance.
+
+        Returns:
+            void
+
+        """
+        cls._pools.clear()
+
+
+def get_strategy(strategy: Any) -> Callable[[Any], str]:
+    """Return the id function of a strategy name or callable.
+
+    Raises:
+        ValueError: If the strategy name is unknown
+
+    """
+    if callable(strategy):
+        return strategy
+    try:
+        return STRATEGIES[strategy]
+    except KeyError:
+        raise ValueError(
+            f'Unknown id strategy `{strategy}`; use one of '
+            f'{", ".join(STRATEGIES)} or a callable.') from None
+
+
+def _freeze(value: Any) -> Hashable:
+    """Return a hashable key equal for structurally equal values.
+
+    Scalars are tagged with their type so that `1`, `1.0` and `True` do not
+    collide. Interned objects are keyed by identity, as equal ones are
+    already shared.
+
+    Raises:
+        TypeError: If the value holds something unhashable
+
+    """
+    cls = type(value)
+    if cls is str or value is None:
+        return value
+    if cls in _SCALARS:
+        return cls, value
+    if cls is dict:
+        return dict, tuple((k, _freeze(v)) for k, v in value.items())
+    if cls in (list, tuple):
+        return cls, tuple(_freeze(v) for v in value)
+    if cls in (set, frozenset):
+        return frozenset, frozenset(_freeze(v) for v in value)
+    if cls is Lazy:
+        if value.value is MISSING:
+            return Lazy, value.data_type, _freeze(value.data)
+        return _freeze(value.value)
+    if hasattr(cls, 'interned'):
+        if cls.interned:
+            return cls, id(value)
+        return cls, _freeze(value._attributes)
+    hash(value)
+    return cls, value
@@ -0,0 +1,55 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+from typing import Any, Dict
+from rebase.core.path import MISSING
+
+
+class Lazy(object):
+    """A nested object which is only built the first time it is accessed.
+
+    It is stored in place of the value of an `Object`-typed property when the
+    parent class sets `Object.lazy_nested`.
+    """
+
+    __slots__ = ('data_type', 'data', 'value')
+
+    def __init__(self, data_type: type, data: Dict[str, Any]):
+        """Initialize the placeholder.
+
+        Args:
+            data_type (type): the subclass of `rebase.core.Object` to build
+            data (dict): the keyword arguments to build it with
+
+        """
+        self.data_type = data_type
+        self.data = data
+        self.value = MISSING
+
+    def __reduce__(self):
+        return Lazy, (self.data_type, self.data)
+
+    def __repr__(self) -> str:
+        return f'Lazy({self.data_type.__name__}, {self.data!r})'
+
+    def materialize(self) -> Any:
+        """Build the nested object once and return it.
+
+        Returns:
+            Any: the object, or the data itself if it could not be built,
+            the same way `Object._enforce_data_type()` does
+
+        """
+        if self.value is MISSING:
+            try:
+                self.value = self.data_type(**self.data)._interned()
+            except TypeError:
+                self.value = self.data
+        return self.value
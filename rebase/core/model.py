@@ -4,20 +4,158 @@
 # License: Apache 2.0
 # Source: https://github.com/trivago/rebase
 # Version: 1.2.2
-# Python Version: 3.6
+# Python Version: 3.7
 # Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
 """
 
-from typing import Any, Dict, List
-from rebase.core import Object, Validator
+import asyncio
+import itertools
+from contextvars import ContextVar
+from typing import Any, Dict, Hashable, List, Tuple, Union
+from rebase.core import (AsyncValidator, Object, Schema, ValidationResult,
+                         Validator, profiling, rule_compiler)
+from rebase.core.selection import Selection
+from rebase.core.validator import ErrorBudget, _budget
+
+_semaphore = ContextVar('rebase_avalidate_semaphore', default=None)
+_pass = ContextVar('rebase_validation_pass', default=None)
+_validating = ContextVar('rebase_avalidate_model', default=None)
+_versions = itertools.count(1)
+
+
+class ValidationPass(object):
+    """The models already validated, or being validated, by one top-level
+    `Model.validate()` or `Model.avalidate()` call.
+
+    Each distinct model is validated once per pass: nested validators
+    reaching it again, through another list or a reference cycle, reuse
+    its result instead of validating it again. In an asynchronous pass, a
+    model being validated by another task is awaited, unless that task is
+    itself waiting for the model asking, which is a reference cycle.
+    """
+
+    __slots__ = ('results', 'active', 'depth', 'pending', 'waits')
+
+    max_depth = 32
+    """int: The nesting depth from which nested models are collected by an
+    iterative walk and validated deepest first, instead of recursively."""
+
+    def __init__(self):
+        self.results = {}
+        self.active = set()
+        self.depth = 0
+        self.pending = {}
+        self.waits = {}
+
+    def wait(self, waiter: int, key: int):
+        """Record that the model `waiter` awaits the validation of `key`."""
+        self.waits.setdefault(waiter, []).append(key)
+
+    def done(self, waiter: int, key: int):
+        """Record that the model `waiter` no longer awaits `key`."""
+        keys = self.waits.get(waiter)
+        if keys:
+            keys.remove(key)
+
+    def reaches(self, key: int, target: int) -> bool:
+        """Return whether the validation of `key` waits, however
+        indirectly, for the validation of `target`."""
+        seen = {key}
+        stack = [key]
+        while stack:
+            for waited in self.waits.get(stack.pop(), ()):
+                if waited == target:
+                    return True
+                if waited not in seen:
+                    seen.add(waited)
+                    stack.append(waited)
+        return False
 
 
 class Model(Object):
+    __slots__ = ('_errors', '_context', '_version', '_changes', '_results')
+
+    dynamic_rules = False
+    """bool: Opt out of sharing the validators of `rules()` between instances.
+
+    Set this to True in subclasses whose `rules()` depends on the instance.
+    """
+
+    _rules_cache = {}
+    _plan_cache = {}
+    _nested_cache = {}
+    _compiled_cache = {}
+
+    incremental_validation = False
+    """bool: Only re-run the rules of attributes changed since `validate()`.
+
+    The result of each attribute is cached and reused as long as the
+    attribute is not assigned and the models it holds (as checked by
+    `NestedValidator`) do not change. In-place changes such as
+    `model.rooms.append()` are not detected: assign the attribute again.
+    """
+
+    compile_rules = False
+    """bool: Validate with a function generated once for the class.
+
+    The checks of the built-in validators, and of validators implementing
+    `Validator.inline()`, are compiled into straight-line code; other
+    validators are called as usual. The result and the error messages are
+    the same as without compiling. The compiled function is only used when
+    validating every attribute with every message, without profiling or
+    `incremental_validation`, and when `rules()` is shared by the class.
+    """
+
     def __init__(self, context=None, **attributes):
-        self._errors = {}
-        self._context = context
+        setattr_ = object.__setattr__
+        setattr_(self, '_errors', {})
+        setattr_(self, '_context', context)
+        setattr_(self, '_version', next(_versions))
+        setattr_(self, '_changes', None)
+        setattr_(self, '_results', None)
         super().__init__(**attributes)
 
+    def _init_record(self, raw, schema=None, context=None, **kwargs):
+        raw = {**kwargs, **raw}
+        # the constructor takes it as the context, not as an attribute
+        context = raw.pop('context', context)
+        self._init_raw(raw, schema, context)
+
+    def _init_raw(self, raw, schema=None, context=None):
+        object.__setattr__(self, '_errors', {})
+        object.__setattr__(self, '_context', context)
+        object.__setattr__(self, '_version', next(_versions))
+        object.__setattr__(self, '_changes', None)
+        object.__setattr__(self, '_results', None)
+        super()._init_raw(raw, schema)
+
+    @classmethod
+    def _can_init_record(cls) -> bool:
+        return cls.__init__ is Model.__init__
+
+    @classmethod
+    def _from_raw(cls, raw):
+        if 'context' in raw:
+            # the constructor takes it as the context, not as an attribute
+            return cls(**raw)
+        return super()._from_raw(raw)
+
+    def _get_state(self) -> Dict[str, Any]:
+        state = super()._get_state()
+        if self._context is not None:
+            state['_context'] = self._context
+        if self._errors:
+            state['_errors'] = self._errors
+        return state
+
+    def _init_state(self, values, state):
+        object.__setattr__(self, '_errors', state.get('_errors', {}))
+        object.__setattr__(self, '_context', state.get('_context'))
+        object.__setattr__(self, '_version', next(_versions))
+        object.__setattr__(self, '_changes', None)
+        object.__setattr__(self, '_results', None)
+        super()._init_state(values, state)
+
     def _debug(self) -> Dict[str, Any]:
         return {
             **super()._debug(),
@@ -28,16 +166,82 @@ class Model(Object):
         }
 
     def _properties(self) -> List[str]:
-        return [*super()._properties(), '_errors', '_context']
+        return [*super()._properties(), '_errors', '_context', '_version',
+                '_changes', '_results']
+
+    def _changed(self, attr_name: str):
+        super()._changed(attr_name)
+        object.__setattr__(self, '_version', next(_versions))
+        if self._changes is None:
+            object.__setattr__(self, '_changes', {attr_name})
+        else:
+            self._changes.add(attr_name)
+
+    def _revision(self, seen: set = None) -> Tuple[int, ...]:
+        """Return a key which changes whenever this model or a nested model
+        is assigned an attribute, or a nested model is replaced.
+
+        Versions are drawn from one counter for every model, so that a
+        version identifies both a model and its state: the key of another
+        graph of models cannot be equal.
+
+        Args:
+            seen (set): the ids of the models already walked
+
+        Returns:
+            tuple: the versions of the models, in walk order
+
+        """
+        seen = seen if seen is not None else set()
+        seen.add(id(self))
+        revision = []
+        stack = [self]
+        while stack:
+            model = stack.pop()
+            revision.append(model._version)
+            for value in model._attributes.values():
+                for child in _models(value):
+                    if id(child) not in seen:
+                        seen.add(id(child))
+                        stack.append(child)
+        return tuple(revision)
+
+    @staticmethod
+    def _nested_revision(value: Any, seen: set) -> Tuple[int, ...]:
+        revision = ()
+        for child in _models(value):
+            if id(child) not in seen:
+                revision += child._revision(seen)
+        return revision
 
     @property
     def attributes(self) -> Dict[str, Any]:
         context_attributes = self.scenarios().get(self._context)
-        return super().attributes if not context_attributes else {
-            k: v
-            for k, v in super().attributes.items()
-            if context_attributes and k in context_attributes
-        }
+        if not context_attributes:
+            return super().attributes
+
+        cache = self._cache
+        key = ('context', self._context)
+        if cache and key in cache:
+            return cache[key]
+
+        if Selection.get(tuple(context_attributes)) is not None:
+            attributes = self.get(*context_attributes)
+        else:
+            attributes = {
+                k: v
+                for k, v in super().attributes.items()
+                if k in context_attributes
+            }
+        if cache is not None:
+            cache[key] = attributes
+        return attributes
+
+    def _json_fields(self) -> Dict[str, Any]:
+        if type(self).attributes is not Model.attributes \
+                or self.scenarios().get(self._context):
+            return self.attributes
+        return self._stored_fields()
 
     def rules(self) -> Dict[str, List[Validator]]:
         return {}
@@ -45,27 +249,437 @@ class Model(Object):
     def scenarios(self) -> Dict[str, List[str]]:
         return {}
 
-    def validate(self, attribute = None) -> bool:
+    def _get_rules(self) -> Dict[str, List[Validator]]:
+        """Return `rules()`, built once per class when it is safe to share.
+
+        Rules are shared by every instance (and thread) unless the class sets
+        `Model.dynamic_rules` or one of the validators is stateful, i.e.
+        overrides `Validator.validate()` instead of `Validator._check()`.
+
+        Returns:
+            dict: the validators of each attribute
+
+        """
+        if self.dynamic_rules:
+            return self.rules()
+
+        cls = type(self)
+        key = (cls, cls.rules)
+        rules = Model._rules_cache.get(key)
+        if profiling.enabled:
+            profiling.count('rules', rules is not None)
+        if rules is None:
+            rules = self.rules()
+            if len(Model._rules_cache) < Schema.max_size and all(
+                    isinstance(rule, Validator) and rule.is_stateless()
+                    for ruleset in rules.values() for rule in ruleset):
+                Model._rules_cache[key] = rules
+        return rules
+
+    def validate(self, attribute=None, max_errors: int = None,
+                 messages: bool = True) -> bool:
+        """Validate the model against its `rules()`.
+
+        By default every rule of every attribute runs and every error message
+        is kept. With `max_errors`, the validation stops once that many rules
+        have failed (`max_errors=1` is fail-fast), reporting at most one
+        error per attribute; with `messages=False` it stops at the first
+        failure without formatting any message. In both modes the rules run
+        cheapest first (see `Validator.cost`), dependencies stop at their
+        first failure, and nested models validated by `NestedValidator`
+        share the same budget; `incremental_validation` is bypassed.
+
+        Nested models are validated once per call, even when they are
+        reached several times (a model shared by several lists, or a
+        reference cycle, which is not followed again). Beyond
+        `ValidationPass.max_depth` levels of nesting, the models below are
+        collected by walking the graph iteratively and validated deepest
+        first, so that deeply nested documents do not hit the recursion
+        limit.
+
+        Args:
+            attribute (string): the only attribute to validate, if any
+            max_errors (int): the number of failed rules to stop after
+            messages (bool): whether to format error messages
+
+        Returns:
+            bool: whether the model is valid
+
+        """
+        state = _pass.get()
+        if state is None:
+            token = _pass.set(ValidationPass())
+            try:
+                return Model.validate(self, attribute, max_errors, messages)
+            finally:
+                _pass.reset(token)
+
+        key = id(self)
+        if not attribute:
+            valid = state.results.get(key)
+            if valid is not None:
+                return valid
+            if key in state.active:
+                # a reference cycle: the model is being validated already
+                return True
+        state.active.add(key)
+        state.depth += 1
+        try:
+            if state.depth > state.max_depth and not attribute:
+                for model in self._nested_order(state):
+                    model.validate()
+            valid = self._validate(attribute, max_errors, messages)
+        finally:
+            state.active.discard(key)
+            state.depth -= 1
+        if not attribute:
+            state.results[key] = valid
+        return valid
+
+    def _nested_order(self, state: ValidationPass) -> List['Model']:
+        """Return the distinct models nested in this one, deepest first.
+
+        The graph is walked with an explicit stack, through the values of
+        the validators which declare `Validator.nested_models()`. Models
+        without nested models are left out: validating them from their
+        parent does not recurse any deeper.
+
+        Args:
+            state (ValidationPass): the models already validated, skipped
+
+        Returns:
+            list: the models, each after the models it holds
+
+        """
+        order = []
+        seen = {id(self)}
+        stack = [(self, iter(self._nested_models()))]
+        results = state.results
+        while stack:
+            model, children = stack[-1]
+            for child in children:
+                key = id(child)
+                if key not in seen and key not in results:
+                    seen.add(key)
+                    models = child._nested_models()
+                    if models:
+                        stack.append((child, iter(models)))
+                        break
+            else:
+                stack.pop()
+                if model is not self:
+                    order.append(model)
+        return order
+
+    def _nested_models(self) -> List['Model']:
+        """Return the models the rules of this model validate."""
+        models = []
+        for attr, rule in self._nested_rules():
+            models.extend(rule.nested_models(getattr(self, attr, None)))
+        return models
+
+    def _nested_rules(self) -> List[Tuple[str, Validator]]:
+        """Return the `(attribute, rule)` pairs of the rules which override
+        `Validator.nested_models()`."""
+        cls = type(self)
+        key = (cls, cls.rules)
+        if not self.dynamic_rules:
+            nested = Model._nested_cache.get(key)
+            if nested is not None:
+                return nested
+
+        rules = self._get_rules()
+        nested = [
+            (attr, rule) for attr, ruleset in rules.items() for rule in ruleset
+            if isinstance(rule, Validator)
+            and type(rule).nested_models is not Validator.nested_models
+        ]
+        if not self.dynamic_rules and Model._rules_cache.get(key) is rules:
+            Model._nested_cache[key] = nested
+        return nested
+
+    def _validate(self, attribute, max_errors, messages) -> bool:
+        budget = Validator.budget()
+        if max_errors is not None or not messages:
+            token = _budget.set(ErrorBudget(max_errors, messages))
+            try:
+                return self._validate_budget(attribute, _budget.get())
+            finally:
+                _budget.reset(token)
+        elif budget is not None:
+            return self._validate_budget(attribute, budget)
+
+        incremental = self.incremental_validation
+        if self.compile_rules and not attribute and not incremental \
+                and not profiling.enabled:
+            compiled = self._get_compiled()
+            if compiled is not None and compiled.schema in (None, self._schema):
+                is_valid = compiled.function(self)
+                object.__setattr__(self, '_changes', None)
+                return is_valid
+
         is_valid = True
         if not attribute:
             self._errors.clear()
         else:
             self._errors.update({attribute: []})
 
-        for attr, ruleset in self.rules().items():
+        if incremental and self._results is None:
+            object.__setattr__(self, '_results', {})
+        changes = self._changes or ()
+
+        for attr, ruleset in self._get_rules().items():
             if attribute and attr != attribute:
                 continue
+
+            if incremental:
+                revision = Model._nested_revision(
+                    self._attributes.get(attr), {id(self)})
+                result = self._results.get(attr)
+                hit = bool(result) and attr not in changes \
+                    and result[0] == revision
+                if profiling.enabled:
+                    profiling.count('incremental', hit)
+                if hit:
+                    is_valid &= result[1]
+                    self.add_errors(attr, result[2])
+                    continue
+                attr_valid = True
+
+            value = getattr(self, attr, None)
+            memo = {}
             for rule in ruleset:
-                value = getattr(self, attr, None)
                 if rule.required and value is None:
                     self.add_errors(attr, [f'`{attr}` is a required field.'])
                     is_valid = False
+                    if incremental:
+                        attr_valid = False
                     continue
-                is_valid &= rule.validate(value)
-                self.add_errors(attr, rule.errors)
+                result = self._check_rule(attr, rule, value, memo)
+                is_valid &= result.valid
+                self.add_errors(attr, list(result.errors))
+                if incremental:
+                    attr_valid &= result.valid
+
+            if incremental:
+                self._results[attr] = (
+                    revision, attr_valid, list(self._errors.get(attr, [])))
+
+        if attribute:
+            if self._changes:
+                self._changes.discard(attribute)
+        else:
+            object.__setattr__(self, '_changes', None)
+
+        return is_valid
+
+    def _get_compiled(self) -> Union[rule_compiler.CompiledRules, None]:
+        """Return the validation function compiled for `rules()`, or None if
+        the rules are not shared or the class changes how they are run."""
+        cls = type(self)
+        key = (cls, cls.rules)
+        compiled = Model._compiled_cache.get(key)
+        if compiled is not None or self.dynamic_rules:
+            return compiled or None
+
+        rules = self._get_rules()
+        compiled = False
+        if Model._rules_cache.get(key) is rules \
+                and cls.add_errors is Model.add_errors \
+                and cls._check_rule is Model._check_rule:
+            compiled = rule_compiler.compile_rules(self, rules)
+        Model._compiled_cache[key] = compiled
+        return compiled or None
+
+    def _validate_budget(self, attribute, budget: ErrorBudget) -> bool:
+        if not attribute:
+            self._errors.clear()
+        else:
+            self._errors.update({attribute: []})
+
+        is_valid = True
+        failed = set()
+        values = {}
+        memos = {}
+        for attr, rule in self._get_plan():
+            if budget.exhausted:
+                break
+            if (attribute and attr != attribute) or attr in failed:
+                continue
+
+            if attr in values:
+                value = values[attr]
+            else:
+                value = values[attr] = getattr(self, attr, None)
+            remaining = budget.remaining
+            if rule.required and value is None:
+                result = ValidationResult(False, (
+                    f'`{attr}` is a required field.',) if budget.messages else ())
+            else:
+                result = self._check_rule(
+                    attr, rule, value, memos.setdefault(attr, {}))
+
+            if not result.valid:
+                failed.add(attr)
+                is_valid = False
+                self.add_errors(attr, list(result.errors))
+                # nested models spend the budget for their own failures
+                if budget.remaining == remaining:
+                    budget.spend()
 
         return is_valid
 
+    def _check_rule(self, attr: str, rule: Any, value: Any,
+                    memo: Dict[Hashable, ValidationResult]) -> ValidationResult:
+        """Run one rule, timing it per validator class and per attribute
+        when `rebase.core.profiling` is enabled."""
+        if not profiling.enabled:
+            return Validator.result(rule, value, memo)
+
+        started = profiling.clock()
+        result = Validator.result(rule, value, memo)
+        elapsed = profiling.clock() - started
+        profiling.record('validator', type(rule).__name__, elapsed)
+        profiling.record('rule', f'{self.classname}.{attr}', elapsed)
+        return result
+
+    def _get_plan(self) -> List[Tuple[str, Validator]]:
+        """Return the `(attribute, rule)` pairs of `rules()`, cheapest first."""
+        rules = self._get_rules()
+        cls = type(self)
+        cached = not self.dynamic_rules \
+            and Model._rules_cache.get((cls, cls.rules)) is rules
+        if cached:
+            plan = Model._plan_cache.get(id(rules))
+            if plan is not None:
+                return plan
+
+        plan = sorted(
+            ((attr, rule) for attr, ruleset in rules.items() for rule in ruleset),
+            key=lambda pair: pair[1].cost
+            if isinstance(pair[1], Validator) else Validator.cost)
+        if cached:
+            Model._plan_cache[id(rules)] = plan
+        return plan
+
+    async def avalidate(self, attribute=None, concurrency: int = None) -> bool:
+        """Validate the model from a coroutine.
+
+        The rules of every attribute run concurrently, and so do the nested
+        models checked by `NestedValidator`. Synchronous validators run
+        inline; `AsyncValidator` checks are bounded by a semaphore shared by
+        the whole tree of models. The result of `incremental_validation` is
+        neither used nor updated. As with `validate()`, nested models are
+        validated once per call and reference cycles are not followed again.
+
+        Args:
+            attribute (string): the only attribute to validate, if any
+            concurrency (int): the maximum number of `AsyncValidator` checks
+            running at once, 64 by default or inherited from the parent model
+
+        Returns:
+            bool: whether the model is valid
+
+        """
+        state = _pass.get()
+        if state is None:
+            token = _pass.set(ValidationPass())
+            try:
+                return await Model.avalidate(self, attribute, concurrency)
+            finally:
+                _pass.reset(token)
+        if attribute:
+            return await self._avalidate(attribute, concurrency)
+
+        key = id(self)
+        valid = state.results.get(key)
+        if valid is not None:
+            return valid
+        parent = _validating.get()
+        future = state.pending.get(key)
+        if future is not None:
+            if key == parent or state.reaches(key, parent):
+                # a reference cycle: the model is waiting for this one
+                return True
+            state.wait(parent, key)
+            try:
+                return await asyncio.shield(future)
+            finally:
+                state.done(parent, key)
+
+        future = state.pending[key] = asyncio.get_event_loop().create_future()
+        if parent is not None:
+            state.wait(parent, key)
+        token = _validating.set(key)
+        try:
+            valid = await self._avalidate(None, concurrency)
+        except BaseException as e:
+            future.set_exception(e)
+            # only awaited by the models sharing this one, if any
+            future.exception()
+            raise
+        finally:
+            _validating.reset(token)
+            del state.pending[key]
+            state.waits.pop(key, None)
+            if parent is not None:
+                state.done(parent, key)
+        state.results[key] = valid
+        future.set_result(valid)
+        return valid
+
+    async def _avalidate(self, attribute, concurrency: int) -> bool:
+        token = None
+        if concurrency is not None or _semaphore.get() is None:
+            token = _semaphore.set(asyncio.Semaphore(concurrency or 64))
+
+        try:
+            if not attribute:
+                self._errors.clear()
+            else:
+                self._errors.update({attribute: []})
+
+            is_valid = True
+            entries = []
+            pending = []
+            for attr, ruleset in self._get_rules().items():
+                if attribute and attr != attribute:
+                    continue
+
+                value = getattr(self, attr, None)
+                memo = {}
+                for rule in ruleset:
+                    if rule.required and value is None:
+                        entries.append((attr, ValidationResult(
+                            False, (f'`{attr}` is a required field.',))))
+                    elif isinstance(rule, AsyncValidator):
+                        entries.append((attr, len(pending)))
+                        pending.append(self._bounded(rule.acheck(value, memo)))
+                    elif isinstance(rule, Validator) \
+                            and type(rule).acheck is not Validator.acheck:
+                        entries.append((attr, len(pending)))
+                        pending.append(rule.acheck(value, memo))
+                    else:
+                        entries.append(
+                            (attr, Validator.result(rule, value, memo)))
+
+            results = await asyncio.gather(*pending) if pending else []
+            for attr, result in entries:
+                if isinstance(result, int):
+                    result = results[result]
+                is_valid &= result.valid
+                self.add_errors(attr, list(result.errors))
+
+            return is_valid
+        finally:
+            if token is not None:
+                _semaphore.reset(token)
+
+    @staticmethod
+    async def _bounded(coroutine):
+        async with _semaphore.get():
+            return await coroutine
+
     def add_errors(self, attribute, messages):
         attribute_errors = self._errors.get(attribute, [])
         self._errors[attribute] = attribute_errors + messages
@@ -73,8 +687,65 @@ class Model(Object):
     def get_errors(self, attribute=None) -> Dict[str, List[str]]:
         return self._errors.get(attribute) if attribute else self._errors
 
+    def get_error_paths(self) -> Dict[str, List[str]]:
+        """Return the error messages of this model and of its nested models
+        by full location, such as `rooms[3].rates[1].price`.
+
+        Models in lists and tuples are located by index, in dicts by key
+        (`rooms.deluxe.price`) and in sets by id. A model reached through
+        a reference cycle is not reported again.
+
+        Returns:
+            dict: the messages of each location, in document order
+
+        """
+        paths = {}
+        stack = [('', self, frozenset((id(self),)))]
+        while stack:
+            prefix, model, ancestors = stack.pop()
+            nested = []
+            for attr, errors in model._errors.items():
+                path = prefix + attr
+                messages = [e for e in errors if isinstance(e, str)]
+                if messages:
+                    paths.setdefault(path, []).extend(messages)
+                if len(messages) == len(errors):
+                    continue
+                for suffix, child in _locate(getattr(model, attr, None)):
+                    if id(child) not in ancestors \
+                            and any(child._errors.values()):
+                        nested.append((f'{path}{suffix}.', child,
+                                       ancestors | {id(child)}))
+            stack.extend(reversed(nested))
+        return paths
+
     def get_context(self):
         return self._context
 
     def set_context(self, value):
         self._context = value
+
+
+def _locate(value: Any) -> List[Tuple[str, Model]]:
+    """Return the models held by an attribute, with their location."""
+    if isinstance(value, Model):
+        return [('', value)]
+    if isinstance(value, dict):
+        return [(f'.{k}', v) for k, v in value.items() if isinstance(v, Model)]
+    if isinstance(value, (list, tuple)):
+        return [(f'[{i}]', v) for i, v in enumerate(value)
+                if isinstance(v, Model)]
+    if isinstance(value, (set, frozenset)):
+        return [(f'[{v.get_id()}]', v) for v in value if isinstance(v, Model)]
+    return []
+
+
+def _models(value: Any) -> List[Model]:
+    """Return the models an attribute holds, directly or in a collection."""
+    if isinstance(value, Model):
+        return [value]
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple, set)):
+        return []
+    return [x for x in value if isinstance(x, Model)]
@@ -0,0 +1,175 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+from rebase.core import Model
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+INTEGER_TYPECODES = frozenset('bBhHiIlLqQ')
+
+
+class ModelBatch(object):
+    """A columnar container of many models of the same class.
+
+    Every attribute is stored as one column: a NumPy array (or a Python
+    `array` when NumPy is not installed) when all the values are plain
+    integers or booleans, a list otherwise. `validate()` applies the
+    `rules()` of the model column by column through
+    `Validator.validate_column()`, so validators such as `RangeValidator`
+    check a whole column with a single vectorized comparison.
+    """
+
+    def __init__(self, models: Iterable[Model],
+                 columns: Dict[str, Sequence] = None):
+        """Initialize the batch.
+
+        Args:
+            models (Iterable): the models, all of the same class
+            columns (dict): columns already extracted from the models, by
+            attribute name, e.g. by `rebase.core.TableLoader`
+
+        """
+        self._models = list(models)
+        self._columns = dict(columns or {})
+        self._errors = {}
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __getitem__(self, row: int) -> Model:
+        return self._models[row]
+
+    def __iter__(self) -> Iterator[Model]:
+        return iter(self._models)
+
+    @classmethod
+    def from_records(cls, model_class: type, records: Iterable[Dict[str, Any]],
+                     **kwargs) -> 'ModelBatch':
+        """Build a batch of `model_class` from raw records.
+
+        Args:
+            model_class (type): a subclass of `rebase.core.Model`
+            records (Iterable): the dicts to build the models from
+            **kwargs: arguments passed to the constructor of every model
+
+        Returns:
+            ModelBatch: the batch
+
+        """
+        return cls(model_class.from_records(records, **kwargs))
+
+    def column(self, attribute: str) -> Sequence:
+        """Return the values of an attribute for every model of the batch.
+
+        Args:
+            attribute (string): the attribute name
+
+        Returns:
+            Sequence: the column, in the order of the models
+
+        """
+        column = self._columns.get(attribute)
+        if column is None:
+            column = self._columns[attribute] = self.to_column(
+                [getattr(m, attribute, None) for m in self._models])
+        return column
+
+    def validate(self) -> bool:
+        """Validate every model of the batch against its `rules()`.
+
+        Returns:
+            bool: whether all the models are valid
+
+        """
+        self._errors = {}
+        if not self._models:
+            return True
+
+        for attr, ruleset in self._models[0].rules().items():
+            column = self.column(attr)
+            for rule in ruleset:
+                rows, values = None, column
+                if rule.required and not self.is_integer(column) \
+                        and not self.is_bool(column):
+                    rows = [i for i, v in enumerate(column) if v is not None]
+                    if len(rows) < len(column):
+                        missing = set(range(len(column))).difference(rows)
+                        for row in sorted(missing):
+                            self._add_errors(
+                                row, attr, [f'`{attr}` is a required field.'])
+                        values = [column[i] for i in rows]
+                    else:
+                        rows = None
+
+                for row, messages in rule.validate_column(values).items():
+                    self._add_errors(
+                        row if rows is None else rows[row], attr, messages)
+
+        return not self._errors
+
+    def get_errors(self, row: int = None) -> Dict[int, Dict[str, List[str]]]:
+        """Return the errors of the last validation.
+
+        Args:
+            row (int): the index of a model, to get its errors only
+
+        Returns:
+            dict: the errors of each invalid model keyed by row index, or the
+            errors of the given row keyed by attribute
+
+        """
+        return self._errors.get(row, {}) if row is not None else self._errors
+
+    def _add_errors(self, row: int, attribute: str, messages: List[str]):
+        self._errors.setdefault(row, {}).setdefault(
+            attribute, []).extend(messages)
+
+    @staticmethod
+    def to_column(values: List[Any]) -> Sequence:
+        """Convert a list of values to the most compact column type.
+
+        Args:
+            values (list): the values
+
+        Returns:
+            Sequence: an integer or boolean array if every value is exactly
+            of that type, the list itself otherwise
+
+        """
+        types = set(map(type, values))
+        if types == {int}:
+            try:
+                if numpy is not None:
+                    return numpy.array(values, dtype=numpy.int64)
+                return array('q', values)
+            except OverflowError:
+                return values
+        elif types == {bool} and numpy is not None:
+            return numpy.array(values, dtype=numpy.bool_)
+        return values
+
+    @staticmethod
+    def is_integer(values: Sequence) -> bool:
+        """Return whether the column can only hold integers."""
+        if isinstance(values, array):
+            return values.typecode in INTEGER_TYPECODES
+        return numpy is not None and isinstance(values, numpy.ndarray) \
+            and values.dtype.kind in 'iu'
+
+    @staticmethod
+    def is_bool(values: Sequence) -> bool:
+        """Return whether the column can only hold booleans."""
+        return numpy is not None and isinstance(values, numpy.ndarray) \
+            and values.dtype.kind == 'b'
@@ -4,17 +4,99 @@
 # License: Apache 2.0
 # Source: https://github.com/trivago/rebase
 # Version: 1.2.2
-# Python Version: 3.6
+# Python Version: 3.7
 # Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
 """
 
-import uuid
-from typing import Any, Dict, List
+import copy
+import weakref
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Union
 import logging
 import simplejson as json
+from decimal import Decimal
+from rebase.core import binary, patch, profiling
+from rebase.core.encoder import Encoder
+from rebase.core.identity import Pool, _freeze, get_strategy
+from rebase.core.lazy import Lazy
+from rebase.core.path import Path, MISSING
+from rebase.core.selection import Selection, View
+from rebase.core.schema import Schema, PATH, TYPED, NESTED, OBJECT, CALLABLE, DEFAULT
 
 
 class Object(object):
+    __slots__ = ('_id', '_attributes', '_raw_attributes', '_schema',
+                 '_cache', '_parents', '_checkpoint', '__weakref__')
+
+    dynamic_properties = False
+    """bool: Opt out of the shared schema cache.
+
+    Set this to True in subclasses whose `properties()` returns a different
+    mapping from one instance to another (other than through the
+    `properties=` keyword argument), so that it is re-evaluated on every
+    access as it used to be.
+    """
+
+    cache_attributes = False
+    """bool: Cache the `attributes` projection of each instance.
+
+    The cache is invalidated when an attribute of the object, or of any
+    nested object, is assigned. In-place changes such as `obj.tags.append()`
+    are not detected: assign the attribute again to invalidate the cache.
+    The cached dict is shared between reads and must not be modified.
+    """
+
+    lazy_nested = False
+    """bool: Build nested `Object` properties on first access only.
+
+    Applies to `(source, ObjectSubclass)` tuples and bare `Object` subclasses
+    in `properties()`. Until a nested object is accessed, `attributes` and
+    `get()` serialize it straight from its raw data whenever its class uses
+    the default mapping of `Object`.
+    """
+
+    keep_raw = True
+    """bool|str: What each instance keeps of its keyword arguments.
+
+    By default every keyword argument is kept for `repr()`. With `'mapped'`
+    only the top-level keys read by `properties()` are kept, and with False
+    none at all, so that `repr()` shows no arguments. The raw input is
+    released once `_init_attributes()` is done. Plain objects and classes
+    with `dynamic_properties` need their arguments to resolve their
+    properties and always keep them all.
+    """
+
+    id_strategy = 'uuid'
+    """str|callable: How `get_id()` generates the id of an instance.
+
+    `'uuid'` generates a random UUID, `'counter'` the next value of a
+    process-wide counter, which is much cheaper, and `'content'` a hash of
+    the class and the mapped attributes, equal for equal objects. Any
+    callable taking the object and returning a string can be used too.
+    """
+
+    interned = False
+    """bool: Share one instance between equal nested objects of this class.
+
+    When a parent builds an instance of this class from `properties()`,
+    it is replaced by an already built instance with equal mapped
+    attributes if there is one, see `rebase.core.Pool`. Interned instances
+    are shared and must not be modified.
+    """
+
+    track_changes = False
+    """bool: Take a checkpoint of each instance when it is built.
+
+    `changes()` then returns what changed since construction, without
+    calling `checkpoint()` first.
+    """
+
+    json_encoder = None
+    """str: The name of the `Encoder` used by `to_json()` and `to_bytes()`.
+
+    `simplejson` and `json` are always available, `orjson` when installed.
+    By default the fastest one is used, see `Encoder.get()`.
+    """
+
     def __dir__(self):
         """Return a list of attributes for the class.
 
@@ -42,10 +124,23 @@ class Object(object):
               ```
 
         """
-        self._raw_attributes = kwargs
-        self._attributes = {}
-        self._id = None
-        self._init_attributes()
+        started = profiling.clock() if profiling.enabled else None
+        setattr_ = object.__setattr__
+        setattr_(self, '_raw_attributes', kwargs)
+        setattr_(self, '_attributes', {})
+        setattr_(self, '_id', None)
+        setattr_(self, '_cache', {} if self.cache_attributes else None)
+        setattr_(self, '_parents', None)
+        schema = self._get_schema()
+        setattr_(self, '_schema', None if self.dynamic_properties else schema)
+        self._init_attributes(schema)
+        if self.keep_raw is not True:
+            self._release_raw(schema)
+        if self.track_changes:
+            self.checkpoint()
+        if started is not None:
+            profiling.record(
+                'construct', self.classname, profiling.clock() - started)
 
     def __getattr__(self, attr_name: str) -> Any:
         """Return the value of an object attribute.
@@ -64,12 +159,33 @@ class Object(object):
             AttributeError: If attribute is undefinied in `Object.properties()`
 
         """
+        if attr_name in ('_schema', '_cache', '_parents', '_checkpoint'):
+            # only reached before `__init__` assigned them
+            return None
+
+        schema = self._schema
+        if schema is not None:
+            if attr_name in schema.names and attr_name not in schema.private:
+                value = self._attributes.get(attr_name)
+                if type(value) is Lazy:
+                    value = self._attributes[attr_name] = value.materialize()
+                    self._invalidate()
+                return value
+            elif attr_name not in schema.private:
+                raise AttributeError(
+                    f'Getting unknown property: `{self.classname}.{attr_name}`.')
+            return super().__getattr__(attr_name)
+
         if attr_name in self._properties():
             return super().__getattr__(attr_name)
         elif attr_name not in self.properties():
             raise AttributeError(
                 f'Getting unknown property: `{self.classname}.{attr_name}`.')
-        return self._attributes.get(attr_name)
+        value = self._attributes.get(attr_name)
+        if type(value) is Lazy:
+            value = self._attributes[attr_name] = value.materialize()
+            self._invalidate()
+        return value
 
     def __setattr__(self, attr_name: str, value: Any):
         """Set the value of an object attribute.
@@ -86,7 +202,23 @@ class Object(object):
             AttributeError: If attribute is undefinied in `Object.properties()`
 
         """
-        if attr_name in self._properties():
+        schema = self._schema
+        if schema is not None:
+            if attr_name in schema.private:
+                super().__setattr__(attr_name, value)
+                return
+            elif attr_name not in schema.names:
+                raise AttributeError(
+                    f'Setting unknown property: `{self.classname}.{attr_name}`.')
+            elif value is not None and attr_name in schema.types:
+                data_type = schema.types[attr_name]
+                if type(value) != data_type:
+                    raise AttributeError(
+                        f'`Value for {self.classname}.{attr_name}` should be of type {data_type}; {type(value)} provided.')
+
+            self._attributes[attr_name] = value
+            self._changed(attr_name)
+        elif attr_name in self._properties():
             super().__setattr__(attr_name, value)
         elif attr_name not in self.properties():
             raise AttributeError(
@@ -100,6 +232,74 @@ class Object(object):
                         f'`Value for {self.classname}.{attr_name}` should be of type {v}; {type(value)} provided.')
 
             self._attributes.update({attr_name: value})
+            self._changed(attr_name)
+
+    def __reduce__(self):
+        """Return a compact pickle of the object.
+
+        Only the class and the mapped values are pickled, positionally in the
+        order of `properties()` for classes with static properties, so that
+        neither the raw attributes nor the compiled mapping (which may hold
+        lambdas) are sent. The raw attributes are kept only for classes which
+        need them to resolve their properties: plain objects and those with
+        `dynamic_properties`. Unpickled objects do not keep the raw input,
+        so their `repr()` is empty.
+
+        Returns:
+            tuple: the pickle instructions
+        """
+        schema = self._schema
+        attributes = self._attributes
+        if schema is not None and type(self).properties is not _default_properties:
+            values = tuple(
+                attributes.get(name, MISSING) for name in schema.properties)
+        else:
+            values = dict(attributes)
+        return _restore, (type(self), values, self._get_state() or None)
+
+    def _get_state(self) -> Dict[str, Any]:
+        """Return the private state pickled along with the mapped values."""
+        state = {}
+        if self._id is not None:
+            state['_id'] = self._id
+        if self.dynamic_properties or type(self).properties is _default_properties:
+            state['_raw_attributes'] = self._raw_attributes
+        extra = getattr(self, '__dict__', None)
+        if extra:
+            # the attributes set by subclasses without __slots__
+            state['__dict__'] = extra
+        return state
+
+    def _init_state(self, values: Union[tuple, Dict[str, Any]],
+                    state: Dict[str, Any]):
+        """Initialize an unpickled instance, see `Object.__reduce__()`.
+
+        Args:
+            values (tuple|dict): the mapped values
+            state (dict): the private state returned by `_get_state()`
+
+        Returns:
+            void
+
+        """
+        setattr_ = object.__setattr__
+        setattr_(self, '_raw_attributes', state.get('_raw_attributes', {}))
+        setattr_(self, '_attributes', {})
+        setattr_(self, '_id', state.get('_id'))
+        setattr_(self, '_cache', {} if self.cache_attributes else None)
+        setattr_(self, '_parents', None)
+        schema = self._get_schema()
+        setattr_(self, '_schema', None if self.dynamic_properties else schema)
+
+        attributes = self._attributes
+        if isinstance(values, dict):
+            attributes.update(values)
+            return
+        if schema is None:
+            schema = self._compile_schema()
+        for name, value in zip(schema.properties, values):
+            if value is not MISSING:
+                attributes[name] = value
 
     def __str__(self) -> str:
         """Return a string representation of the object in json.
@@ -130,8 +330,8 @@ class Object(object):
     def _enforce_data_type(self, data: Any, data_type: type) -> Any:
         try:
             if data is not None:
-                if isinstance(data_type, type) and isinstance(data_type(), Object):
-                    return data_type(**data)
+                if isinstance(data_type, type) and issubclass(data_type, Object):
+                    return data_type(**data)._interned()
                 elif data_type in (bool, str, int, float, complex, list, tuple, range, set, dict) or callable(data_type):
                     return data_type(data)
         except TypeError:
@@ -139,71 +339,326 @@ class Object(object):
 
         return data
 
-    def _init_attributes(self):
+    def _init_record(self, raw: Dict[str, Any], schema: Schema = None,
+                     **kwargs):
+        """Initialize an instance created by `Object.from_records()`.
+
+        This mirrors `Object.__init__` without going through `__setattr__`,
+        and reuses the schema resolved for the previous records.
+
+        Args:
+            raw (dict): the record, copied into the raw attributes
+            schema (Schema): the compiled properties, resolved if None
+            **kwargs: arguments passed along with every record
+
+        Returns:
+            void
+
+        """
+        self._init_raw({**kwargs, **raw}, schema)
+
+    def _init_raw(self, raw: Dict[str, Any], schema: Schema = None):
+        """Initialize an instance with `raw` itself as raw attributes.
+
+        Unlike `Object._init_record()`, the dict is not copied: it is shared
+        with the caller, which must not modify it afterwards.
+
+        Args:
+            raw (dict): the keyword arguments
+            schema (Schema): the compiled properties, resolved if None
+
+        Returns:
+            void
+
+        """
+        started = profiling.clock() if profiling.enabled else None
+        setattr_ = object.__setattr__
+        setattr_(self, '_raw_attributes', raw)
+        setattr_(self, '_attributes', {})
+        setattr_(self, '_id', None)
+        setattr_(self, '_cache', {} if self.cache_attributes else None)
+        setattr_(self, '_parents', None)
+        if schema is None:
+            schema = self._get_schema()
+        setattr_(self, '_schema', None if self.dynamic_properties else schema)
+        self._init_attributes(schema)
+        if self.keep_raw is not True:
+            self._release_raw(schema)
+        if self.track_changes:
+            self.checkpoint()
+        if started is not None:
+            profiling.record(
+                'construct', self.classname, profiling.clock() - started)
+
+    @classmethod
+    def _can_init_record(cls) -> bool:
+        """Return whether `Object._init_record()` can stand in for `__init__`."""
+        return cls.__init__ is Object.__init__
+
+    @classmethod
+    def _from_raw(cls, raw: Dict[str, Any]) -> 'Object':
+        """Build an instance sharing `raw` as its raw attributes.
+
+        Used for bare `Object` properties, which are built from the whole
+        input of their parent: the parent's dict is shared instead of being
+        copied once per nested level.
+
+        Args:
+            raw (dict): the raw attributes of the parent
+
+        Returns:
+            Object: the instance
+
+        """
+        if not cls._can_init_record():
+            return cls(**raw)._interned()
+        obj = cls.__new__(cls)
+        obj._init_raw(raw)
+        return obj._interned()
+
+    def _interned(self) -> 'Object':
+        """Return the shared instance equal to this one with `interned`."""
+        return Pool.intern(self) if self.interned else self
+
+    def _release_raw(self, schema: Schema):
+        """Drop the raw attributes `Object.keep_raw` does not keep.
+
+        Args:
+            schema (Schema): the compiled properties
+
+        Returns:
+            void
+
+        """
+        if self.dynamic_properties \
+                or type(self).properties is _default_properties:
+            return
+        raw = self._raw_attributes
+        keys = schema.sources if self.keep_raw == 'mapped' else ()
+        if keys is None or len(keys) >= len(raw):
+            return
+        object.__setattr__(
+            self, '_raw_attributes', {k: raw[k] for k in keys if k in raw})
+
+    def _init_attributes(self, schema: Schema = None):
         """Perform the mapping of attributes based `Object.properties()`.
 
+        Args:
+            schema (Schema): the compiled properties, compiled on the fly
+            if not provided
+
         Returns:
             void
 
         """
-        for k, v in self.properties().items():
+        raw = self._raw_attributes
+        attributes = self._attributes
+        debug = logging.root.isEnabledFor(logging.DEBUG)
+        timed = profiling.enabled
+        if timed:
+            prefix = self.classname + '.'
+        lazy = self.lazy_nested \
+            and type(self)._enforce_data_type is Object._enforce_data_type
+        for k, kind, source, extra in (schema or self._get_schema()).fields:
+            if timed:
+                started = profiling.clock()
+            if debug:
+                logging.debug('Key: %s is being parsed as `%s` with value: %s', k, kind, source)
+            if kind == PATH:
+                attributes.setdefault(k, source.resolve(raw, None))
+            elif kind == TYPED or kind == NESTED:
+                data = None
+                if isinstance(source, Path):
+                    data = source.resolve(raw, None)
+                elif callable(source):
+                    data = source()
+
+                if lazy and kind == NESTED and isinstance(data, dict):
+                    attributes.setdefault(k, Lazy(extra, data))
+                else:
+                    attributes.setdefault(k, self._enforce_data_type(data, extra))
+            elif kind == OBJECT:
+                attributes.setdefault(
+                    k, Lazy(source, raw) if lazy else source._from_raw(raw))
+            elif kind == CALLABLE:
+                attributes.setdefault(k, source())
+            elif k in raw:
+                attributes.setdefault(k, raw.get(k))
+            else:
+                attributes.setdefault(
+                    k, copy.copy(source) if isinstance(source, (list, dict, set)) else source)
+
+            if timed:
+                profiling.record(
+                    'mapping', prefix + k, profiling.clock() - started)
+
+    def _compile_schema(self) -> Schema:
+        """Compile `Object.properties()` into a `Schema`.
+
+        Returns:
+            Schema: the compiled properties of this object
+
+        """
+        properties = self.properties()
+        fields = []
+        for k, v in properties.items():
             if isinstance(v, str):
-                logging.debug('Key: %s is being parsed as `str` with value: %s', k, v)
-                self._attributes.setdefault(
-                    k, self._get_attr_recurse(v, self._raw_attributes))
+                fields.append((k, PATH, Path.compile(v), None))
             elif isinstance(v, tuple):
-                logging.debug('Key: %s is being parsed as `tuple` with value: %s', k, v)
                 attribute, data_type = v
-                data = None
                 if attribute and isinstance(attribute, str):
-                    data = self._get_attr_recurse(
-                        attribute, self._raw_attributes)
-                elif callable(attribute):
-                    data = attribute()
-
-                self._attributes.setdefault(k,
-                                            self._enforce_data_type(
-                                                data, data_type))
-            elif isinstance(v, type) and isinstance(v(), Object):
-                logging.debug('Key: %s is being parsed as `rebase.core.Object` with value: %s', k, v)
-                self._attributes.setdefault(k, v(**self._raw_attributes))
+                    attribute = Path.compile(attribute)
+                nested = isinstance(data_type, type) \
+                    and issubclass(data_type, Object)
+                fields.append(
+                    (k, NESTED if nested else TYPED, attribute, data_type))
+            elif isinstance(v, type) and issubclass(v, Object):
+                fields.append((k, OBJECT, v, None))
             elif callable(v):
-                logging.debug('Key: %s is being parsed as `callable` with value: %s', k, v)
-                self._attributes.setdefault(k, v())
-            elif k in self._raw_attributes:
-                logging.debug('Key: %s is being parsed as `raw_attributes` with value: %s', k, v)
-                self._attributes.setdefault(k, self._raw_attributes.get(k))
+                fields.append((k, CALLABLE, v, None))
             else:
-                logging.debug('Key: %s is being parsed as `raw_attributes` with value: %s', k, v)
-                self._attributes.setdefault(k, self._raw_attributes.get(k, v))
+                fields.append((k, DEFAULT, v, None))
 
-    def _get_attr_recurse(self, attr, obj, idx=0):
-        if isinstance(obj, Object):
-            return self._get_attr_recurse(attr, obj.attributes, idx)
-        elif obj is None:
-            return None
+        bound = any(
+            _holds(source, self) if kind == CALLABLE else _holds(extra, self)
+            for _, kind, source, extra in fields if kind in (CALLABLE, TYPED))
+        return Schema(properties, self._properties(), fields, bound)
+
+    def _get_schema(self) -> Schema:
+        """Return the shared schema of this object, compiling it if needed.
+
+        Returns:
+            Schema: the compiled properties of this object
+
+        """
+        key = None if self.dynamic_properties else self._schema_key()
+        if key is None:
+            return self._compile_schema()
+
+        schema = Schema.get(key)
+        if profiling.enabled:
+            profiling.count('schema', schema is not None)
+        return schema or Schema.store(key, self._compile_schema())
 
-        attr_list = attr.split('.')
-        key = attr_list.pop(idx)
-        if key not in obj:
+    def _schema_key(self) -> Hashable:
+        """Return the key under which the compiled schema is shared.
+
+        Objects relying on the default `Object.properties()` share a schema
+        per distinct `properties=` argument or per distinct set of keyword
+        arguments; any other class shares a single schema.
+
+        Returns:
+            Hashable: the cache key, or None if the schema cannot be shared
+
+        """
+        cls = type(self)
+        key = (cls, cls.properties, cls._properties)
+        if cls.properties is not _default_properties:
+            return key
+
+        properties = self._raw_attributes.get('properties')
+        try:
+            shape = _freeze(properties) if properties else tuple(
+                self._raw_attributes)
+            hash(shape)
+        except TypeError:
             return None
 
-        if len(attr_list) == idx:
-            return obj.get(key)
-        else:
-            return self._get_attr_recurse(attr, obj.get(key), idx+1)
+        return (*key, shape)
+
+    def _get_attr_recurse(self, attr, obj, idx=0):
+        return Path.compile(attr).resolve(obj, None, idx)
+
+    def _changed(self, attr_name: str):
+        """Handle the assignment of a mapped attribute.
+
+        Args:
+            attr_name (string): the name of the attribute assigned
+
+        Returns:
+            void
+
+        """
+        if self._cache or self._parents:
+            self._invalidate()
+
+    def _invalidate(self, seen: set = None):
+        """Drop the cached projections of this object and of its parents.
+
+        Args:
+            seen (set): the ids of the objects already invalidated
+
+        Returns:
+            void
+
+        """
+        if self._cache:
+            self._cache.clear()
+
+        parents = self._parents
+        if parents:
+            seen = seen or set()
+            seen.add(id(self))
+            for parent in list(parents):
+                if id(parent) not in seen:
+                    parent._invalidate(seen)
+
+    def _watch_children(self):
+        """Register this object as parent of the objects it holds.
+
+        Nested objects then invalidate the cached projection of this object
+        when they change.
+
+        Returns:
+            void
+
+        """
+        for v in self._attributes.values():
+            if isinstance(v, Object):
+                v._add_parent(self)
+            elif isinstance(v, (list, set, dict)):
+                for x in (v.values() if isinstance(v, dict) else v):
+                    if isinstance(x, Object):
+                        x._add_parent(self)
+
+    def _add_parent(self, parent: 'Object'):
+        if self._parents is None:
+            object.__setattr__(self, '_parents', weakref.WeakSet())
+        self._parents.add(parent)
 
     def _properties(self) -> List[str]:
-        return ['_id', '_attributes', '_raw_attributes']
+        return ['_id', '_attributes', '_raw_attributes', '_schema', '_cache',
+                '_parents', '_checkpoint']
 
     @property
     def attributes(self) -> Dict[str, Any]:
         """Return the attributes of the object based on `Object.properties()`.
 
+        The result is cached when `Object.cache_attributes` is set.
+
         Return:
             dict: a dictionary of the attributes of the object
         """
-        return self.get(*self._attributes)
+        cache = self._cache
+        if cache is None:
+            if self._parents:
+                self._watch_children()
+            return self._get_attributes()
+
+        attributes = cache.get(None)
+        if profiling.enabled:
+            profiling.count('attributes', attributes is not None)
+        if attributes is None:
+            self._watch_children()
+            attributes = cache[None] = self._get_attributes()
+        return attributes
+
+    def _get_attributes(self) -> Dict[str, Any]:
+        """Return `get()` of every attribute, without parsing their names."""
+        if type(self).get is not Object.get:
+            return self.get(*self._attributes)
+        serialize = self._serialize
+        return {k: serialize(v) for k, v in self._attributes.items()}
 
     @property
     def classname(self) -> str:
@@ -216,45 +671,316 @@ class Object(object):
         """
         return self.__class__.__name__
 
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]],
+                     lazy: bool = False,
+                     **kwargs) -> Union[List['Object'], Iterator['Object']]:
+        """Build one object per record.
+
+        The mapping plan is resolved once for the whole batch instead of once
+        per object, so this is much cheaper than calling the constructor in a
+        loop. Classes overriding `__init__` fall back to the constructor.
+
+        Args:
+            records (Iterable): the dicts (or a generator of dicts) to build
+            the objects from
+            lazy (bool): return an iterator building the objects on demand
+            instead of a list
+            **kwargs: arguments passed to the constructor along with every
+            record; values of the record take precedence
+
+        Returns:
+            list|Iterator: the objects, in the order of the records
+
+        """
+        if not cls._can_init_record():
+            objects = (cls(**{**kwargs, **record}) for record in records)
+            return objects if lazy else list(objects)
+
+        def build(records):
+            static = not cls.dynamic_properties \
+                and cls.properties is not _default_properties
+            schema = None
+            new = cls.__new__
+            for record in records:
+                obj = new(cls)
+                obj._init_record(record, schema, **kwargs)
+                if static and not obj._schema.bound:
+                    schema = obj._schema
+                yield obj
+
+        return build(records) if lazy else list(build(records))
+
     def get(self, *attrs) -> Dict[str, Any]:
         """Return a dict of the attribute names passed as arguments.
 
+        Paths select values inside attributes, nested objects and lists
+        (`'location.city'`, `'rooms.*.price'`), and paths starting with `-`
+        exclude them (`'-mother'`, `'-rooms.*.rates'`): only the selected
+        branches are walked and serialized. Without any other path, the
+        exclusions apply to every attribute.
+
         Args:
-            attrs (list): comma separated name of attributes for the object
+            attrs (list): comma separated name of attributes for the object,
+            or paths to include or exclude
 
         Returns:
             dict: the attributes of the object if set
 
         """
+        serialize = self._serialize
+        selection = Selection.get(attrs)
+        if selection is not None:
+            return selection.apply(self._attributes, serialize)
+        attrs = set(attrs)
         return {
-            k: v.attributes
+            k: serialize(v) for k, v in self._attributes.items() if k in attrs
+        }
+
+    def view(self, *paths) -> View:
+        """Return a read-only, lazy mapping over selected attributes.
+
+        Takes the same paths as `get()`, but nothing is serialized or
+        copied: nested objects and dicts are views themselves, and lists
+        sequences of views, resolved on access. The view reflects later
+        changes of the object.
+
+        Args:
+            paths (list): the names or paths to include or exclude, every
+            attribute if none
+
+        Returns:
+            View: the view
+
+        """
+        selection = Selection.get(paths) or Selection(paths)
+        return View(self, selection.include, selection.exclude)
+
+    @staticmethod
+    def _serialize(v: Any) -> Any:
+        """Return the serialized form of an attribute value for `get()`."""
+        if type(v) is Lazy:
+            return Object._serialize_lazy(v)
+        return v.attributes \
             if isinstance(v, Object) else [
                 x.attributes
                 if isinstance(x, Object) else x
                 for x in v
-            ]
+            ] \
             if isinstance(v, list) else {
                 x: y.attributes
                 if isinstance(y, Object) else y
                 for x, y in v.items()
-            }
+            } \
             if isinstance(v, dict) else {
                 x.get_id(): x.attributes
                 for x in v
-            }
+            } \
             if isinstance(v, set) else v
-            for k, v in self._attributes.items() if k in attrs
-        }
+
+    @staticmethod
+    def _serialize_lazy(v: Lazy) -> Any:
+        """Serialize a nested object, from its raw data if it is not built.
+
+        The raw data is serialized directly only when the nested class maps
+        its keyword arguments the way a plain `Object` does; otherwise the
+        object is built.
+        """
+        if v.value is MISSING:
+            data_type, data = v.data_type, v.data
+            plain = all(
+                getattr(data_type, name) is getattr(Object, name)
+                for name in ('properties', 'attributes', 'get',
+                             '_init_attributes', '__init__')
+            )
+            if plain and 'properties' not in data and all(
+                    isinstance(k, str) and '.' not in k for k in data):
+                serialize = Object._serialize
+                return {k: serialize(x) for k, x in data.items()}
+
+        return Object._serialize(v.materialize())
+
+    def checkpoint(self):
+        """Remember the current `attributes`, for `changes()`.
+
+        Returns:
+            void
+
+        """
+        object.__setattr__(
+            self, '_checkpoint', patch.copy_tree(self.attributes))
+
+    def changes(self) -> Dict[str, Any]:
+        """Return what changed since the last checkpoint, as a patch.
+
+        Changes are found by comparing `attributes` with the checkpoint, so
+        in-place changes of lists, dicts and nested objects are included,
+        unless `attributes` is cached with `cache_attributes`. See `diff()`
+        for the format of the patch.
+
+        Returns:
+            dict: the patch, empty if nothing changed
+
+        Raises:
+            ValueError: If no checkpoint was taken, see `track_changes`
+
+        """
+        if self._checkpoint is None:
+            raise ValueError(
+                f'No checkpoint of `{self.classname}`; call checkpoint() '
+                f'or set track_changes.')
+        return patch.make_patch(self._checkpoint, self.attributes)
+
+    def diff(self, other: Union['Object', Dict[str, Any]]) -> Dict[str, Any]:
+        """Return the patch turning this object into `other`.
+
+        The patch maps the dotted paths of the changed values to their new
+        serialized value under `'set'`, and lists the removed paths under
+        `'unset'`; empty sections are omitted:
+
+        ```python
+        {'set': {'name': 'Hotel', 'rooms.3.price': 90}, 'unset': ['tags.2']}
+        ```
+
+        Args:
+            other (Object|dict): the object, or `attributes`, to compare to
+
+        Returns:
+            dict: the patch, empty if nothing differs
+
+        """
+        if isinstance(other, Object):
+            other = other.attributes
+        return patch.make_patch(self.attributes, other)
+
+    def apply_patch(self, changes: Dict[str, Any]):
+        """Apply a patch returned by `diff()` or `changes()` in place.
+
+        Attributes are assigned as with `setattr()`, nested objects are
+        updated in place, and lists and dicts are modified in place.
+
+        Args:
+            changes (dict): the patch
+
+        Returns:
+            void
+
+        Raises:
+            KeyError: If a path does not exist in a dict or list
+            AttributeError: If a path names an unknown property, or a value
+            cannot be assigned to an attribute
+
+        """
+        patch.apply_patch(self, changes)
+
+    def to_json(self, encoder: Union[str, Encoder] = None,
+                use_decimal: bool = False, changes: bool = False) -> str:
+        """Return the `attributes` of the object as a compact JSON string.
+
+        Unlike `str()`, the attributes are encoded straight from the storage
+        of the object (and of its nested objects) whenever `attributes` and
+        `get()` are not overridden, without building the `attributes` dict.
+
+        Args:
+            encoder (string|Encoder): the encoder, `json_encoder` by default
+            use_decimal (bool): encode `Decimal` values as exact numbers
+            instead of floats, which only the `simplejson` encoder supports
+            changes (bool): encode only the patch returned by `changes()`
+
+        Returns:
+            string: the JSON document
+
+        Raises:
+            ValueError: If `changes` is set and no checkpoint was taken
+
+        """
+        encoder = Encoder.get(encoder or self.json_encoder, use_decimal)
+        data = encoder.encode(
+            self.changes() if changes else self._json_fields(),
+            self._json_default, use_decimal)
+        return data.decode('utf-8') if encoder.binary else data
+
+    def to_bytes(self, encoder: Union[str, Encoder] = None,
+                 use_decimal: bool = False, changes: bool = False) -> bytes:
+        """Return the `attributes` of the object as UTF-8 encoded JSON.
+
+        Takes the same arguments as `to_json()`.
+
+        Returns:
+            bytes: the JSON document
+
+        """
+        encoder = Encoder.get(encoder or self.json_encoder, use_decimal)
+        data = encoder.encode(
+            self.changes() if changes else self._json_fields(),
+            self._json_default, use_decimal)
+        return data if encoder.binary else data.encode('utf-8')
+
+    def to_msgpack(self, changes: bool = False) -> bytes:
+        """Return the `attributes` of the object encoded in MessagePack.
+
+        Nested objects are encoded from their storage the same way as with
+        `to_json()`; decode the result with `rebase.core.unpackb()`.
+
+        Args:
+            changes (bool): encode only the patch returned by `changes()`
+
+        Returns:
+            bytes: the encoded attributes
+
+        Raises:
+            ImportError: If the `msgpack` package is not installed
+
+        """
+        return binary.packb(
+            self.changes() if changes else self._json_fields(),
+            self._json_default)
+
+    def _json_fields(self) -> Dict[str, Any]:
+        """Return the mapping encoded by `to_json()`, uncopied if possible."""
+        if type(self).attributes is not Object.attributes:
+            return self.attributes
+        return self._stored_fields()
+
+    def _stored_fields(self) -> Dict[str, Any]:
+        if type(self).get is not Object.get:
+            return self.get(*self._attributes)
+        if self._cache is not None:
+            return self.attributes
+        attributes = self._attributes
+        return attributes if type(attributes) is dict else dict(attributes)
+
+    @staticmethod
+    def _json_default(v: Any) -> Any:
+        """Convert the values unknown to the encoders, like `_serialize()`."""
+        if isinstance(v, Object):
+            return v._json_fields()
+        if type(v) is Lazy:
+            if v.value is MISSING:
+                return Object._serialize_lazy(v)
+            return Object._json_default(v.value)
+        if isinstance(v, (set, frozenset)):
+            return {x.get_id(): x for x in v} \
+                if all(isinstance(x, Object) for x in v) else list(v)
+        if isinstance(v, Decimal):
+            return float(v)
+        raise TypeError(
+            f'Object of type {type(v).__name__} is not JSON serializable')
 
     def get_id(self):
         """Generate and return the unique id of the object.
 
+        The id is generated once, on first call, by `Object.id_strategy`.
+
         Returns:
-            string: the unique id generated by uuid
+            string: the unique id of the object
+
+        Raises:
+            ValueError: If `id_strategy` is an unknown name
 
         """
         if not self._id:
-            self._id = str(uuid.uuid4())
+            self._id = get_strategy(self.id_strategy)(self)
         return self._id
 
     def properties(self) -> Dict[str, Any]:
@@ -270,3 +996,35 @@ class Object(object):
         return self._raw_attributes.get('properties') or {
             k: k for k, v in self._raw_attributes.items()
         }
+
+
+_default_properties = Object.properties
+
+
+def _restore(cls: type, values: Union[tuple, Dict[str, Any]],
+             state: Dict[str, Any]) -> Object:
+    """Rebuild an object pickled by `Object.__reduce__()`."""
+    obj = cls.__new__(cls)
+    state = state or {}
+    obj._init_state(values, state)
+    if '__dict__' in state:
+        obj.__dict__.update(state['__dict__'])
+    if obj.track_changes:
+        obj.checkpoint()
+    return obj
+
+
+def _holds(value: Any, obj: Object) -> bool:
+    """Return whether the callable `value` refers to `obj`, as a bound
+    method, through its closure or through its default arguments."""
+    if not callable(value) or isinstance(value, type):
+        return False
+    if getattr(value, '__self__', None) is obj:
+        return True
+    for cell in getattr(value, '__closure__', None) or ():
+        try:
+            if cell.cell_contents is obj:
+                return True
+        except ValueError:
+            continue
+    return any(v is obj for v in getattr(value, '__defaults__', None) or ())
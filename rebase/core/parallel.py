@@ -0,0 +1,134 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+from collections import deque
+from concurrent.futures import (Executor, FIRST_COMPLETED,
+                                ProcessPoolExecutor, ThreadPoolExecutor, wait)
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+
+def map_many(model_class: type, records: Iterable[Dict[str, Any]],
+             executor: Union[str, Executor] = 'thread', workers: int = None,
+             chunk_size: int = 1000, ordered: bool = True,
+             max_in_flight: int = None, attributes: bool = None,
+             **kwargs) -> Iterator[Any]:
+    """Build `model_class` from many records over a pool of workers.
+
+    Records are sent to the workers in chunks, and only the records (never
+    the built objects, whose `properties()` may hold lambdas) are pickled
+    for process pools.
+
+    Args:
+        model_class (type): a subclass of `rebase.core.Object`, defined at
+        module level when using a process pool
+        records (Iterable): the dicts to build the objects from
+        executor (str|Executor): `'thread'`, `'process'` or an executor,
+        which is left running
+        workers (int): the number of workers of the pool created
+        chunk_size (int): the number of records per task
+        ordered (bool): yield in the order of the records, otherwise as soon
+        as a chunk is done
+        max_in_flight (int): the maximum number of chunks submitted at once,
+        twice the number of workers by default
+        attributes (bool): yield the `attributes` of the objects instead of
+        the objects, the default for process pools
+        **kwargs: arguments passed to the constructor of every object
+
+    Returns:
+        Iterator: the objects (or their attributes)
+
+    """
+    for chunk in _run(_map_chunk, model_class, records, executor, workers,
+                      chunk_size, ordered, max_in_flight, attributes, kwargs):
+        yield from chunk
+
+
+def validate_many(model_class: type, records: Iterable[Dict[str, Any]],
+                  executor: Union[str, Executor] = 'thread',
+                  workers: int = None, chunk_size: int = 1000,
+                  ordered: bool = True, max_in_flight: int = None,
+                  attributes: bool = None,
+                  **kwargs) -> Iterator[Tuple[Any, Dict[str, List[str]]]]:
+    """Build and validate `model_class` from many records over a pool.
+
+    Takes the same arguments as `map_many()`.
+
+    Returns:
+        Iterator: `(model, errors)` tuples, where `errors` is empty if the
+        model is valid and `model` is its attributes if `attributes` is set
+
+    """
+    for chunk in _run(_validate_chunk, model_class, records, executor,
+                      workers, chunk_size, ordered, max_in_flight, attributes,
+                      kwargs):
+        yield from chunk
+
+
+def _map_chunk(model_class: type, chunk: List[Dict[str, Any]],
+               attributes: bool, kwargs: Dict[str, Any]) -> List[Any]:
+    objects = model_class.from_records(chunk, **kwargs)
+    return [o.attributes for o in objects] if attributes else objects
+
+
+def _validate_chunk(model_class: type, chunk: List[Dict[str, Any]],
+                    attributes: bool, kwargs: Dict[str, Any]) -> List[Tuple]:
+    results = []
+    for model in model_class.from_records(chunk, lazy=True, **kwargs):
+        errors = {} if model.validate() else model.get_errors()
+        results.append((model.attributes if attributes else model, errors))
+    return results
+
+
+def _run(task, model_class, records, executor, workers, chunk_size, ordered,
+         max_in_flight, attributes, kwargs) -> Iterator[List[Any]]:
+    owned = isinstance(executor, str)
+    if owned:
+        if executor == 'thread':
+            pool = ThreadPoolExecutor(max_workers=workers)
+        elif executor == 'process':
+            pool = ProcessPoolExecutor(max_workers=workers)
+        else:
+            raise ValueError(
+                f'Unknown executor `{executor}`; use `thread` or `process`.')
+    else:
+        pool = executor
+
+    if attributes is None:
+        attributes = isinstance(pool, ProcessPoolExecutor)
+    if max_in_flight is None:
+        max_in_flight = 2 * (getattr(pool, '_max_workers', None) or 1)
+
+    records = iter(records)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < max_in_flight:
+                chunk = list(islice(records, chunk_size))
+                if not chunk:
+                    break
+                pending.append(
+                    pool.submit(task, model_class, chunk, attributes, kwargs))
+
+            if not pending:
+                return
+
+            if ordered:
+                yield pending.popleft().result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            pool.shutdown()
@@ -0,0 +1,181 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+from decimal import Decimal
+from typing import Any, Dict, List
+
+SET = 'set'
+UNSET = 'unset'
+
+
+def copy_tree(value: Any) -> Any:
+    """Return a copy of the dicts, lists and sets of `value`, however deep.
+
+    Other values, such as strings and numbers, are shared.
+    """
+    cls = type(value)
+    if cls is dict:
+        return {k: copy_tree(v) for k, v in value.items()}
+    if cls is list:
+        return [copy_tree(v) for v in value]
+    if cls is set:
+        return set(value)
+    return value
+
+
+def make_patch(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the patch turning the attributes `old` into `new`.
+
+    The patch maps dotted paths (`'rooms.3.price'`) to their new value
+    under `'set'` and lists the paths removed under `'unset'`, each section
+    being omitted when empty. Dicts and lists are compared item by item;
+    a dict with keys which cannot be part of a path (not a string, or
+    holding a `.`) is replaced as a whole. `1`, `1.0` and `True` differ.
+
+    Args:
+        old (dict): the attributes before
+        new (dict): the attributes after
+
+    Returns:
+        dict: the patch, empty if nothing changed
+
+    """
+    changes, removed = {}, []
+    _diff(old, new, '', changes, removed)
+    patch = {}
+    if changes:
+        patch[SET] = changes
+    if removed:
+        patch[UNSET] = removed
+    return patch
+
+
+def _diff(old: Any, new: Any, path: str, changes: Dict[str, Any],
+          removed: List[str]):
+    prefix = path + '.' if path else ''
+    if type(old) is dict and type(new) is dict \
+            and (not path or (_safe(old) and _safe(new))):
+        for k, v in new.items():
+            if k in old:
+                _diff(old[k], v, prefix + k, changes, removed)
+            else:
+                changes[prefix + k] = v
+        removed.extend(prefix + k for k in old if k not in new)
+    elif type(old) is list and type(new) is list and path:
+        common = min(len(old), len(new))
+        for i in range(common):
+            _diff(old[i], new[i], f'{prefix}{i}', changes, removed)
+        for i in range(common, len(new)):
+            changes[f'{prefix}{i}'] = new[i]
+        removed.extend(
+            f'{prefix}{i}' for i in reversed(range(common, len(old))))
+    elif type(old) is not type(new) or old != new:
+        changes[path] = new
+
+
+def _safe(value: Dict[Any, Any]) -> bool:
+    return all(type(k) is str and k and '.' not in k for k in value)
+
+
+def apply_patch(target: Any, patch: Dict[str, Any]):
+    """Apply a patch returned by `make_patch()` to an object, in place.
+
+    Attributes of objects are assigned, so that their caches are
+    invalidated; dicts and lists are updated in place. A dict set at the
+    path of a nested object updates the attributes of that object. Values
+    assigned to attributes declared with a `(source, type)` tuple are
+    rebuilt as that type, so that a dict becomes a nested object.
+
+    Args:
+        target (Object): the object to patch
+        patch (dict): the patch
+
+    Returns:
+        void
+
+    Raises:
+        KeyError: If a path does not exist in a dict or list of `target`
+        AttributeError: If a path names an unknown property, or a value
+        cannot be assigned to an attribute
+
+    """
+    for path, value in patch.get(SET, {}).items():
+        _apply(target, path.split('.'), value, False)
+    for path in patch.get(UNSET, ()):
+        _apply(target, path.split('.'), None, True)
+
+
+def _apply(target: Any, keys: List[str], value: Any, unset: bool):
+    owner, name = target, keys[0]
+    container = target
+    for key in keys[:-1]:
+        container = _child(container, key)
+        if hasattr(type(container), '_attributes'):
+            owner, name = container, None
+        elif name is None:
+            name = key
+
+    key = keys[-1]
+    if hasattr(type(container), '_attributes'):
+        current = getattr(container, key)
+        if type(value) is dict and hasattr(type(current), '_attributes'):
+            for k, v in value.items():
+                _apply(current, [k], v, False)
+        else:
+            setattr(container, key,
+                    None if unset else _typed(container, key, value))
+        return
+
+    if isinstance(container, list):
+        index = int(key)
+        if unset:
+            del container[index]
+        elif index == len(container):
+            container.append(value)
+        else:
+            container[index] = value
+    elif unset:
+        del container[key]
+    else:
+        container[key] = value
+    owner._changed(name)
+
+
+def _typed(owner: Any, name: str, value: Any) -> Any:
+    """Return `value` rebuilt as the type declared for the attribute `name`
+    of `owner` with a `(source, type)` tuple, as the constructor does.
+
+    Patches hold serialized values: nested objects as dicts and `Decimal`
+    values as floats once encoded with `to_json()`.
+    """
+    schema = owner._schema
+    if schema is not None:
+        data_type = schema.types.get(name)
+    else:
+        attr = owner.properties().get(name)
+        data_type = attr[1] if isinstance(attr, tuple) else None
+    if value is None or not isinstance(data_type, type) \
+            or type(value) is data_type:
+        return value
+    if data_type is Decimal and type(value) is float:
+        # the shortest repr gives back the encoded digits
+        value = repr(value)
+    return owner._enforce_data_type(value, data_type)
+
+
+def _child(container: Any, key: str) -> Any:
+    if hasattr(type(container), '_attributes'):
+        return getattr(container, key)
+    if isinstance(container, (list, tuple)):
+        try:
+            return container[int(key)]
+        except (ValueError, IndexError):
+            raise KeyError(key) from None
+    return container[key]
@@ -0,0 +1,126 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+from typing import Any
+
+WILDCARD = '*'
+
+
+class _Missing(object):
+    def __repr__(self):
+        return 'MISSING'
+
+    def __bool__(self):
+        return False
+
+    def __reduce__(self):
+        return 'MISSING'
+
+
+MISSING = _Missing()
+
+
+class Path(object):
+    """A dotted source path such as `'location.city'` compiled once.
+
+    Segments are looked up as keys in dicts, as indices in lists and tuples
+    (`'rooms.0.price'`) and through the `attributes` of objects such as
+    `rebase.core.Object`. A `*` segment fans out over every element of a
+    list or every value of a dict and resolves to the list of the values
+    found (`'rooms.*.price'`).
+    """
+
+    max_size = 1024
+    _cache = {}
+
+    def __init__(self, path: str):
+        """Initialize the path.
+
+        Prefer `Path.compile()` which reuses already compiled paths.
+
+        Args:
+            path (string): the dotted path
+
+        """
+        self.path = path
+        self.segments = tuple(
+            (key, int(key) if key.lstrip('-').isdigit() else None)
+            for key in path.split('.')
+        )
+
+    def __repr__(self) -> str:
+        return f'Path({self.path!r})'
+
+    @classmethod
+    def compile(cls, path: str) -> 'Path':
+        """Return the compiled path for `path`.
+
+        Args:
+            path (string): the dotted path
+
+        Returns:
+            Path: the compiled path, shared by every caller once compiled,
+            unless `max_size` paths are cached already
+
+        """
+        compiled = cls._cache.get(path)
+        if compiled is None:
+            compiled = cls(path)
+            if len(cls._cache) < cls.max_size:
+                compiled = cls._cache.setdefault(path, compiled)
+        return compiled
+
+    def resolve(self, obj: Any, default: Any = MISSING, start: int = 0) -> Any:
+        """Return the value found at this path in `obj`.
+
+        Args:
+            obj (Any): the data to look into
+            default (Any): the value to return if the path does not exist
+            start (int): the index of the first segment to resolve
+
+        Returns:
+            Any: the value found, `default` otherwise
+
+        """
+        segments = self.segments
+        for i in range(start, len(segments)):
+            if obj is None:
+                return default
+            if not isinstance(obj, (dict, list, tuple)) \
+                    and hasattr(type(obj), 'attributes'):
+                obj = obj.attributes
+
+            key, index = segments[i]
+            if key == WILDCARD:
+                items = obj.values() if isinstance(obj, dict) else obj \
+                    if isinstance(obj, (list, tuple)) else None
+                if items is None:
+                    return default
+                values = []
+                for item in items:
+                    value = self.resolve(item, MISSING, i + 1)
+                    if value is not MISSING:
+                        values.append(value)
+                return values
+
+            if isinstance(obj, dict):
+                obj = obj.get(key, MISSING)
+            elif index is not None and isinstance(obj, (list, tuple)):
+                try:
+                    obj = obj[index]
+                except IndexError:
+                    obj = MISSING
+            else:
+                obj = MISSING
+
+            if obj is MISSING:
+                return default
+
+        return obj
@@ -0,0 +1,194 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, Tuple, Union
+
+enabled = False
+"""bool: Whether the instrumented code paths record anything.
+
+When disabled, each instrumented call costs a single check of this flag.
+"""
+
+clock = perf_counter
+
+_timings = {}
+_caches = {}
+_hooks = []
+
+
+def enable():
+    """Start recording timings and cache counters.
+
+    Returns:
+        void
+
+    """
+    global enabled
+    enabled = True
+
+
+def disable():
+    """Stop recording; the values recorded so far are kept.
+
+    Returns:
+        void
+
+    """
+    global enabled
+    enabled = False
+
+
+def reset():
+    """Drop every value recorded so far.
+
+    Returns:
+        void
+
+    """
+    _timings.clear()
+    _caches.clear()
+
+
+@contextmanager
+def profile(reset_stats: bool = True) -> Iterator[None]:
+    """Record within a `with` block, then restore the previous state.
+
+    Args:
+        reset_stats (bool): drop the values recorded before the block
+
+    Returns:
+        Iterator: the context manager
+
+    """
+    global enabled
+    previous = enabled
+    if reset_stats:
+        reset()
+    enabled = True
+    try:
+        yield
+    finally:
+        enabled = previous
+
+
+def add_hook(hook: Callable[[str, str, Union[float, bool]], Any]):
+    """Call `hook` for every value recorded, e.g. to feed a metrics exporter.
+
+    Hooks are called with `(group, name, seconds)` for timings and with
+    `('cache', name, hit)` for cache lookups.
+
+    Args:
+        hook (callable): the function to call
+
+    Returns:
+        void
+
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Callable[[str, str, Union[float, bool]], Any]):
+    """Stop calling a hook added by `add_hook()`.
+
+    Returns:
+        void
+
+    """
+    _hooks.remove(hook)
+
+
+def record(group: str, name: str, seconds: float):
+    """Add one call of `seconds` to the timing `name` of `group`.
+
+    The groups recorded by the library are `construct` (per class),
+    `mapping` (per `Class.property`), `validator` (per validator class) and
+    `rule` (per `Model.attribute`).
+
+    Returns:
+        void
+
+    """
+    timing = _timings.get((group, name))
+    if timing is None:
+        _timings[(group, name)] = [1, seconds]
+    else:
+        timing[0] += 1
+        timing[1] += seconds
+    for hook in _hooks:
+        hook(group, name, seconds)
+
+
+def count(name: str, hit: bool):
+    """Count one lookup in the cache `name`.
+
+    The caches counted by the library are `schema`, `rules`, `attributes`
+    (with `Object.cache_attributes`), `memo` (validators shared by the
+    rules of one attribute), `incremental` (with
+    `Model.incremental_validation`) and `intern` (with `Object.interned`).
+
+    Returns:
+        void
+
+    """
+    counter = _caches.get(name)
+    if counter is None:
+        counter = _caches[name] = [0, 0]
+    counter[0 if hit else 1] += 1
+    for hook in _hooks:
+        hook('cache', name, hit)
+
+
+def stats() -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Return a snapshot of the values recorded so far.
+
+    ```python
+    {
+        'construct': {'app.Hotel': {'calls': 3, 'seconds': 0.0001}},
+        'cache': {'schema': {'hits': 2, 'misses': 1, 'hit_rate': 0.67}},
+        ...
+    }
+    ```
+
+    Counters are updated without locking, so they are approximate when
+    several threads record at once.
+
+    Returns:
+        dict: the timings of each group and the counters of each cache
+
+    """
+    snapshot = {}
+    for (group, name), (calls, seconds) in list(_timings.items()):
+        snapshot.setdefault(group, {})[name] = {
+            'calls': calls,
+            'seconds': seconds,
+        }
+    for name, (hits, misses) in list(_caches.items()):
+        snapshot.setdefault('cache', {})[name] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+        }
+    return snapshot
+
+
+def top(group: str, n: int = 10) -> Tuple[Tuple[str, float], ...]:
+    """Return the `n` names of `group` with the largest cumulative time.
+
+    Returns:
+        tuple: `(name, seconds)` pairs, slowest first
+
+    """
+    timings = [
+        (name, seconds) for (g, name), (_, seconds) in list(_timings.items())
+        if g == group
+    ]
+    return tuple(sorted(timings, key=lambda t: -t[1])[:n])
@@ -0,0 +1,238 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import linecache
+from typing import Any, Callable, Dict, Hashable, List, Union
+from rebase.core import Object, Validator
+from rebase.core.lazy import Lazy
+
+
+class CompiledRules(object):
+    """The validation function generated for the rules of a model class.
+
+    Attributes:
+        source (str): the Python source of the function
+        schema (Schema): the schema the function reads attributes through,
+        None if it reads them with `getattr()`
+        function (callable): validates a model, filling its errors, and
+        returns whether it is valid
+        inlined (int): the number of rules running inline
+        fallback (int): the number of rules called through `check()`
+
+    """
+
+    __slots__ = ('source', 'schema', 'function', 'inlined', 'fallback')
+
+    def __init__(self, source: str, schema: Any, function: Callable[[Any], bool],
+                 inlined: int, fallback: int):
+        self.source = source
+        self.schema = schema
+        self.function = function
+        self.inlined = inlined
+        self.fallback = fallback
+
+    def __repr__(self) -> str:
+        return f'CompiledRules(inlined={self.inlined}, fallback={self.fallback})'
+
+
+def compile_rules(model: Object, rules: Dict[str, List[Validator]]) -> CompiledRules:
+    """Generate the function validating every rule of a model.
+
+    The function runs the checks of the validators which implement
+    `Validator.inline()`, their dependencies included, as straight-line
+    code: no validator method is called and each distinct dependency of an
+    attribute is checked once, as `Validator.check()` does with its memo.
+    Other validators are called through `check()`. Attributes are read from
+    the stored values when the schema of `model` allows it.
+
+    Args:
+        model (Model): an instance of the model class
+        rules (dict): the shared validators of each attribute
+
+    Returns:
+        CompiledRules: the compiled function
+
+    """
+    cls = type(model)
+    compiler = _Compiler(cls, model._schema)
+    lines = [
+        'def validate(model):',
+        '    errors = model._errors',
+        '    errors.clear()',
+        '    valid = True',
+    ]
+    if compiler.schema is not None:
+        lines.append('    attributes = model._attributes')
+    for attr, ruleset in rules.items():
+        lines.extend('    ' + line for line in compiler.attribute(attr, ruleset))
+    lines.append('    return valid')
+
+    source = '\n'.join(lines) + '\n'
+    filename = f'<rebase rules {cls.__module__}.{cls.__qualname__}>'
+    linecache.cache[filename] = (
+        len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, 'exec'), compiler.namespace)
+    return CompiledRules(
+        source, compiler.schema if compiler.stored else None,
+        compiler.namespace['validate'], len(compiler.inlined),
+        len(compiler.fallback))
+
+
+class _Compiler(object):
+    """Generates the source of the validation function, one attribute at a
+    time."""
+
+    def __init__(self, cls: type, schema: Any):
+        self.cls = cls
+        self.schema = schema if _direct(cls) else None
+        self.namespace = {'Lazy': Lazy, 'getattr': getattr}
+        self.constants = {}
+        self.inlined = set()
+        self.fallback = set()
+        self.count = 0
+        self.stored = False
+
+    def const(self, value: Any) -> str:
+        """Return the name of a global of the generated code bound to
+        `value`."""
+        key = id(value)
+        name = self.constants.get(key)
+        if name is None:
+            name = self.constants[key] = f'_c{len(self.constants)}'
+            self.namespace[name] = value
+        return name
+
+    def attribute(self, attr: str, ruleset: List[Validator]) -> List[str]:
+        lines = [f'# {attr}']
+        if self._stored(attr):
+            self.stored = True
+            lines += [
+                f'value = attributes.get({attr!r})',
+                'if type(value) is Lazy:',
+                f'    value = getattr(model, {attr!r}, None)',
+            ]
+        else:
+            lines.append(f'value = getattr(model, {attr!r}, None)')
+        if not ruleset:
+            return lines
+
+        if any(rule.required for rule in ruleset):
+            lines.append('if value is None:')
+            lines.extend('    ' + line for line in self.rules(attr, ruleset, True))
+            lines.append('else:')
+            lines.extend('    ' + line for line in self.rules(attr, ruleset, False))
+        else:
+            lines.extend(self.rules(attr, ruleset, False))
+        lines.append(f'errors[{attr!r}] = messages')
+        return lines
+
+    def rules(self, attr: str, ruleset: List[Validator], none: bool) -> List[str]:
+        """Return the checks of `ruleset`, knowing whether `value` is None."""
+        lines = ['messages = []']
+        results = {}
+        memo = False
+        for rule in ruleset:
+            if none and rule.required:
+                required = self.const(f'`{attr}` is a required field.')
+                lines += [f'messages.append({required})', 'valid = False']
+                continue
+
+            result = self.node(rule, results, lines)
+            if result is not None:
+                self.inlined.add(id(rule))
+                lines += [
+                    f'if {result} is not None:',
+                    '    valid = False',
+                    f'    messages.extend({result})',
+                ]
+                continue
+
+            self.fallback.add(id(rule))
+            if not memo:
+                lines.append('memo = {}')
+                memo = True
+            check = self.const(rule.check)
+            lines += [
+                f'result = {check}(value, memo)',
+                'valid &= result.valid',
+                'messages.extend(result.errors)',
+            ]
+        return lines
+
+    def node(self, rule: Any, results: Dict[Hashable, str], lines: List[str]) -> Union[str, None]:
+        """Append the checks of `rule` and of its dependencies to `lines`.
+
+        The result is stored in a local variable: None if the value is
+        valid, the tuple of error messages otherwise.
+
+        Returns:
+            str: the name of the variable, or None if `rule` or one of its
+            dependencies cannot be inlined
+
+        """
+        if not isinstance(rule, Validator) or rule._is_legacy() \
+                or type(rule).check is not Validator.check \
+                or type(rule).failure is not Validator.failure:
+            return None
+
+        key = rule.signature()
+        if key is not None and key in results:
+            return results[key]
+
+        inline = rule.inline(self.const)
+        if inline is None:
+            return None
+        condition, fields = inline
+
+        dependencies = []
+        for dependency in rule.dependencies():
+            name = self.node(dependency, results, lines)
+            if name is None:
+                return None
+            dependencies.append(name)
+
+        name = f'r{self.count}'
+        self.count += 1
+        message = self.const(rule.message)
+        arguments = ', '.join(f'{k}={v}' for k, v in fields.items())
+        branch = 'if'
+        if len(dependencies) == 1:
+            lines += [f'if {dependencies[0]} is not None:',
+                      f'    {name} = {dependencies[0]}']
+            branch = 'elif'
+        elif dependencies:
+            lines += [
+                'if ' + ' or '.join(f'{d} is not None' for d in dependencies) + ':',
+                f'    {name} = ' + ' + '.join(f'({d} or ())' for d in dependencies),
+            ]
+            branch = 'elif'
+        lines += [
+            f'{branch} {condition}:',
+            f'    {name} = ({message}.format({arguments}),)',
+            'else:',
+            f'    {name} = None',
+        ]
+        if key is not None:
+            results[key] = name
+        return name
+
+    def _stored(self, attr: str) -> bool:
+        """Return whether `getattr(model, attr)` reads the stored value."""
+        schema = self.schema
+        return schema is not None and attr in schema.names \
+            and attr not in schema.private \
+            and not any(attr in klass.__dict__ for klass in self.cls.__mro__)
+
+
+def _direct(cls: type) -> bool:
+    """Return whether instances of `cls` resolve properties with
+    `Object.__getattr__()` only."""
+    return cls.__getattribute__ is object.__getattribute__ \
+        and cls.__getattr__ is Object.__getattr__
@@ -0,0 +1,115 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+from typing import Any, Dict, Hashable, List, Tuple
+
+PATH = 'path'
+TYPED = 'typed'
+NESTED = 'nested'
+OBJECT = 'object'
+CALLABLE = 'callable'
+DEFAULT = 'default'
+
+
+class Schema(object):
+    """The compiled form of `Object.properties()` and `Object._properties()`.
+
+    A schema is computed once per class (or once per distinct `properties=`
+    keyword argument shape for plain objects) and shared by every instance,
+    so that attribute access is a set lookup instead of a rebuild of the
+    mapping dict.
+    """
+
+    max_size = 1024
+    _cache = {}
+
+    def __init__(self, properties: Dict[str, Any], private: List[str],
+                 fields: List[Tuple[str, str, Any, Any]], bound: bool = False):
+        """Initialize the schema.
+
+        Args:
+            properties (dict): the mapping returned by `Object.properties()`
+            private (list): the names returned by `Object._properties()`
+            fields (list): the compiled `(name, kind, source, extra)` tuples
+            in the order of `properties`
+            bound (bool): whether a callable of the properties refers to the
+            instance the schema was compiled from
+
+        """
+        self.properties = properties
+        self.private = frozenset(private)
+        self.names = frozenset(properties)
+        self.fields = tuple(fields)
+        self.types = {
+            k: v[1] for k, v in properties.items() if isinstance(v, tuple)
+        }
+        self.sources = _sources(self.fields)
+        self.bound = bound
+
+    @classmethod
+    def get(cls, key: Hashable) -> 'Schema':
+        """Return the cached schema for `key`, or None if not compiled yet.
+
+        Args:
+            key (Hashable): the key returned by `Object._schema_key()`
+
+        Returns:
+            Schema: the cached schema if any
+
+        """
+        return cls._cache.get(key)
+
+    @classmethod
+    def store(cls, key: Hashable, schema: 'Schema') -> 'Schema':
+        """Cache `schema` under `key` unless the cache is full.
+
+        Schemas bound to an instance are never cached: sharing them would
+        give every instance the values of the first one.
+
+        Args:
+            key (Hashable): the key returned by `Object._schema_key()`
+            schema (Schema): the compiled schema
+
+        Returns:
+            Schema: the schema passed as argument
+
+        """
+        if not schema.bound and len(cls._cache) < cls.max_size:
+            cls._cache[key] = schema
+        return schema
+
+    @classmethod
+    def clear(cls):
+        """Drop every cached schema.
+
+        Returns:
+            void
+
+        """
+        cls._cache.clear()
+
+
+def _sources(fields: Tuple[Tuple[str, str, Any, Any], ...]) -> frozenset:
+    """Return the top-level keys of the input the fields read.
+
+    Nested objects built from the whole input (`OBJECT`) are not counted:
+    they keep what they need themselves. Returns None if a field may read
+    any key.
+    """
+    keys = set()
+    for name, kind, source, _ in fields:
+        if kind == DEFAULT:
+            keys.add(name)
+        elif kind in (PATH, TYPED, NESTED) and hasattr(source, 'segments'):
+            key = source.segments[0][0]
+            if key == '*':
+                return None
+            keys.add(key)
+    return frozenset(keys)
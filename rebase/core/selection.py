@@ -0,0 +1,265 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Dict, Iterator, Tuple, Union
+from rebase.core.lazy import Lazy
+from rebase.core.path import MISSING, WILDCARD
+
+EXCLUDED = object()
+
+
+class Selection(object):
+    """Include and exclude paths such as `'location.city'`, `'rooms.*.price'`
+    or `'-mother'`, compiled once into trees.
+
+    An include tree maps each key to the tree of its selected children, or
+    to True when the whole value is selected; None selects everything. An
+    exclude tree is built the same way from the paths starting with `-`.
+    """
+
+    max_size = 1024
+    _cache = {}
+
+    def __init__(self, paths: Tuple[str, ...]):
+        """Initialize the selection.
+
+        Prefer `Selection.get()` which reuses already compiled selections.
+
+        Args:
+            paths (tuple): the paths, excluded when starting with `-`
+
+        """
+        include, exclude = {}, {}
+        for path in paths:
+            if path.startswith('-'):
+                _add(exclude, path[1:].split('.'))
+            elif path:
+                _add(include, path.split('.'))
+        self.paths = paths
+        self.include = include or None
+        self.exclude = exclude or None
+
+    def __repr__(self) -> str:
+        return f'Selection({self.paths!r})'
+
+    @classmethod
+    def get(cls, paths: Tuple[Any, ...]) -> Union['Selection', None]:
+        """Return the compiled selection of `paths`.
+
+        Args:
+            paths (tuple): the arguments of `Object.get()`
+
+        Returns:
+            Selection: the selection, or None if `paths` are only names of
+            attributes to include, which `Object.get()` handles itself
+
+        """
+        try:
+            selection = cls._cache.get(paths, MISSING)
+        except TypeError:
+            return None
+        if selection is MISSING:
+            selection = None
+            if any(type(p) is str and ('.' in p or p.startswith('-'))
+                   for p in paths):
+                selection = cls(paths)
+            if len(cls._cache) < cls.max_size:
+                cls._cache[paths] = selection
+        return selection
+
+    def apply(self, fields: Dict[str, Any],
+              serialize: Callable[[Any], Any]) -> Dict[str, Any]:
+        """Return the selected branches of `fields`, serialized.
+
+        Only the selected branches are walked; selected values are
+        serialized with `serialize`, as `Object.get()` does.
+
+        Args:
+            fields (dict): the attributes of an object, as stored
+            serialize (callable): the serializer of selected values
+
+        Returns:
+            dict: the selected attributes
+
+        """
+        return _select(fields, self.include, self.exclude, serialize)
+
+
+class View(Mapping):
+    """A read-only mapping over the selected attributes of an object.
+
+    Nothing is copied or serialized: nested objects and dicts are returned
+    as views and lists as `SequenceView`s, resolved on access, and other
+    values as they are stored. Views are live: they reflect later changes
+    of the object.
+    """
+
+    __slots__ = ('_fields', '_include', '_exclude')
+
+    def __init__(self, fields: Any, include: Dict[str, Any] = None,
+                 exclude: Dict[str, Any] = None):
+        """Initialize the view.
+
+        Args:
+            fields (Object|dict): the object or dict to view
+            include (dict): the include tree, None for everything
+            exclude (dict): the exclude tree, None for nothing
+
+        """
+        self._fields = _fields(fields)
+        self._include = include
+        self._exclude = exclude
+
+    def __getitem__(self, key: str) -> Any:
+        include = _include(self._include, key)
+        exclude = _exclude(self._exclude, key)
+        if include is MISSING or exclude is EXCLUDED:
+            raise KeyError(key)
+        return _view(self._fields[key], include, exclude)
+
+    def __iter__(self) -> Iterator[str]:
+        include, exclude = self._include, self._exclude
+        for key in self._fields:
+            if _include(include, key) is not MISSING \
+                    and _exclude(exclude, key) is not EXCLUDED:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f'View({dict(self)!r})'
+
+
+class SequenceView(Sequence):
+    """A read-only sequence over the selected elements of a list, see
+    `View`."""
+
+    __slots__ = ('_items', '_indices', '_include', '_exclude')
+
+    def __init__(self, items: Sequence, include: Dict[str, Any] = None,
+                 exclude: Dict[str, Any] = None):
+        self._items = items
+        self._include = include
+        self._exclude = exclude
+        self._indices = [
+            i for i in range(len(items))
+            if _include(include, str(i)) is not MISSING
+            and _exclude(exclude, str(i)) is not EXCLUDED
+        ]
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        i = self._indices[index]
+        return _view(self._items[i], _include(self._include, str(i)),
+                     _exclude(self._exclude, str(i)))
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __repr__(self) -> str:
+        return f'SequenceView({list(self)!r})'
+
+
+def _add(tree: Dict[str, Any], keys: list):
+    for key in keys[:-1]:
+        child = tree.get(key)
+        if child is True:
+            return
+        if child is None:
+            child = tree[key] = {}
+        tree = child
+    tree[keys[-1]] = True
+
+
+def _merge(a: Any, b: Any) -> Any:
+    if a is None or b is None:
+        return a if b is None else b
+    if a is True or b is True:
+        return True
+    merged = dict(a)
+    for key, child in b.items():
+        merged[key] = _merge(merged.get(key), child)
+    return merged
+
+
+def _include(tree: Union[Dict[str, Any], None], key: str) -> Any:
+    """Return the include tree of `key`: None for everything, MISSING if
+    `key` is not selected."""
+    if tree is None:
+        return None
+    child = _merge(tree.get(key), tree.get(WILDCARD))
+    if child is None:
+        return MISSING
+    return None if child is True else child
+
+
+def _exclude(tree: Union[Dict[str, Any], None], key: str) -> Any:
+    """Return the exclude tree of `key`: None for nothing, EXCLUDED if the
+    whole value of `key` is excluded."""
+    if tree is None:
+        return None
+    child = _merge(tree.get(key), tree.get(WILDCARD))
+    return EXCLUDED if child is True else child
+
+
+def _fields(value: Any) -> Any:
+    """Return the mapping to walk for an object, dict or lazy object."""
+    if type(value) is Lazy:
+        value = value.materialize()
+    if hasattr(type(value), '_json_fields'):
+        return value._json_fields()
+    return value
+
+
+def _select(value: Any, include: Any, exclude: Any,
+            serialize: Callable[[Any], Any]) -> Any:
+    if include is None and exclude is None:
+        return serialize(value)
+
+    value = _fields(value)
+    if isinstance(value, dict):
+        selected = {}
+        for key, item in value.items():
+            child_include = _include(include, key)
+            child_exclude = _exclude(exclude, key)
+            if child_include is MISSING or child_exclude is EXCLUDED:
+                continue
+            item = _select(item, child_include, child_exclude, serialize)
+            if item is not MISSING:
+                selected[key] = item
+        return selected
+
+    if isinstance(value, (list, tuple)):
+        selected = []
+        for i, item in enumerate(value):
+            child_include = _include(include, str(i))
+            child_exclude = _exclude(exclude, str(i))
+            if child_include is MISSING or child_exclude is EXCLUDED:
+                continue
+            item = _select(item, child_include, child_exclude, serialize)
+            if item is not MISSING:
+                selected.append(item)
+        return selected
+
+    # a path going deeper than the value selects nothing, as with `Path`
+    return MISSING if include is not None else serialize(value)
+
+
+def _view(value: Any, include: Any, exclude: Any) -> Any:
+    if type(value) is Lazy:
+        value = value.materialize()
+    if isinstance(value, dict) or hasattr(type(value), '_json_fields'):
+        return View(value, include, exclude)
+    if isinstance(value, (list, tuple)):
+        return SequenceView(value, include, exclude)
+    return value
@@ -0,0 +1,265 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+from collections.abc import MutableMapping
+from operator import attrgetter
+from types import FunctionType
+from typing import Any, Dict, Iterator
+from rebase.core import Object, MISSING
+from rebase.core.lazy import Lazy
+from rebase.core.schema import NESTED, OBJECT
+
+SLOT_PREFIX = '_slot_'
+
+
+class Field(property):
+    """A data descriptor storing one mapped property in a slot.
+
+    Reads go straight to the slot (unless the value may be a `Lazy` nested
+    object); writes enforce the type declared with a `(source, type)` tuple
+    in `Object.properties()` the same way `Object.__setattr__` does.
+    """
+
+    def __init__(self, name: str, slot: Any, data_type: Any = MISSING,
+                 lazy: bool = False):
+        """Initialize the field.
+
+        Args:
+            name (string): the name of the mapped property
+            slot (member_descriptor): the slot holding the value
+            data_type (Any): the type to enforce on assignment, if any
+            lazy (bool): whether the slot may hold a `Lazy` nested object
+
+        """
+        super().__init__(
+            self._get if lazy else attrgetter(slot.__name__),
+            self._set,
+            self._delete
+        )
+        self.name = name
+        self.slot = slot
+        self.data_type = data_type
+
+    def _get(self, obj: Object) -> Any:
+        value = self.slot.__get__(obj)
+        if type(value) is Lazy:
+            value = value.materialize()
+            self.slot.__set__(obj, value)
+            obj._invalidate()
+        return value
+
+    def _set(self, obj: Object, value: Any):
+        data_type = self.data_type
+        if data_type is not MISSING and value is not None \
+                and type(value) != data_type:
+            raise AttributeError(
+                f'`Value for {obj.classname}.{self.name}` should be of type {data_type}; {type(value)} provided.')
+        self.slot.__set__(obj, value)
+        obj._changed(self.name)
+
+    def _delete(self, obj: Object):
+        self.slot.__delete__(obj)
+
+
+class SlotAttributes(MutableMapping):
+    """A mapping view over the slots of a `slotted` object.
+
+    It stands in for the `_attributes` dict of dict-backed objects so that
+    the rest of `rebase.core.Object` keeps working unchanged.
+    """
+
+    __slots__ = ('_obj', '_fields')
+
+    def __init__(self, obj: Object, fields: Dict[str, Field]):
+        self._obj = obj
+        self._fields = fields
+
+    def __getitem__(self, key: str) -> Any:
+        field = self._fields.get(key)
+        if field is None:
+            raise KeyError(key)
+        try:
+            return field.slot.__get__(self._obj)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any):
+        field = self._fields.get(key)
+        if field is None:
+            raise KeyError(key)
+        field.slot.__set__(self._obj, value)
+
+    def __delitem__(self, key: str):
+        field = self._fields.get(key)
+        if field is None:
+            raise KeyError(key)
+        try:
+            field.slot.__delete__(self._obj)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        obj = self._obj
+        for key, field in self._fields.items():
+            if hasattr(obj, field.slot.__name__):
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+def _get_attributes(self) -> SlotAttributes:
+    return SlotAttributes(self, self._fields)
+
+
+def _set_attributes(self, attributes: Dict[str, Any]):
+    view = SlotAttributes(self, self._fields)
+    view.clear()
+    view.update(attributes)
+
+
+def _rebind_class_cell(value: Any, old: type, new: type) -> Any:
+    """Return `value` with the `__class__` cell used by zero-argument
+    `super()` pointing to `new`.
+
+    Functions are copied with a new closure rather than updated in place, as
+    their cells are shared with the methods of `old`.
+    """
+    if isinstance(value, (classmethod, staticmethod)):
+        func = _rebind_class_cell(value.__func__, old, new)
+        return value if func is value.__func__ else type(value)(func)
+    if isinstance(value, property):
+        funcs = [
+            _rebind_class_cell(func, old, new)
+            for func in (value.fget, value.fset, value.fdel)
+        ]
+        if funcs == [value.fget, value.fset, value.fdel]:
+            return value
+        return value.getter(funcs[0]).setter(funcs[1]).deleter(funcs[2])
+    if not isinstance(value, FunctionType) or not value.__closure__:
+        return value
+
+    code = value.__code__
+    closure = tuple(
+        _cell(new) if name == '__class__' and cell.cell_contents is old else cell
+        for name, cell in zip(code.co_freevars, value.__closure__)
+    )
+    if all(a is b for a, b in zip(closure, value.__closure__)):
+        return value
+    func = FunctionType(code, value.__globals__, value.__name__,
+                        value.__defaults__, closure)
+    func.__kwdefaults__ = value.__kwdefaults__
+    func.__annotations__ = value.__annotations__
+    func.__qualname__ = value.__qualname__
+    func.__module__ = value.__module__
+    func.__doc__ = value.__doc__
+    func.__dict__.update(value.__dict__)
+    return func
+
+
+def _cell(value: Any) -> Any:
+    """Return a closure cell holding `value`."""
+    return (lambda: value).__closure__[0]
+
+
+def slotted(cls: type) -> type:
+    """Generate a `__slots__` version of an `Object` subclass.
+
+    Every property mapped in `properties()` gets its own slot and `Field`
+    descriptor, so instances carry neither an `_attributes` dict nor an
+    instance `__dict__` (as long as every base class declares `__slots__`,
+    which `Object`, `Model` and `Validator` do) and reads bypass
+    `Object.__getattr__`. Unless the class or one of its bases sets
+    `keep_raw`, the generated class does not keep the raw input either
+    (`keep_raw = False`), so that its `repr()` is empty.
+
+    ```python
+    @slotted
+    class Hotel(Model):
+        def properties(self):
+            return {'name': 'name', 'stars': ('rating.stars', int)}
+    ```
+
+    Args:
+        cls (type): a subclass of `rebase.core.Object` with a static
+        `properties()`
+
+    Returns:
+        type: the generated class
+
+    Raises:
+        TypeError: If the class cannot be slotted
+
+    """
+    if not (isinstance(cls, type) and issubclass(cls, Object)):
+        raise TypeError(f'{cls!r} is not a subclass of rebase.core.Object.')
+    if cls.dynamic_properties or cls.properties is Object.properties:
+        raise TypeError(
+            f'{cls.__name__} needs a static `properties()` to be slotted.')
+
+    probe = cls.__new__(cls)
+    object.__setattr__(probe, '_raw_attributes', {})
+    schema = probe._compile_schema()
+
+    inherited = set()
+    for base in cls.__mro__[1:]:
+        inherited.update(base.__dict__)
+
+    for name in schema.names:
+        if not name.isidentifier() or name.startswith('__'):
+            raise TypeError(
+                f'Property `{cls.__name__}.{name}` is not a valid slot name.')
+        if name in inherited or name in cls.__dict__:
+            raise TypeError(
+                f'Property `{cls.__name__}.{name}` shadows a class attribute.')
+
+    slots = [SLOT_PREFIX + name for name in schema.properties]
+    slots += [
+        name for name in schema.private
+        if name not in inherited and not name.startswith('__')
+    ]
+
+    namespace = {
+        k: v for k, v in cls.__dict__.items()
+        if k not in ('__dict__', '__weakref__')
+    }
+    namespace['__slots__'] = tuple(slots)
+    if not any('keep_raw' in base.__dict__ for base in cls.__mro__[:-1]
+               if base is not Object):
+        namespace['keep_raw'] = False
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+
+    nested = {
+        name for name, kind, _, _ in schema.fields if kind in (NESTED, OBJECT)
+    }
+    fields = {
+        name: Field(
+            name,
+            new_cls.__dict__[SLOT_PREFIX + name],
+            schema.types.get(name, MISSING),
+            cls.lazy_nested and name in nested
+        )
+        for name in schema.properties
+    }
+    for name, field in fields.items():
+        setattr(new_cls, name, field)
+    new_cls._fields = fields
+    new_cls._attributes = property(_get_attributes, _set_attributes)
+    new_cls.__setattr__ = object.__setattr__
+
+    for name, value in namespace.items():
+        rebound = _rebind_class_cell(value, cls, new_cls)
+        if rebound is not value:
+            setattr(new_cls, name, rebound)
+
+    return new_cls
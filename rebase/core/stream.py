@@ -0,0 +1,164 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import os
+import time
+import simplejson as json
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, NamedTuple,
+                    Tuple, Union)
+
+Source = Union[str, bytes, os.PathLike, Iterable[Union[bytes, str]]]
+
+
+class Progress(NamedTuple):
+    """A snapshot of the progress of `iter_validate()`."""
+
+    rows: int
+    invalid: int
+    bytes: int
+    elapsed: float
+
+    @property
+    def rate(self) -> float:
+        """The number of rows processed per second."""
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+def iter_lines(source: Source) -> Iterator[Union[bytes, str]]:
+    """Yield the lines of a file, or of any iterable of lines, one by one.
+
+    Args:
+        source (str|PathLike|Iterable): a file path, or an iterable of bytes
+        or str lines such as an open file or a socket reader
+
+    Returns:
+        Iterator: the lines, read lazily
+
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, 'rb') as f:
+            yield from f
+    else:
+        yield from source
+
+
+def iter_records(source: Source) -> Iterator[Dict[str, Any]]:
+    """Decode a JSON Lines input one record at a time.
+
+    Blank lines are skipped.
+
+    Args:
+        source (str|PathLike|Iterable): see `iter_lines()`
+
+    Returns:
+        Iterator: the decoded records
+
+    Raises:
+        ValueError: If a line is not valid JSON
+
+    """
+    for number, line in enumerate(iter_lines(source), 1):
+        if line.strip():
+            yield _decode(line, number)
+
+
+def iter_validate(model_class: type, source: Source,
+                  skip_invalid: bool = False,
+                  invalid: Callable[[Any, Dict[Any, List[str]]], Any] = None,
+                  progress: Callable[[Progress], Any] = None,
+                  progress_every: int = 10000, attributes: bool = False,
+                  **kwargs) -> Iterator[Tuple[Any, Dict[str, List[str]]]]:
+    """Build and validate `model_class` from a JSON Lines input, lazily.
+
+    Only one line and one model are held at a time, so memory stays constant
+    whatever the size of the input.
+
+    Args:
+        model_class (type): a subclass of `rebase.core.Model`
+        source (str|PathLike|Iterable): see `iter_lines()`
+        skip_invalid (bool): drop the invalid rows instead of yielding them
+        invalid (callable): called with `(model, errors)` for every invalid
+        row, which is then not yielded
+        progress (callable): called with a `Progress` every `progress_every`
+        rows and once at the end
+        progress_every (int): the number of rows between two `progress` calls
+        attributes (bool): yield the `attributes` of the models instead of
+        the models
+        **kwargs: arguments passed to the constructor of every model
+
+    Returns:
+        Iterator: `(model, errors)` tuples, where `errors` is empty if the
+        model is valid
+
+    Raises:
+        ValueError: If a line is not a valid JSON object, unless
+        `skip_invalid` or `invalid` is set, in which case the line is an
+        invalid row with the decoding error under the `None` key
+
+    """
+    routed = skip_invalid or invalid is not None
+    stats = [0, 0, 0]
+    started = time.perf_counter()
+
+    def report():
+        progress(Progress(stats[0], stats[1], stats[2],
+                          time.perf_counter() - started))
+
+    def reject(row, errors):
+        if invalid is not None:
+            invalid(row, errors)
+
+    def records():
+        for number, line in enumerate(iter_lines(source), 1):
+            stats[2] += len(line)
+            if not line.strip():
+                continue
+
+            stats[0] += 1
+            try:
+                record = _decode(line, number)
+                if not isinstance(record, dict):
+                    raise ValueError(f'Line {number} is not a JSON object.')
+            except ValueError as e:
+                if not routed:
+                    raise
+                stats[1] += 1
+                reject(line, {None: [str(e)]})
+                if progress is not None and not stats[0] % progress_every:
+                    report()
+            else:
+                yield record
+
+    for model in model_class.from_records(records(), lazy=True, **kwargs):
+        row = model.attributes if attributes else model
+        if model.validate():
+            result = (row, {})
+        else:
+            stats[1] += 1
+            result = (row, model.get_errors())
+            if routed:
+                reject(*result)
+                result = None
+
+        if progress is not None and not stats[0] % progress_every:
+            report()
+
+        if result is not None:
+            yield result
+
+    if progress is not None:
+        report()
+
+
+def _decode(line: Union[bytes, str], number: int) -> Dict[str, Any]:
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        raise ValueError(f'Line {number} is not valid JSON: {e}') from None
@@ -0,0 +1,367 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import csv
+import os
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Sequence,
+                    Union)
+from rebase.core import ModelBatch, Object, Path
+from rebase.core.object import _default_properties
+from rebase.core.schema import Schema, PATH, TYPED
+
+TRUE = frozenset(('true', 't', 'yes', 'y', '1', 'on'))
+FALSE = frozenset(('false', 'f', 'no', 'n', '0', 'off'))
+
+
+class ConversionError(ValueError):
+    """A cell of a delimited input which its column converter rejected."""
+
+    def __init__(self, row: int, column: int, name: str, value: str,
+                 reason: str):
+        """Initialize the error.
+
+        Args:
+            row (int): the line of the input, starting at 1 with the header
+            column (int): the position of the column, starting at 0
+            name (string): the name of the column
+            value (string): the rejected cell
+            reason (string): the message of the converter
+
+        """
+        super().__init__(
+            f'Row {row}, column {column} (`{name}`): cannot convert '
+            f'{value!r}: {reason}')
+        self.row = row
+        self.column = column
+        self.name = name
+        self.value = value
+
+
+def to_bool(value: str) -> bool:
+    """Parse `true`/`false`, `yes`/`no`, `1`/`0` and the like."""
+    lowered = value.strip().lower()
+    if lowered in TRUE:
+        return True
+    if lowered in FALSE:
+        return False
+    raise ValueError('not a boolean')
+
+
+def to_decimal(value: str) -> Decimal:
+    """Parse a decimal, raising `ValueError` like the other converters."""
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise ValueError('not a decimal') from None
+
+
+CONVERTERS = {
+    bool: to_bool,
+    Decimal: to_decimal,
+    str: None,
+}
+
+
+class TableLoader(object):
+    """Build objects from CSV, TSV or any delimited input.
+
+    The columns are bound once to the source keys of `properties()`: a
+    column binds to the property whose source path is the column name,
+    dotted or not (`'rating.stars'`). Each bound column is converted in
+    bulk, chunk by chunk, with the type of the property (`int`, `float`,
+    `bool`, `Decimal` or any callable), or with an explicit converter.
+    Bound values are assigned directly, without going through
+    `_enforce_data_type()`; other properties are mapped from the row as
+    usual.
+
+    ```python
+    loader = TableLoader(Hotel, converters={'price': Decimal}, on_error='skip')
+    for hotel in loader.load('hotels.csv'):
+        ...
+    print(loader.errors)
+    ```
+    """
+
+    def __init__(self, model_class: type, delimiter: str = ',',
+                 converters: Dict[str, Callable[[str], Any]] = None,
+                 null_values: Iterable[str] = ('',), on_error: str = 'raise',
+                 chunk_size: int = 1000, encoding: str = 'utf-8', **kwargs):
+        """Initialize the loader.
+
+        Args:
+            model_class (type): the subclass of `rebase.core.Object` to build
+            delimiter (string): the column separator, `'\\t'` for TSV
+            converters (dict): converters by column name, taking precedence
+            over the types of `properties()`
+            null_values (Iterable): the cells converted to None in converted
+            columns
+            on_error (string): `'raise'` the first `ConversionError`, or
+            collect them in `errors` and `'skip'` the row or `'keep'` the
+            unconverted cell
+            chunk_size (int): the number of rows converted at once
+            encoding (string): the encoding of files opened by path
+            **kwargs: arguments passed to the constructor of every object
+
+        Raises:
+            ValueError: If `on_error` is unknown
+
+        """
+        if on_error not in ('raise', 'skip', 'keep'):
+            raise ValueError(
+                f'Unknown on_error `{on_error}`; use raise, skip or keep.')
+        self.model_class = model_class
+        self.delimiter = delimiter
+        self.converters = converters or {}
+        self.null_values = frozenset(null_values)
+        self.on_error = on_error
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        self.kwargs = kwargs
+        self.errors = []
+
+    def load(self, source: Union[str, os.PathLike, Iterable[str]],
+             header: Sequence[str] = None) -> Iterator[Object]:
+        """Yield one object per row of `source`.
+
+        Args:
+            source (str|PathLike|Iterable): a file path, or a text file or
+            any iterable of lines
+            header (Sequence): the column names, read from the first row if
+            not given
+
+        Returns:
+            Iterator: the objects, in the order of the rows
+
+        Raises:
+            ConversionError: If a cell cannot be converted and `on_error`
+            is `'raise'`
+
+        """
+        for chunk in self._chunks(source, header):
+            yield from chunk[0]
+
+    def load_batch(self, source: Union[str, os.PathLike, Iterable[str]],
+                   header: Sequence[str] = None) -> ModelBatch:
+        """Return a `ModelBatch` of every row of `source`.
+
+        The converted columns are handed to the batch as they are, so that
+        `ModelBatch.column()` does not read them back from the models.
+
+        Takes the same arguments as `load()`.
+
+        Returns:
+            ModelBatch: the batch
+
+        """
+        objects, columns = [], {}
+        for chunk, chunk_columns in self._chunks(source, header):
+            objects.extend(chunk)
+            for name, values in chunk_columns.items():
+                columns.setdefault(name, []).extend(values)
+        return ModelBatch(objects, {
+            name: ModelBatch.to_column(values)
+            for name, values in columns.items()
+        })
+
+    def _chunks(self, source, header):
+        self.errors = []
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, newline='', encoding=self.encoding) as f:
+                yield from self._read(csv.reader(f, delimiter=self.delimiter),
+                                      header)
+        else:
+            yield from self._read(
+                csv.reader(source, delimiter=self.delimiter), header)
+
+    def _read(self, reader, header):
+        if header is None:
+            header = next(reader, None)
+            if header is None:
+                return
+        header = list(header)
+        plan = self._bind(header)
+        width = len(header)
+
+        while True:
+            rows = []
+            lines = []
+            read = 0
+            for row in islice(reader, self.chunk_size):
+                read += 1
+                if not row:
+                    continue
+                if len(row) != width:
+                    error = ConversionError(
+                        reader.line_num, min(len(row), width), '', row,
+                        f'expected {width} columns, got {len(row)}')
+                    if self.on_error == 'raise':
+                        raise error
+                    self.errors.append(error)
+                    continue
+                rows.append(row)
+                lines.append(reader.line_num)
+            if not read:
+                return
+            if rows:
+                yield self._build(header, plan, rows, lines)
+
+    def _bind(self, header: List[str]):
+        """Return the `(property, column, converter)` bindings and the
+        schema of the properties left to map from the row."""
+        cls = self.model_class
+        if cls.properties is _default_properties:
+            # the properties are the keys of each row
+            return None
+        probe = cls.__new__(cls)
+        object.__setattr__(probe, '_raw_attributes', {})
+        schema = probe._get_schema() if not cls.dynamic_properties else None
+        if schema is None or schema.bound or not cls._can_init_record():
+            return None
+
+        positions = {name: i for i, name in enumerate(header)}
+        bound, rest = [], []
+        for field in schema.fields:
+            name, kind, source, extra = field
+            column = positions.get(source.path) \
+                if kind in (PATH, TYPED) and isinstance(source, Path) else None
+            if column is None:
+                rest.append(field)
+                continue
+            if header[column] in self.converters:
+                converter = self.converters[header[column]]
+            elif kind == TYPED:
+                converter = CONVERTERS.get(extra, extra) \
+                    if callable(extra) else None
+            else:
+                converter = None
+            bound.append((name, column, converter))
+
+        remaining = Schema(schema.properties, schema.private, rest)
+        # the raw row is released against every source, bound ones included
+        remaining.sources = schema.sources
+        return schema, bound, remaining
+
+    def _convert(self, header, column, converter, cells, lines):
+        nulls = self.null_values
+        try:
+            return [None if c in nulls else converter(c) for c in cells]
+        except (ValueError, TypeError, ArithmeticError):
+            pass
+
+        values = []
+        for line, cell in zip(lines, cells):
+            try:
+                values.append(None if cell in nulls else converter(cell))
+            except (ValueError, TypeError, ArithmeticError) as e:
+                error = ConversionError(
+                    line, column, header[column], cell, str(e) or type(e).__name__)
+                if self.on_error == 'raise':
+                    raise error
+                self.errors.append(error)
+                values.append(error)
+        return values
+
+    def _build(self, header, plan, rows, lines):
+        if plan is None:
+            records = [_nest(header, row) for row in rows]
+            objects = self.model_class.from_records(records, **self.kwargs)
+            return objects, {}
+
+        schema, bound, remaining = plan
+        cells = list(zip(*rows))
+        columns = {}
+        for name, column, converter in bound:
+            if converter is None:
+                columns[name] = list(cells[column])
+            else:
+                columns[name] = self._convert(
+                    header, column, converter, cells[column], lines)
+
+        skip = set()
+        for name, column, _ in bound:
+            values = columns[name]
+            for i, value in enumerate(values):
+                if type(value) is ConversionError:
+                    if self.on_error == 'skip':
+                        skip.add(i)
+                    else:
+                        values[i] = cells[column][i]
+        if skip:
+            columns = {
+                name: [v for i, v in enumerate(values) if i not in skip]
+                for name, values in columns.items()
+            }
+            rows = [row for i, row in enumerate(rows) if i not in skip]
+
+        cls, kwargs = self.model_class, self.kwargs
+        names = list(columns)
+        order = list(schema.properties)
+        new, setattr_ = cls.__new__, object.__setattr__
+        track = cls.track_changes
+        objects = []
+        for i, row in enumerate(rows):
+            obj = new(cls)
+            obj._init_record(dict(zip(header, row)), remaining, **kwargs)
+            setattr_(obj, '_schema', schema)
+            attributes = obj._attributes
+            values = zip(names, [columns[name][i] for name in names])
+            if not remaining.fields:
+                attributes.update(values)
+            else:
+                mapped = {**attributes, **dict(values)}
+                attributes.clear()
+                attributes.update((n, mapped[n]) for n in order if n in mapped)
+            if track:
+                # the checkpoint of `_init_record` misses the bound columns
+                obj.checkpoint()
+            objects.append(obj)
+        return objects, columns
+
+
+def _nest(header: List[str], row: List[str]) -> Dict[str, Any]:
+    """Return a row as a record, dotted column names as nested dicts."""
+    record = {}
+    for name, cell in zip(header, row):
+        *parents, key = name.split('.')
+        target = record
+        for parent in parents:
+            target = target.setdefault(parent, {})
+            if not isinstance(target, dict):
+                break
+        else:
+            target[key] = cell
+            continue
+        record[name] = cell
+    return record
+
+
+def read_csv(model_class: type, source: Union[str, os.PathLike, Iterable[str]],
+             **options) -> Iterator[Object]:
+    """Yield one object per row of a CSV input, see `TableLoader`.
+
+    Args:
+        model_class (type): the subclass of `rebase.core.Object` to build
+        source (str|PathLike|Iterable): a file path, or a text file or any
+        iterable of lines
+        **options: the arguments of `TableLoader`
+
+    Returns:
+        Iterator: the objects
+
+    """
+    return TableLoader(model_class, **options).load(source)
+
+
+def read_tsv(model_class: type, source: Union[str, os.PathLike, Iterable[str]],
+             **options) -> Iterator[Object]:
+    """Yield one object per row of a tab-separated input, see `read_csv()`."""
+    return TableLoader(model_class, delimiter='\t', **options).load(source)
@@ -0,0 +1,34 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+from typing import Any, NamedTuple, Tuple
+
+
+class ValidationResult(NamedTuple):
+    """The immutable outcome of `Validator.check()`.
+
+    Attributes:
+        valid (bool): whether the value complies with the validator
+        errors (tuple): the error messages, empty if the value is valid
+
+    """
+
+    valid: bool
+    errors: Tuple[Any, ...] = ()
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+    def __and__(self, other: 'ValidationResult') -> 'ValidationResult':
+        return ValidationResult(
+            self.valid and other.valid, self.errors + other.errors)
+
+
+VALID = ValidationResult(True)
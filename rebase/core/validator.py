@@ -4,17 +4,79 @@
 # License: Apache 2.0
 # Source: https://github.com/trivago/rebase
 # Version: 1.2.2
-# Python Version: 3.6
+# Python Version: 3.7
 # Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
 """
 
-from rebase.core import Object
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from rebase.core import Object, profiling
+from rebase.core.validation_result import ValidationResult, VALID
+
+INVALID = ValidationResult(False)
+
+
+class ErrorBudget(object):
+    """The limits of a `Model.validate()` call in fail-fast or budget mode.
+
+    The budget is shared by the nested models validated through
+    `NestedValidator`, so that the whole tree stops after `max_errors`
+    failed rules.
+    """
+
+    __slots__ = ('remaining', 'messages')
+
+    def __init__(self, max_errors: int = None, messages: bool = True):
+        """Initialize the budget.
+
+        Args:
+            max_errors (int): the number of failed rules after which the
+            validation stops, 1 when `messages` is False
+            messages (bool): whether error messages are formatted
+
+        """
+        self.remaining = max_errors if messages else 1
+        self.messages = messages
+
+    @property
+    def exhausted(self) -> bool:
+        """bool: Whether the validation must stop."""
+        return self.remaining is not None and self.remaining <= 0
+
+    def spend(self):
+        """Count one failed rule.
+
+        Returns:
+            void
+
+        """
+        if self.remaining is not None:
+            self.remaining -= 1
+
+
+_budget = ContextVar('rebase_error_budget', default=None)
 
 
 class Validator(Object):
+    __slots__ = ('_dependencies', '_signature')
+
+    cost = 10
+    """int: The relative cost of `check()`.
+
+    In fail-fast and budget modes (see `Model.validate()`), `Model` runs the
+    cheapest rules first; type checks cost 1, nested models 100.
+    """
+
     def __init__(self, **attributes):
+        object.__setattr__(self, '_dependencies', None)
+        object.__setattr__(self, '_signature', None)
         super().__init__(**attributes)
 
+    def _init_state(self, values, state):
+        object.__setattr__(self, '_dependencies', None)
+        object.__setattr__(self, '_signature', None)
+        super()._init_state(values, state)
+
     def properties(self):
         return {
             'errors': [],
@@ -23,14 +85,282 @@ class Validator(Object):
         }
 
     def validate(self, value):
-        is_valid = True
+        """Validate a value, keeping the error messages in `errors`.
+
+        This stateful method is kept for compatibility; prefer `check()`,
+        which is safe to call on a validator shared between threads.
+
+        Args:
+            value (Any): the value to validate
+
+        Returns:
+            bool: whether the value is valid
+
+        """
+        result = self._check(value)
         self.errors.clear()
+        self.errors.extend(result.errors)
+        return result.valid
+
+    def check(self, value, memo: Dict[Hashable, ValidationResult] = None) -> ValidationResult:
+        """Validate a value without changing the validator.
+
+        Args:
+            value (Any): the value to validate
+            memo (dict): the results already computed for this value, keyed
+            by `Validator.signature()`, used to check each distinct
+            dependency once
+
+        Returns:
+            ValidationResult: the validity and error messages
+
+        """
+        key = None
+        if memo is not None:
+            key = self.signature()
+            if key is not None:
+                hit = key in memo
+                if profiling.enabled:
+                    profiling.count('memo', hit)
+                if hit:
+                    return memo[key]
+
+        if self._is_legacy():
+            valid = self.validate(value)
+            result = ValidationResult(valid, tuple(self.errors))
+        else:
+            result = self._check(value, memo)
+
+        if key is not None:
+            memo[key] = result
+        return result
+
+    async def acheck(self, value, memo: Dict[Hashable, ValidationResult] = None) -> ValidationResult:
+        """Validate a value from a coroutine.
+
+        Synchronous validators simply return `check()`; `AsyncValidator`
+        and `NestedValidator` override it to await their I/O or children.
+
+        Args:
+            value (Any): the value to validate
+            memo (dict): see `Validator.check()`
+
+        Returns:
+            ValidationResult: the validity and error messages
+
+        """
+        return self.check(value, memo)
+
+    def _check(self, value, memo: Dict[Hashable, ValidationResult] = None) -> ValidationResult:
+        """Return the result of the validation of `value`.
+
+        Subclasses override this method to add their own checks after those
+        of their parent and dependencies, without changing any state.
+
+        Args:
+            value (Any): the value to validate
+            memo (dict): see `Validator.check()`
+
+        Returns:
+            ValidationResult: the validity and error messages
+
+        """
+        result = VALID
+        stop = _budget.get() is not None
+        for validator in self.dependencies():
+            result &= Validator.result(validator, value, memo)
+            if stop and not result:
+                break
+        return result
+
+    def failure(self, **fields) -> ValidationResult:
+        """Return an invalid result with `message` formatted with `fields`.
+
+        The message is not formatted when the current `Model.validate()` call
+        only needs a boolean.
 
-        for validator in self.depends_on():
-            is_valid &= validator.validate(value)
-            self.errors += validator.errors
+        Args:
+            **fields: the values of the placeholders of `message`
 
-        return is_valid
+        Returns:
+            ValidationResult: the invalid result
+
+        """
+        budget = _budget.get()
+        if budget is not None and not budget.messages:
+            return INVALID
+        return ValidationResult(False, (self.message.format(**fields),))
+
+    @staticmethod
+    def budget() -> ErrorBudget:
+        """Return the budget of the `Model.validate()` call in progress.
+
+        Returns:
+            ErrorBudget: the budget, or None when validating every rule
+
+        """
+        return _budget.get()
+
+    @staticmethod
+    def result(validator: Any, value: Any,
+               memo: Dict[Hashable, ValidationResult] = None) -> ValidationResult:
+        """Return the result of any validator, including legacy ones which
+        only implement `validate()` and `errors`.
+
+        Args:
+            validator (Any): the validator
+            value (Any): the value to validate
+            memo (dict): see `Validator.check()`
+
+        Returns:
+            ValidationResult: the validity and error messages
+
+        """
+        if isinstance(validator, Validator):
+            return validator.check(value, memo)
+        valid = validator.validate(value)
+        return ValidationResult(bool(valid), tuple(validator.errors))
+
+    def dependencies(self):
+        """Return the validators of `depends_on()`, built once per validator.
+
+        Returns:
+            tuple: the validators this validator depends on
+
+        """
+        dependencies = self._dependencies
+        if dependencies is None:
+            dependencies = tuple(self.depends_on())
+            object.__setattr__(self, '_dependencies', dependencies)
+        return dependencies
+
+    def signature(self) -> Hashable:
+        """Return a key identifying validators which check values the same way.
+
+        Returns:
+            Hashable: the class and settings of the validator, or None if they
+            are not hashable
+
+        """
+        signature = self._signature
+        if signature is None:
+            try:
+                signature = (type(self), tuple(
+                    (k, v) for k, v in sorted(self._attributes.items())
+                    if k != 'errors'
+                ))
+                hash(signature)
+            except TypeError:
+                signature = False
+            object.__setattr__(self, '_signature', signature)
+        return signature or None
+
+    def is_stateless(self) -> bool:
+        """Return whether `check()` is safe to call from several threads.
+
+        Returns:
+            bool: False if the validator relies on an overridden `validate()`
+
+        """
+        return not self._is_legacy() and all(
+            isinstance(v, Validator) and v.is_stateless()
+            for v in self.dependencies()
+        )
+
+    def validate_column(self, values) -> Dict[int, List[str]]:
+        """Validate a whole column of values at once.
+
+        Validators which can check a column faster than value by value
+        override this method; by default `check()` is called per value.
+
+        Args:
+            values (Sequence): the values, usually a column of a
+            `rebase.core.ModelBatch`
+
+        Returns:
+            dict: the error messages of the invalid rows, keyed by row index
+
+        """
+        failed = {}
+        for row, value in enumerate(values):
+            result = self.check(value)
+            if not result.valid:
+                failed[row] = list(result.errors)
+        return failed
+
+    def inline(self, const: Callable[[Any], str]) -> Optional[Tuple[str, Dict[str, str]]]:
+        """Return the check of this validator as Python source, to be
+        compiled into the validation function of a model (see
+        `Model.compile_rules`).
+
+        Validators whose `_check()` only tests `value` after their
+        dependencies, and returns `failure()` when the test fails, override
+        this method; the compiled function then runs their dependencies and
+        their test inline and calls `check()` for the other validators.
+
+        Args:
+            const (callable): returns the name under which the generated
+            code can read a value, such as a setting of the validator
+
+        Returns:
+            tuple: an expression of `value` which is true when the value is
+            invalid, and the expressions of the placeholders of `message`;
+            None if the validator cannot be inlined
+
+        """
+        return None
+
+    def nested_models(self, value: Any) -> List[Object]:
+        """Return the models this validator validates within `value`.
+
+        `Model.validate()` walks them to validate each nested model once,
+        deepest first; validators such as `NestedValidator` override this.
+
+        Args:
+            value (Any): the value of the attribute
+
+        Returns:
+            list: the nested `rebase.core.Model` instances
+
+        """
+        return []
 
     def depends_on(self):
         return {}
+
+    def _changed(self, attr_name: str):
+        super()._changed(attr_name)
+        object.__setattr__(self, '_dependencies', None)
+        object.__setattr__(self, '_signature', None)
+
+    def _properties(self) -> List[str]:
+        return [*super()._properties(), '_dependencies', '_signature']
+
+    def _is_legacy(self) -> bool:
+        """Return whether `validate()` is overridden below `_check()`."""
+        cls = type(self)
+        legacy = _legacy_classes.get(cls)
+        if legacy is None:
+            for klass in cls.__mro__:
+                if '_check' in klass.__dict__:
+                    legacy = False
+                    break
+                if 'validate' in klass.__dict__:
+                    legacy = True
+                    break
+            _legacy_classes[cls] = legacy
+        return legacy
+
+    def _validate_dependencies_column(self, values) -> Dict[int, List[str]]:
+        failed = {}
+        for validator in self.dependencies():
+            for row, messages in validator.validate_column(values).items():
+                failed.setdefault(row, []).extend(messages)
+        return failed
+
+    def _overrides(self, method: str, cls: type) -> bool:
+        return self._is_legacy() \
+            or getattr(type(self), method) is not getattr(cls, method)
+
+
+_legacy_classes = {}
@@ -4,7 +4,7 @@
 # License: Apache 2.0
 # Source: https://github.com/trivago/rebase
 # Version: 1.2.2
-# Python Version: 3.6
+# Python Version: 3.7
 # Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
 """
 
@@ -13,23 +13,28 @@ from rebase.validators import StringValidator
 
 
 class AlnumValidator(Validator):
+    cost = 2
+
     def properties(self):
         return {
             **super().properties(),
             'message': lambda: '`{value}` is not a valid alphanumeric string.'
         }
 
-    def validate(self, value):
-        if not super().validate(value):
-            return False
-
-        is_valid = True
+    def _check(self, value, memo=None):
+        result = super()._check(value, memo)
+        if not result:
+            return result
 
         if not value.isalnum():
-            self.errors.append(self.message.format(value=value))
-            is_valid &= False
+            return self.failure(value=value)
+
+        return result
 
-        return is_valid
+    def inline(self, const):
+        if self._overrides('_check', AlnumValidator):
+            return None
+        return 'not value.isalnum()', {'value': 'value'}
 
     def depends_on(self):
         return {StringValidator(required=self.required)}
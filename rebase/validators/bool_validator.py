@@ -4,28 +4,47 @@
 # License: Apache 2.0
 # Source: https://github.com/trivago/rebase
 # Version: 1.2.2
-# Python Version: 3.6
+# Python Version: 3.7
 # Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
 """
 
-from rebase.core import Validator
+from rebase.core import ModelBatch, Validator
 
 
 class BoolValidator(Validator):
+    cost = 1
+
     def properties(self):
         return {
             **super().properties(),
             'message': lambda: '`{value}` is not a boolean'
         }
 
-    def validate(self, value):
-        if not super().validate(value):
-            return False
-
-        is_valid = True
+    def _check(self, value, memo=None):
+        result = super()._check(value, memo)
+        if not result:
+            return result
 
         if type(value) is not bool:
-            self.errors.append(self.message.format(value=str(value)))
-            is_valid &= False
+            return self.failure(value=str(value))
+
+        return result
+
+    def inline(self, const):
+        if self._overrides('_check', BoolValidator):
+            return None
+        return 'type(value) is not bool', {'value': 'str(value)'}
+
+    def validate_column(self, values):
+        if self._overrides('_check', BoolValidator):
+            return super().validate_column(values)
+
+        failed = self._validate_dependencies_column(values)
+        if ModelBatch.is_bool(values):
+            return failed
+
+        for row, value in enumerate(values):
+            if row not in failed and type(value) is not bool:
+                failed[row] = [self.message.format(value=str(value))]
 
-        return is_valid
+        return failed
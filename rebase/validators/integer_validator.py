@@ -4,28 +4,47 @@
 # License: Apache 2.0
 # Source: https://github.com/trivago/rebase
 # Version: 1.2.2
-# Python Version: 3.6
+# Python Version: 3.7
 # Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
 """
 
-from rebase.core import Validator
+from rebase.core import ModelBatch, Validator
 
 
 class IntegerValidator(Validator):
+    cost = 1
+
     def properties(self):
         return {
             **super().properties(),
             'message': lambda: '`{value}` is not an integer'
         }
 
-    def validate(self, value):
-        if not super().validate(value):
-            return False
-
-        is_valid = True
+    def _check(self, value, memo=None):
+        result = super()._check(value, memo)
+        if not result:
+            return result
 
         if type(value) is not int:
-            self.errors.append(self.message.format(value=value))
-            is_valid &= False
+            return self.failure(value=value)
+
+        return result
+
+    def inline(self, const):
+        if self._overrides('_check', IntegerValidator):
+            return None
+        return 'type(value) is not int', {'value': 'value'}
+
+    def validate_column(self, values):
+        if self._overrides('_check', IntegerValidator):
+            return super().validate_column(values)
+
+        failed = self._validate_dependencies_column(values)
+        if ModelBatch.is_integer(values):
+            return failed
+
+        for row, value in enumerate(values):
+            if row not in failed and type(value) is not int:
+                failed[row] = [self.message.format(value=value)]
 
-        return is_valid
+        return failed
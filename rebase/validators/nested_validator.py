@@ -4,38 +4,80 @@
 # License: Apache 2.0
 # Source: https://github.com/trivago/rebase
 # Version: 1.2.2
-# Python Version: 3.6
+# Python Version: 3.7
 # Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
 """
 
-from rebase.core import Model, Validator
+import asyncio
+from rebase.core import Model, ValidationResult, Validator
 
 
 class NestedValidator(Validator):
+    cost = 100
+
     def properties(self):
         return {
             **super().properties(),
             'required': True,
         }
 
-    def validate(self, value):
-        if not super().validate(value):
-            return False
+    def _check(self, value, memo=None):
+        result = super()._check(value, memo)
+        if not result:
+            return result
 
-        is_valid = True
+        errors = []
+        budget = self.budget()
 
         if isinstance(value, Model) and not value.validate():
-            is_valid = False
-            self.errors.append(value.get_errors())
+            errors.append(value.get_errors())
         elif isinstance(value, dict):
             for k, v in value.items():
                 if isinstance(v, Model) and not v.validate():
-                    is_valid = False
-                    self.errors.append({k: v.get_errors()})
+                    errors.append({k: v.get_errors()})
+                    if budget is not None and budget.exhausted:
+                        break
         elif isinstance(value, list) or isinstance(value, set):
             for v in value:
                 if isinstance(v, Model) and not v.validate():
-                    is_valid = False
-                    self.errors.append({v.get_id(): v.get_errors()})
+                    errors.append({v.get_id(): v.get_errors()})
+                    if budget is not None and budget.exhausted:
+                        break
+
+        if errors and budget is not None and not budget.messages:
+            return ValidationResult(False)
+        return ValidationResult(False, tuple(errors)) if errors else result
+
+    def nested_models(self, value):
+        if isinstance(value, Model):
+            return [value]
+        if isinstance(value, dict):
+            value = value.values()
+        elif not isinstance(value, (list, set)):
+            return []
+        return [v for v in value if isinstance(v, Model)]
+
+    async def acheck(self, value, memo=None):
+        result = super()._check(value, memo)
+        if not result:
+            return result
+
+        if isinstance(value, Model):
+            models = [(None, value)]
+        elif isinstance(value, dict):
+            models = [(k, v) for k, v in value.items() if isinstance(v, Model)]
+        elif isinstance(value, list) or isinstance(value, set):
+            models = [(v.get_id(), v) for v in value if isinstance(v, Model)]
+        else:
+            models = []
+
+        # a model held several times is validated once, as `validate()` does
+        unique = list({id(v): v for _, v in models}.values())
+        valids = await asyncio.gather(*(v.avalidate() for v in unique))
+        valids = {id(v): valid for v, valid in zip(unique, valids)}
+        errors = [
+            v.get_errors() if k is None else {k: v.get_errors()}
+            for k, v in models if not valids[id(v)]
+        ]
 
-        return is_valid
+        return ValidationResult(False, tuple(errors)) if errors else result
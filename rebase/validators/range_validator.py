@@ -4,15 +4,18 @@
 # License: Apache 2.0
 # Source: https://github.com/trivago/rebase
 # Version: 1.2.2
-# Python Version: 3.6
+# Python Version: 3.7
 # Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
 """
 
-from rebase.core import Validator
+from array import array
+from rebase.core import ModelBatch, Validator
 from rebase.validators import IntegerValidator
 
 
 class RangeValidator(Validator):
+    cost = 2
+
     def properties(self):
         return {
             **super().properties(),
@@ -21,23 +24,54 @@ class RangeValidator(Validator):
             'message': lambda: '{value} is not within the range {min} and {max}'
         }
 
-    def validate(self, value):
-        if not super().validate(value):
-            return False
-
-        is_valid = True
+    def _check(self, value, memo=None):
+        result = super()._check(value, memo)
+        if not result:
+            return result
 
         if not (int(value) >= self.min and int(value) <= self.max):
-            self.errors.append(
+            return self.failure(
+                value=str(value),
+                min=str(self.min),
+                max=str(self.max)
+            )
+
+        return result
+
+    def inline(self, const):
+        if self._overrides('_check', RangeValidator):
+            return None
+        min_, max_ = const(self.min), const(self.max)
+        return f'not (int(value) >= {min_} and int(value) <= {max_})', {
+            'value': 'str(value)',
+            'min': const(str(self.min)),
+            'max': const(str(self.max)),
+        }
+
+    def validate_column(self, values):
+        if self._overrides('_check', RangeValidator):
+            return super().validate_column(values)
+
+        failed = self._validate_dependencies_column(values)
+        if ModelBatch.is_integer(values) and not isinstance(values, array):
+            rows = ((values < self.min) | (values > self.max)).nonzero()[0]
+        else:
+            rows = [
+                row for row, value in enumerate(values)
+                if row not in failed
+                and not (int(value) >= self.min and int(value) <= self.max)
+            ]
+
+        for row in rows:
+            failed[int(row)] = [
                 self.message.format(
-                    value=str(value),
+                    value=str(values[row]),
                     min=str(self.min),
                     max=str(self.max)
                 )
-            )
-            is_valid &= False
+            ]
 
-        return is_valid
+        return failed
 
     def depends_on(self):
         return {IntegerValidator(required=self.required)}
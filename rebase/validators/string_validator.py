@@ -4,7 +4,7 @@
 # License: Apache 2.0
 # Source: https://github.com/trivago/rebase
 # Version: 1.2.2
-# Python Version: 3.6
+# Python Version: 3.7
 # Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
 """
 
@@ -12,20 +12,25 @@ from rebase.core import Validator
 
 
 class StringValidator(Validator):
+    cost = 1
+
     def properties(self):
         return {
             **super().properties(),
             'message': lambda: '`{value}` is not a valid string'
         }
 
-    def validate(self, value):
-        if not super().validate(value):
-            return False
-
-        is_valid = True
+    def _check(self, value, memo=None):
+        result = super()._check(value, memo)
+        if not result:
+            return result
 
         if type(value) is not str:
-            self.errors.append(self.message.format(value=value))
-            is_valid &= False
+            return self.failure(value=value)
+
+        return result
 
-        return is_valid
+    def inline(self, const):
+        if self._overrides('_check', StringValidator):
+            return None
+        return 'type(value) is not str', {'value': 'value'}
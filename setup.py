@@ -22,7 +22,7 @@ class Pytest(TestCommand):
 setup(
     name='rebase',
     version='1.2.2',
-    python_requires='>=3.6',
+    python_requires='>=3.7',
     author="Yuv Joodhisty",
     author_email="locustv2@gmail.com",
     maintainer="Yuv Joodhisty",
@@ -36,6 +36,11 @@ setup(
     install_requires=[
         'simplejson',
     ],
+    extras_require={
+        'numpy': ['numpy'],
+        'orjson': ['orjson'],
+        'msgpack': ['msgpack'],
+    },
     tests_require=['pytest-cov', 'pytest', 'mock'],
     cmdclass={'test': Pytest},
     test_suite='tests',
@@ -0,0 +1,140 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import asyncio
+import unittest
+from rebase.core import AsyncValidator, Model, ValidationResult
+from rebase.validators import NestedValidator, RangeValidator
+
+
+class Store(object):
+    def __init__(self, known):
+        self.known = set(known)
+        self.running = 0
+        self.peak = 0
+
+    async def exists(self, value):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.001)
+        self.running -= 1
+        return value in self.known
+
+
+STORE = Store(['Berlin', 'Paris', 'Rome'])
+
+
+class KnownCityValidator(AsyncValidator):
+    async def _acheck(self, value, memo=None):
+        result = await super()._acheck(value, memo)
+        if not result:
+            return result
+
+        if not await STORE.exists(value):
+            return ValidationResult(False, (f'{value} is not a known city',))
+
+        return result
+
+
+class Hotel(Model):
+    def properties(self):
+        return {
+            'city': 'city',
+            'stars': 'stars',
+        }
+
+    def rules(self):
+        return {
+            'city': [KnownCityValidator()],
+            'stars': [RangeValidator(min=1, max=5)],
+        }
+
+
+class Chain(Model):
+    def properties(self):
+        return {
+            'hotels': ('hotels', lambda x: [Hotel(**h) for h in x]),
+        }
+
+    def rules(self):
+        return {
+            'hotels': [NestedValidator()],
+        }
+
+
+class TestAsyncValidator(unittest.TestCase):
+    def setUp(self):
+        STORE.running = STORE.peak = 0
+
+    def test_avalidate(self):
+        hotel = Hotel(city='Paris', stars=9)
+
+        self.assertFalse(asyncio.run(hotel.avalidate()))
+        self.assertEqual(
+            {'city': [], 'stars': ['9 is not within the range 1 and 5']},
+            hotel.get_errors()
+        )
+
+        hotel.city = 'Atlantis'
+        hotel.stars = 3
+        self.assertFalse(asyncio.run(hotel.avalidate()))
+        self.assertEqual(
+            {'city': ['Atlantis is not a known city'], 'stars': []},
+            hotel.get_errors()
+        )
+
+    def test_avalidate_nested(self):
+        cities = ['Berlin', 'Atlantis', 'Rome', 'Eldorado'] * 10
+        chain = Chain(hotels=[
+            {'city': c, 'stars': 3, 'id': i} for i, c in enumerate(cities)
+        ])
+
+        self.assertFalse(asyncio.run(chain.avalidate(concurrency=4)))
+        invalid = [e for e in chain.get_errors()['hotels']]
+        self.assertEqual(20, len(invalid))
+        self.assertLessEqual(STORE.peak, 4)
+        self.assertGreater(STORE.peak, 1)
+
+        self.assertEqual(chain.validate(), False)
+        self.assertEqual(invalid, chain.get_errors()['hotels'])
+
+    def test_avalidate_repeated(self):
+        class Group(Model):
+            def properties(self):
+                return {'hotels': 'hotels'}
+
+            def rules(self):
+                return {'hotels': [NestedValidator()]}
+
+        hotel = Hotel(city='Atlantis', stars=9)
+        group = Group(hotels=[hotel, hotel, hotel])
+
+        self.assertFalse(asyncio.run(group.avalidate()))
+        errors = hotel.get_errors()
+        self.assertEqual({
+            'city': ['Atlantis is not a known city'],
+            'stars': ['9 is not within the range 1 and 5'],
+        }, errors)
+        self.assertEqual(3, len(group.get_errors()['hotels']))
+
+        self.assertFalse(group.validate())
+        self.assertEqual(errors, hotel.get_errors())
+
+    def test_check_in_running_loop(self):
+        async def check():
+            return KnownCityValidator().check('Paris')
+
+        self.assertTrue(KnownCityValidator().check('Paris'))
+        with self.assertRaises(RuntimeError):
+            asyncio.run(check())
+
+
+if __name__ == '__main__':
+    unittest.main()
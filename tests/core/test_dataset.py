@@ -0,0 +1,109 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+from rebase.core import Dataset, Model
+from rebase.core import dataset
+
+
+class Hotel(Model):
+    def properties(self):
+        return {
+            'name': 'name',
+            'city': 'location.city',
+            'stars': 'stars',
+        }
+
+
+CITIES = ['Paris', 'Rome', 'Berlin']
+
+
+class TestDataset(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'hotels.jsonl')
+        with open(self.path, 'wb') as f:
+            for i in range(30):
+                f.write(b'{"name": "h%d", "location": {"city": "%s"}, '
+                        b'"stars": %d}\r\n' % (i, CITIES[i % 3].encode(), i % 5))
+                if i == 10:
+                    f.write(b'   \n')
+            f.write(b'{"name": "last", "stars": 1}')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_random_access(self):
+        with Dataset(self.path, Hotel, context='public') as hotels:
+            self.assertEqual(31, len(hotels))
+            self.assertIsInstance(hotels[12], Hotel)
+            self.assertEqual(
+                {'name': 'h12', 'city': 'Paris', 'stars': 2},
+                hotels[12].attributes)
+            self.assertEqual('public', hotels[0].get_context())
+            self.assertEqual('last', hotels[-1].name)
+            self.assertEqual(b'{"name": "last", "stars": 1}', hotels.raw(-1))
+            with self.assertRaises(IndexError):
+                hotels[31]
+
+            view = hotels[5:20:5]
+            self.assertEqual(3, len(view))
+            self.assertEqual(['h5', 'h10', 'h15'], [h.name for h in view])
+            self.assertEqual('h15', view[-1].name)
+            self.assertEqual(['h10', 'h15'], [h.name for h in view[1:]])
+
+    def test_persisted_index(self):
+        Dataset(self.path).close()
+        self.assertTrue(os.path.exists(self.path + '.idx'))
+
+        with mock.patch.object(Dataset, '_build_index') as build:
+            with Dataset(self.path, Hotel) as hotels:
+                self.assertEqual('h29', hotels[-2].name)
+            build.assert_not_called()
+
+        with open(self.path, 'ab') as f:
+            f.write(b'\n{"name": "appended"}\n')
+        with Dataset(self.path, Hotel) as hotels:
+            self.assertEqual('appended', hotels[-1].name)
+
+    def test_filter(self):
+        with Dataset(self.path, Hotel) as hotels, \
+                mock.patch.object(Dataset, '_decode', autospec=True,
+                                  side_effect=Dataset._decode) as decode:
+            found = list(hotels.filter(where={'location.city': 'Rome'}))
+            self.assertEqual(10, len(found))
+            self.assertEqual(10, decode.call_count)
+
+            found = hotels.filter(
+                where={'location.city': 'Rome', 'stars': 4},
+                predicate=lambda r: r['name'] != 'h4')
+            self.assertEqual(['h19'], [h.name for h in found])
+
+            found = hotels[20:].filter(contains='Berlin')
+            self.assertEqual(['h20', 'h23', 'h26', 'h29'], [h.name for h in found])
+
+    def test_invalid_line_number(self):
+        with open(self.path, 'ab') as f:
+            f.write(b'\n\n{"name": \n')
+
+        with Dataset(self.path, Hotel, persist_index=False) as hotels:
+            with self.assertRaisesRegex(ValueError, '^Line 34 is not valid'):
+                hotels[-1]
+            with self.assertRaisesRegex(ValueError, '^Line 34 is not valid'):
+                list(hotels.filter(contains='name'))
+            with mock.patch.object(dataset, 'CHUNK_SIZE', 7):
+                self.assertEqual(34, hotels._line_number(len(hotels) - 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import io
+import json
+import unittest
+from decimal import Decimal
+from rebase.core import Encoder, Model, Object, slotted, write_json
+
+
+class Room(Object):
+    def properties(self):
+        return {
+            'id': 'id',
+            'price': 'price',
+        }
+
+
+class Hotel(Model):
+    lazy_nested = True
+
+    def properties(self):
+        return {
+            'name': 'name',
+            'stars': ('rating.stars', int),
+            'rooms': ('rooms', lambda x: [Room(**r) for r in x]),
+            'main': ('main', Room),
+        }
+
+    def scenarios(self):
+        return {
+            'public': ['name', 'stars'],
+        }
+
+
+RECORD = {
+    'name': 'Hotel Paris',
+    'rating': {'stars': 4},
+    'rooms': [{'id': 1, 'price': Decimal('99.90')}, {'id': 2, 'price': 80}],
+    'main': {'id': 1, 'price': 120},
+}
+
+
+class TestEncoder(unittest.TestCase):
+    def setUp(self):
+        self.hotel = Hotel(**RECORD)
+
+    def expected(self, hotel):
+        return json.loads(json.dumps(hotel.attributes, default=float))
+
+    def test_to_json(self):
+        expected = self.expected(self.hotel)
+
+        for encoder in Encoder._registry:
+            self.assertEqual(
+                expected, json.loads(self.hotel.to_json(encoder)), encoder)
+            self.assertEqual(
+                expected, json.loads(self.hotel.to_bytes(encoder)), encoder)
+
+        self.assertIn('"price":99.90', self.hotel.to_json(use_decimal=True))
+        with self.assertRaises(ValueError):
+            self.hotel.to_json('json', use_decimal=True)
+        with self.assertRaises(ValueError):
+            self.hotel.to_json('unknown')
+
+    def test_to_json_context_and_slotted(self):
+        self.hotel.set_context('public')
+        self.assertEqual(
+            {'name': 'Hotel Paris', 'stars': 4},
+            json.loads(self.hotel.to_json()))
+
+        hotel = slotted(Hotel)(**RECORD)
+        self.assertEqual(self.expected(hotel), json.loads(hotel.to_json()))
+
+    def test_write_json(self):
+        hotels = [Hotel(**{**RECORD, 'name': f'h{i}'}) for i in range(5)]
+        expected = [self.expected(h) for h in hotels]
+
+        for encoder in Encoder._registry:
+            text, binary = io.StringIO(), io.BytesIO()
+            self.assertEqual(5, write_json(
+                iter(hotels), text, chunk_size=2, encoder=encoder))
+            write_json(hotels, binary, lines=True, encoder=encoder)
+
+            self.assertEqual(expected, json.loads(text.getvalue()))
+            self.assertEqual(expected, [
+                json.loads(line) for line in binary.getvalue().splitlines()
+            ])
+
+        empty = io.StringIO()
+        self.assertEqual(0, write_json([], empty))
+        self.assertEqual('[]', empty.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import gc
+import unittest
+from unittest import mock
+from rebase.core import Model, Object, Pool
+from rebase.validators import NestedValidator, StringValidator
+
+
+class Address(Object):
+    interned = True
+
+    def properties(self):
+        return {'city': 'city', 'codes': 'codes'}
+
+
+class Hotel(Object):
+    def properties(self):
+        return {
+            'name': 'name',
+            'address': ('address', Address),
+        }
+
+
+class Room(Model):
+    id_strategy = 'counter'
+
+    def properties(self):
+        return {'name': 'name'}
+
+    def rules(self):
+        return {'name': [StringValidator(required=True)]}
+
+
+class TestIdentity(unittest.TestCase):
+    def tearDown(self):
+        Pool.clear()
+
+    def test_id_strategies(self):
+        with mock.patch('uuid.uuid4') as uuid4:
+            first, second = Room(name='a').get_id(), Room(name='a').get_id()
+        uuid4.assert_not_called()
+        self.assertEqual(int(first) + 1, int(second))
+
+        class Content(Object):
+            id_strategy = 'content'
+
+            def properties(self):
+                return {'name': 'name', 'price': 'price'}
+
+        a = Content(name='a', price=1)
+        self.assertEqual(a.get_id(), Content(name='a', price=1).get_id())
+        self.assertNotEqual(a.get_id(), Content(name='a', price=2).get_id())
+        self.assertNotEqual(a.get_id(), Content(name='a', price=1.0).get_id())
+        self.assertEqual(32, len(a.get_id()))
+
+        a.name = 'b'
+        self.assertEqual(a.get_id(), Content(name='a', price=1).get_id())
+
+        class Custom(Object):
+            id_strategy = staticmethod(lambda obj: f'hotel-{obj.name}')
+
+        self.assertEqual('hotel-x', Custom(name='x').get_id())
+
+        class Unknown(Object):
+            id_strategy = 'random'
+
+        self.assertRaises(ValueError, Unknown(name='x').get_id)
+
+    def test_nested_validator_ids(self):
+        class Hotel(Model):
+            def properties(self):
+                return {'rooms': ('rooms', lambda x: [Room(**r) for r in x])}
+
+            def rules(self):
+                return {'rooms': [NestedValidator()]}
+
+        hotel = Hotel(rooms=[{'name': 'a'}, {}, {}])
+        with mock.patch('uuid.uuid4') as uuid4:
+            self.assertFalse(hotel.validate())
+        uuid4.assert_not_called()
+        self.assertEqual(2, len(hotel.get_errors()['rooms']))
+
+    def test_pool(self):
+        hotels = [
+            Hotel(name=f'h{i}',
+                  address={'city': ['Paris', 'Rome'][i % 2], 'codes': [1, 2]})
+            for i in range(10)
+        ]
+        self.assertIs(hotels[0].address, hotels[2].address)
+        self.assertIsNot(hotels[0].address, hotels[1].address)
+        self.assertEqual(2, Pool.size(Address))
+        self.assertEqual({'city': 'Rome', 'codes': [1, 2]},
+                         hotels[9].attributes['address'])
+
+        other = Hotel(name='x', address={'city': 'Paris', 'codes': [1.0, 2]})
+        self.assertIsNot(hotels[0].address, other.address)
+
+        unhashable = Hotel(
+            name='x', address={'city': 'Paris', 'codes': [bytearray(b'1')]})
+        self.assertEqual(3, Pool.size(Address))
+        self.assertEqual(bytearray(b'1'), unhashable.address.codes[0])
+
+        del hotels, other
+        gc.collect()
+        self.assertEqual(0, Pool.size())
+
+    def test_pool_lazy_and_nested(self):
+        class Lazy(Object):
+            lazy_nested = True
+
+            def properties(self):
+                return {'address': ('address', Address), 'owner': Owner}
+
+        class Owner(Object):
+            interned = True
+
+            def properties(self):
+                return {'name': 'owner', 'address': ('address', Address)}
+
+        record = {'owner': 'Paul', 'address': {'city': 'Paris', 'codes': []}}
+        a, b = Lazy(**record), Lazy(**record)
+        self.assertIs(a.address, b.address)
+        self.assertIs(a.owner, b.owner)
+        self.assertIs(a.owner.address, a.address)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,14 +4,14 @@
 # License: Apache 2.0
 # Source: https://github.com/trivago/rebase
 # Version: 1.2.0
-# Python Version: 3.6
+# Python Version: 3.7
 # Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
 """
 
 import unittest
 from unittest import mock
 from rebase.core import Model
-from rebase.validators import RangeValidator
+from rebase.validators import NestedValidator, RangeValidator, StringValidator
 
 
 @mock.patch.multiple(
@@ -69,3 +69,192 @@ class TestModel(unittest.TestCase):
         self.model.set_context('personal')
         self.assertNotEqual(self.model.attributes, self.model.get(
             'name', 'age', 'gender', 'location'))
+
+    def test_model_from_records(self):
+        records = [
+            {'name': 'Paul', 'age': 35, 'gender': 'Male', 'location': 'Germany'},
+            {'name': 'Lucie', 'age': 25, 'gender': 'Female', 'location': 'France'},
+        ]
+        models = Model.from_records(records, context='personal')
+
+        self.assertEqual([m.get_context() for m in models], ['personal'] * 2)
+        self.assertEqual(models[1].gender, 0)
+        self.assertNotIn('location', models[1].attributes)
+        self.assertEqual([m.validate() for m in models], [False, True])
+        self.assertDictEqual(
+            models[0].attributes, Model(context='personal', **records[0]).attributes)
+
+        model, = Model.from_records(
+            [{'name': 'Anna', 'context': 'public'}], context='personal')
+        expected = Model(context='public', name='Anna')
+        self.assertEqual('public', model.get_context())
+        self.assertEqual(expected.attributes, model.attributes)
+        self.assertEqual(repr(expected), repr(model))
+
+    def test_model_cache_attributes(self):
+        with mock.patch.object(Model, 'cache_attributes', True):
+            model = Model(context='personal', name='Paul', age=35, gender='Male', location='Germany')
+
+        attributes = model.attributes
+        self.assertIs(model.attributes, attributes)
+        self.assertNotIn('location', attributes)
+
+        model.set_context(None)
+        self.assertIn('location', model.attributes)
+
+        model.set_context('personal')
+        self.assertIs(model.attributes, attributes)
+        model.age = 36
+        self.assertEqual(model.attributes['age'], 36)
+
+    def test_model_rules_shared(self):
+        other = Model(name='Lucie', age=25)
+
+        self.assertIs(self.model._get_rules(), other._get_rules())
+        self.assertTrue(other.validate())
+
+    def test_model_incremental_validation(self):
+        calls = []
+
+        class Room(Model):
+            incremental_validation = True
+
+            def properties(self):
+                return {'price': 'price'}
+
+            def rules(self):
+                return {'price': [mock.Mock(
+                    required=False,
+                    errors=[],
+                    validate=lambda x: calls.append(x) or x > 0
+                )]}
+
+        class Hotel(Model):
+            incremental_validation = True
+
+            def properties(self):
+                return {'name': 'name', 'rooms': 'rooms'}
+
+            def rules(self):
+                return {
+                    'name': [mock.Mock(
+                        required=True,
+                        errors=[],
+                        validate=lambda x: calls.append(x) or True
+                    )],
+                    'rooms': [NestedValidator()],
+                }
+
+        rooms = [Room(price=10), Room(price=20)]
+        hotel = Hotel(name='Hotel', rooms=rooms)
+
+        self.assertTrue(hotel.validate())
+        self.assertEqual(calls, ['Hotel', 10, 20])
+
+        self.assertTrue(hotel.validate())
+        self.assertEqual(len(calls), 3)
+
+        rooms[1].price = -5
+        self.assertFalse(hotel.validate())
+        self.assertEqual(calls[3:], [-5])
+
+        hotel.name = None
+        self.assertFalse(hotel.validate())
+        self.assertIn('`name` is a required field.', hotel.get_errors('name'))
+        self.assertEqual(len(calls), 4)
+
+        hotel.name = 'Hotel'
+        rooms[1].price = 5
+        self.assertTrue(hotel.validate())
+        self.assertEqual(calls[4:], ['Hotel', 5])
+
+    def test_model_incremental_validation_replaced(self):
+        class Node(Model):
+            incremental_validation = True
+
+            def properties(self):
+                return {'price': 'price', 'sub': 'sub'}
+
+            def rules(self):
+                return {
+                    'price': [RangeValidator(min=0, max=10)],
+                    'sub': [NestedValidator(required=False)],
+                }
+
+        s1 = Node(price=1)
+        s1.price = 2
+        child = Node(price=1, sub=s1)
+        parent = Node(price=1, sub=child)
+        self.assertTrue(parent.validate())
+
+        # the child changes once, the grandchild is replaced by a new model
+        child.sub = Node(price=-1)
+        self.assertFalse(parent.validate())
+        self.assertEqual(Node(price=1, sub=child).validate(), parent.validate())
+
+    def test_model_validation_modes(self):
+        formatted = []
+
+        class Price(RangeValidator):
+            cost = 50
+
+            def failure(self, **fields):
+                formatted.append(fields['value'])
+                return super().failure(**fields)
+
+        class Room(Model):
+            def properties(self):
+                return {'name': 'name', 'price': 'price'}
+
+            def rules(self):
+                return {
+                    'price': [Price(min=1, max=500)],
+                    'name': [StringValidator(required=True)],
+                }
+
+        class Hotel(Model):
+            def properties(self):
+                return {'rooms': 'rooms', 'stars': 'stars'}
+
+            def rules(self):
+                return {
+                    'rooms': [NestedValidator()],
+                    'stars': [RangeValidator(min=1, max=5)],
+                }
+
+        rooms = [Room(name=1, price=-1), Room(name=2, price=-2),
+                 Room(name=3, price=-3)]
+        hotel = Hotel(rooms=rooms, stars=9)
+
+        self.assertFalse(hotel.validate())
+        self.assertEqual(3, len(hotel.get_errors('rooms')))
+        self.assertEqual(['-1', '-2', '-3'], formatted)
+
+        del formatted[:]
+        self.assertFalse(hotel.validate(max_errors=1))
+        self.assertEqual(
+            {'stars': ['9 is not within the range 1 and 5']},
+            hotel.get_errors())
+        self.assertEqual([], formatted)
+
+        self.assertFalse(hotel.validate(max_errors=3))
+        self.assertEqual(['stars', 'rooms'], list(hotel.get_errors()))
+        self.assertEqual(1, len(hotel.get_errors('rooms')))
+        self.assertEqual({
+            'name': ['`1` is not a valid string'],
+            'price': ['-1 is not within the range 1 and 500'],
+        }, list(hotel.get_errors('rooms')[0].values())[0])
+        self.assertEqual(['-1'], formatted)
+
+        del formatted[:]
+        hotel.stars = 3
+        self.assertFalse(hotel.validate(messages=False))
+        self.assertEqual([], formatted)
+        self.assertEqual({'rooms': []}, hotel.get_errors())
+        self.assertEqual({'name': []}, rooms[0].get_errors())
+
+        for room in rooms:
+            room.name = 'Room'
+        self.assertFalse(hotel.validate(max_errors=1))
+        self.assertEqual(['-1'], formatted)
+        self.assertTrue(Room(name='Room', price=5).validate(messages=False))
@@ -0,0 +1,82 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import unittest
+from array import array
+from unittest import mock
+from rebase.core import Model, ModelBatch
+from rebase.validators import BoolValidator, IntegerValidator, RangeValidator, StringValidator
+
+
+class Room(Model):
+    def properties(self):
+        return {
+            'name': 'name',
+            'price': 'price',
+            'beds': 'beds',
+            'available': 'available',
+        }
+
+    def rules(self):
+        return {
+            'name': [StringValidator()],
+            'price': [RangeValidator(min=10, max=500)],
+            'beds': [IntegerValidator(required=True)],
+            'available': [BoolValidator()],
+        }
+
+
+class TestModelBatch(unittest.TestCase):
+    def setUp(self):
+        self.valid = [
+            {'name': f'room {i}', 'price': 10 + i, 'beds': i % 3, 'available': i % 2 == 0}
+            for i in range(50)
+        ]
+        self.invalid = [
+            {'name': 'single', 'price': 5, 'beds': 1, 'available': True},
+            {'name': 'double', 'price': '120', 'beds': None, 'available': 'yes'},
+            {'name': None, 'price': 900, 'beds': 2.0, 'available': False},
+        ]
+
+    def assertSameErrors(self, records):
+        batch = ModelBatch.from_records(Room, records)
+        models = [Room(**record) for record in records]
+        expected = {}
+        for row, model in enumerate(models):
+            if not model.validate():
+                expected[row] = {k: v for k, v in model.get_errors().items() if v}
+
+        self.assertEqual(batch.validate(), not expected)
+        self.assertDictEqual(batch.get_errors(), expected)
+
+    def test_model_batch_columns(self):
+        batch = ModelBatch.from_records(Room, self.valid)
+
+        self.assertEqual(len(batch), 50)
+        self.assertTrue(ModelBatch.is_integer(batch.column('price')))
+        self.assertTrue(ModelBatch.is_bool(batch.column('available')))
+        self.assertIsInstance(batch.column('name'), list)
+        self.assertEqual(batch[3].price, batch.column('price')[3])
+
+    def test_model_batch_validate(self):
+        self.assertSameErrors(self.valid)
+        self.assertSameErrors(self.valid + self.invalid)
+
+        batch = ModelBatch.from_records(Room, self.invalid)
+        batch.validate()
+        self.assertEqual(batch.get_errors(1)['beds'], ['`beds` is a required field.'])
+
+    @mock.patch('rebase.core.model_batch.numpy', None)
+    def test_model_batch_without_numpy(self):
+        batch = ModelBatch.from_records(Room, self.valid)
+
+        self.assertIsInstance(batch.column('price'), array)
+        self.assertIsInstance(batch.column('available'), list)
+        self.assertSameErrors(self.valid + self.invalid)
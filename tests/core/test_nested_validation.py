@@ -0,0 +1,139 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import asyncio
+import sys
+import unittest
+from unittest import mock
+from rebase.core import Model, ValidationPass
+from rebase.validators import NestedValidator, RangeValidator
+
+
+class Rate(Model):
+    def properties(self):
+        return {'price': 'price'}
+
+    def rules(self):
+        return {'price': [RangeValidator(min=0, max=1000)]}
+
+
+class Room(Model):
+    def properties(self):
+        return {'name': 'name', 'rates': 'rates'}
+
+    def rules(self):
+        return {'rates': [NestedValidator()]}
+
+
+class Hotel(Model):
+    def properties(self):
+        return {'rooms': 'rooms', 'partner': 'partner', 'child': 'child'}
+
+    def rules(self):
+        return {
+            'rooms': [NestedValidator(required=False)],
+            'partner': [NestedValidator(required=False)],
+            'child': [NestedValidator(required=False)],
+        }
+
+
+class TestNestedValidation(unittest.TestCase):
+    def test_shared_model_validated_once(self):
+        rate = Rate(price=10)
+        rooms = [Room(name=str(i), rates=[rate]) for i in range(5)]
+        hotel = Hotel(rooms=rooms)
+
+        with mock.patch.object(
+                Rate, '_validate', autospec=True,
+                side_effect=Model._validate) as validate:
+            self.assertTrue(hotel.validate())
+        self.assertEqual(1, validate.call_count)
+
+        # a new call validates the shared model again
+        rate.price = -1
+        self.assertFalse(hotel.validate())
+        self.assertFalse(rooms[4].validate())
+
+    def test_cycle(self):
+        a, b = Hotel(), Hotel()
+        a.partner, b.partner = b, a
+        self.assertTrue(a.validate())
+
+        b.child = Rate(price=-1)
+        self.assertFalse(a.validate())
+        self.assertEqual(['partner.child.price'], list(a.get_error_paths()))
+
+    def test_async(self):
+        a, b = Hotel(), Hotel()
+        a.partner, b.partner = b, a
+        self.assertTrue(asyncio.run(asyncio.wait_for(a.avalidate(), 5)))
+
+        rate = Rate(price=-1)
+        b.child = Room(name='x', rates=[rate, rate])
+        a.rooms = [Room(name=str(i), rates=[rate]) for i in range(3)]
+        with mock.patch.object(
+                Rate, '_avalidate', autospec=True,
+                side_effect=Model._avalidate) as avalidate:
+            self.assertFalse(asyncio.run(asyncio.wait_for(a.avalidate(), 5)))
+        self.assertEqual(1, avalidate.call_count)
+        errors = a.get_error_paths()
+
+        self.assertFalse(a.validate())
+        self.assertEqual(a.get_error_paths(), errors)
+
+    def test_deep_nesting(self):
+        depth = sys.getrecursionlimit() * 2
+        root = leaf = Hotel()
+        for _ in range(depth):
+            leaf.child = Hotel()
+            leaf = leaf.child
+        self.assertTrue(root.validate())
+
+        leaf.child = Rate(price=-1)
+        self.assertFalse(root.validate())
+        path, = root.get_error_paths()
+        self.assertEqual('child.' * (depth + 1) + 'price', path)
+
+    def test_max_depth(self):
+        root = leaf = Hotel()
+        for _ in range(4):
+            leaf.child = Hotel()
+            leaf = leaf.child
+        leaf.child = Rate(price=-1)
+        with mock.patch.object(ValidationPass, 'max_depth', 2):
+            self.assertFalse(root.validate())
+        self.assertEqual(['child.child.child.child.child.price'],
+                         list(root.get_error_paths()))
+
+    def test_error_paths(self):
+        hotel = Hotel(
+            rooms=[
+                Room(name='a', rates=[Rate(price=1)]),
+                Room(name='b', rates=[Rate(price=2), Rate(price=-1)]),
+            ],
+            partner={'deluxe': Room(name='c', rates=[Rate(price=-2)])},
+        )
+        self.assertFalse(hotel.validate())
+        self.assertEqual({
+            'rooms[1].rates[1].price': [
+                '-1 is not within the range 0 and 1000'],
+            'partner.deluxe.rates[0].price': [
+                '-2 is not within the range 0 and 1000'],
+        }, hotel.get_error_paths())
+
+    def test_nested_models(self):
+        room, rate = Room(), Rate()
+        validator = NestedValidator()
+        self.assertEqual([room], validator.nested_models(room))
+        self.assertEqual([room, rate],
+                         validator.nested_models([room, 1, rate]))
+        self.assertEqual([rate], validator.nested_models({'a': rate}))
+        self.assertEqual([], validator.nested_models('room'))
+        self.assertEqual([], RangeValidator().nested_models(room))
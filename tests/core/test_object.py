@@ -4,13 +4,14 @@
 # License: Apache 2.0
 # Source: https://github.com/trivago/rebase
 # Version: 1.2.0
-# Python Version: 3.6
+# Python Version: 3.7
 # Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
 """
 
+import tracemalloc
 import unittest
 from unittest import mock
-from rebase.core import Object
+from rebase.core import Model, Object
 
 
 class TestObject(unittest.TestCase):
@@ -80,3 +81,233 @@ class TestObject(unittest.TestCase):
         self.assertIsNone(setattr(self.obj, 'age', 25))
         self.assertIs(getattr(self.obj, 'age'), 25)
         self.assertRaises(AttributeError, setattr, self.obj, 'age', '25')
+
+    def test_object_schema_cache(self):
+        other = Object(
+            name='Lucie',
+            age='46',
+            gender="Female",
+            location=dict(
+                city='Lyon',
+                country='France'
+            ),
+            is_admin=True,
+            user='user',
+            status='active',
+            mother=None
+        )
+
+        self.assertIs(self.obj._schema, other._schema)
+        self.assertIsNot(self.obj._schema, Object(name='Paul')._schema)
+        self.assertEqual(other.name, 'Lucie')
+
+    def test_object_schema_mutable_defaults(self):
+        class Basket(Object):
+            def properties(self):
+                return {'items': []}
+
+        first, second = Basket(), Basket()
+        first.items.append('apple')
+
+        self.assertIs(first._schema, second._schema)
+        self.assertEqual(second.items, [])
+
+    def test_object_schema_bound(self):
+        class Label(Object):
+            def properties(self):
+                return {
+                    'name': 'name',
+                    'label': lambda: self._raw_attributes['name'].upper(),
+                    'title': ('name', self._title),
+                }
+
+            def _title(self, value):
+                return f'{value} of {self._raw_attributes["name"]}'
+
+        first, second = Label(name='a'), Label(name='b')
+        records = Label.from_records([{'name': 'c'}, {'name': 'd'}])
+
+        self.assertTrue(first._schema.bound)
+        self.assertIsNot(first._schema, second._schema)
+        self.assertEqual((first.label, second.label), ('A', 'B'))
+        self.assertEqual(second.title, 'b of b')
+        self.assertEqual([obj.label for obj in records], ['C', 'D'])
+
+    def test_object_schema_default_types(self):
+        self.assertEqual(Object(properties={'flag': 1}).flag, 1)
+        self.assertIs(Object(properties={'flag': True}).flag, True)
+        self.assertIsInstance(Object(properties={'flag': 1.0}).flag, float)
+
+    def test_object_dynamic_properties(self):
+        class Dynamic(Object):
+            dynamic_properties = True
+
+            def properties(self):
+                return {k: k for k in self._raw_attributes if k != 'skip'}
+
+        obj = Dynamic(name='Paul', skip=True)
+
+        self.assertIsNone(obj._schema)
+        self.assertEqual(obj.name, 'Paul')
+        self.assertRaises(AttributeError, getattr, obj, 'skip')
+
+    def test_object_from_records(self):
+        records = [
+            {'name': 'Paul', 'age': 35},
+            {'name': 'Lucie', 'age': 46},
+            {'name': 'Anna', 'city': 'Paris'},
+        ]
+
+        objects = Object.from_records(records)
+        self.assertEqual(len(objects), 3)
+        self.assertEqual(objects[1].name, 'Lucie')
+        self.assertEqual(objects[2].city, 'Paris')
+        self.assertRaises(AttributeError, getattr, objects[2], 'age')
+        self.assertIs(objects[0]._schema, objects[1]._schema)
+        self.assertEqual(
+            [o.attributes for o in objects], [Object(**r).attributes for r in records])
+
+        lazy = Object.from_records((r for r in records), lazy=True, status='active')
+        self.assertNotIsInstance(lazy, list)
+        self.assertEqual([o.status for o in lazy], ['active'] * 3)
+
+    def test_object_from_records_init(self):
+        class Person(Object):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self._id = 'person'
+
+        self.assertEqual(
+            [p.get_id() for p in Person.from_records([{'name': 'Paul'}])], ['person'])
+
+    def test_object_lazy_nested(self):
+        class Child(Object):
+            def properties(self):
+                return {'firstname': 'name'}
+
+        class Person(Object):
+            lazy_nested = True
+
+            def properties(self):
+                return {
+                    'name': 'name',
+                    'mother': ('mother', Object),
+                    'father': ('father', Child),
+                    'profile': Object,
+                }
+
+        person = Person(name='Paul', mother={'name': 'Lucie', 'age': 46}, father={'name': 'Marc'})
+        eager = Object(name='Paul', mother={'name': 'Lucie', 'age': 46})
+
+        self.assertEqual(person.attributes['mother'], {'name': 'Lucie', 'age': 46})
+        self.assertEqual(person.attributes['profile']['name'], 'Paul')
+        self.assertNotIsInstance(person._attributes['mother'], Object)
+        self.assertNotIsInstance(person._attributes['profile'], Object)
+
+        self.assertEqual(person.attributes['father'], {'firstname': 'Marc'})
+        self.assertIsInstance(person.father, Child)
+        self.assertIs(person.father, person._attributes['father'])
+
+        self.assertIsInstance(person.mother, Object)
+        self.assertEqual(person.mother.age, 46)
+        self.assertEqual(person.mother.attributes, eager.mother)
+
+    def test_object_cache_attributes(self):
+        class Cached(Object):
+            cache_attributes = True
+
+            def properties(self):
+                return {
+                    'name': 'name',
+                    'mother': ('mother', Object),
+                    'children': 'children',
+                }
+
+        child = Object(name='Anna')
+        obj = Cached(name='Paul', mother={'name': 'Lucie'}, children=[child])
+
+        attributes = obj.attributes
+        self.assertIs(obj.attributes, attributes)
+        self.assertEqual(attributes['children'], [{'name': 'Anna'}])
+
+        obj.name = 'Pierre'
+        self.assertIsNot(obj.attributes, attributes)
+        self.assertEqual(obj.attributes['name'], 'Pierre')
+
+        attributes = obj.attributes
+        obj.mother.name = 'Marie'
+        self.assertEqual(obj.attributes['mother'], {'name': 'Marie'})
+
+        child.name = 'Emma'
+        self.assertEqual(obj.attributes['children'], [{'name': 'Emma'}])
+
+    def test_object_keep_raw(self):
+        class Address(Object):
+            keep_raw = 'mapped'
+
+            def properties(self):
+                return {'city': 'location.city'}
+
+        def hotel(keep):
+            class Hotel(Object):
+                keep_raw = keep
+
+                def properties(self):
+                    return {
+                        'name': 'name',
+                        'stars': ('rating.stars', int),
+                        'address': Address,
+                        'tag': lambda: 'x',
+                    }
+            return Hotel
+
+        record = {
+            'name': 'Paris',
+            'rating': {'stars': '4'},
+            'location': {'city': 'Paris'},
+            **{f'field{i}': 'x' * 100 for i in range(100)},
+        }
+        full = hotel(True)(**record)
+        self.assertEqual({'location'}, set(full.address._raw_attributes))
+
+        class Shared(Object):
+            def properties(self):
+                return {'name': 'name', 'address': Object}
+
+        shared = Shared(**record)
+        self.assertIs(shared._raw_attributes, shared.address._raw_attributes)
+        self.assertEqual('Paris', shared.address.name)
+        self.assertIn('field0', repr(full))
+
+        mapped = hotel('mapped')(**record)
+        self.assertEqual({'name': 'Paris', 'rating': {'stars': '4'}},
+                         mapped._raw_attributes)
+        self.assertEqual('Paris', mapped.address.city)
+        self.assertEqual(full.attributes, mapped.attributes)
+        self.assertEqual('Hotel(**{})', repr(hotel(False)(**record)))
+
+        class Dynamic(Model):
+            dynamic_properties = True
+            keep_raw = False
+
+            def properties(self):
+                return {'address': Address, 'name': 'name'}
+
+        obj = Dynamic(name='a', location={'city': 'Rome'})
+        self.assertEqual(2, len(obj._raw_attributes))
+        self.assertEqual('Rome', obj.address.city)
+        self.assertEqual({}, obj.get_errors())
+
+        def retained(cls):
+            records = [dict(record) for _ in range(200)]
+            cls(**record)
+            tracemalloc.start()
+            objects = [cls(**r) for r in records]
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del objects
+            return size / 200
+
+        lean = retained(hotel(False))
+        self.assertLess(lean * 4, retained(hotel(True)))
+        self.assertLess(lean, retained(hotel('mapped')) + 1)
@@ -0,0 +1,76 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from rebase.core import Model, map_many, validate_many
+from rebase.validators import RangeValidator
+
+
+class Person(Model):
+    def properties(self):
+        return {
+            'name': 'name',
+            'age': 'age',
+            'gender': ('gender', lambda x: int(x == 'Male')),
+        }
+
+    def rules(self):
+        return {'age': [RangeValidator(min=20, max=30)]}
+
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            {'name': f'person {i}', 'age': 15 + i % 20, 'gender': 'Male'}
+            for i in range(250)
+        ]
+
+    def test_map_many(self):
+        people = list(map_many(Person, iter(self.records), chunk_size=16))
+
+        self.assertEqual(len(people), 250)
+        self.assertIsInstance(people[0], Person)
+        self.assertEqual([p.name for p in people], [r['name'] for r in self.records])
+        self.assertEqual(people[3].gender, 1)
+
+    def test_validate_many(self):
+        expected = [
+            {} if 20 <= r['age'] <= 30
+            else {'age': [f"{r['age']} is not within the range 20 and 30"]}
+            for r in self.records
+        ]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(validate_many(
+                Person, self.records, executor=executor, chunk_size=10,
+                max_in_flight=3, context='personal'))
+            self.assertEqual([errors for _, errors in results], expected)
+            self.assertEqual(results[0][0].get_context(), 'personal')
+
+            unordered = validate_many(
+                Person, self.records, executor=executor, chunk_size=7,
+                ordered=False, attributes=True)
+            self.assertCountEqual(
+                [(a['name'], str(e)) for a, e in unordered],
+                [(r['name'], str(e)) for r, e in zip(self.records, expected)])
+
+    def test_validate_many_process(self):
+        results = list(validate_many(
+            Person, self.records, executor='process', workers=2, chunk_size=50))
+
+        self.assertEqual(len(results), 250)
+        self.assertEqual(results[5][0], {'name': 'person 5', 'age': 20, 'gender': 1})
+        self.assertEqual(
+            [not errors for _, errors in results],
+            [20 <= r['age'] <= 30 for r in self.records])
+
+    def test_executor_invalid(self):
+        self.assertRaises(ValueError, list, map_many(Person, self.records, executor='gpu'))
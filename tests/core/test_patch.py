@@ -0,0 +1,141 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import json
+import unittest
+from decimal import Decimal
+from rebase.core import Model, Object, unpackb
+
+
+class Room(Object):
+    def properties(self):
+        return {'name': 'name', 'price': 'price', 'tags': 'tags'}
+
+
+class Hotel(Model):
+    track_changes = True
+
+    def properties(self):
+        return {
+            'name': 'name',
+            'address': 'address',
+            'owner': ('owner', Object),
+            'rooms': ('rooms', lambda x: [Room(**r) for r in x]),
+        }
+
+
+def hotel():
+    return Hotel(
+        name='Paris',
+        address={'city': 'Paris', 'codes': ['P1', 'P2']},
+        owner={'name': 'Paul'},
+        rooms=[{'name': f'r{i}', 'price': 100, 'tags': ['a']}
+               for i in range(3)],
+    )
+
+
+class TestPatch(unittest.TestCase):
+    def test_changes(self):
+        h = hotel()
+        self.assertEqual({}, h.changes())
+
+        h.name = 'Rome'
+        h.owner.name = 'Anna'
+        h.rooms[1].price = 90
+        h.rooms[2].tags.append('b')
+        h.address['codes'].pop()
+        del h.address['city']
+        h.address['zip'] = 75000
+        self.assertEqual({
+            'set': {
+                'name': 'Rome',
+                'address.zip': 75000,
+                'owner.name': 'Anna',
+                'rooms.1.price': 90,
+                'rooms.2.tags.1': 'b',
+            },
+            'unset': ['address.codes.1', 'address.city'],
+        }, h.changes())
+
+        h.checkpoint()
+        self.assertEqual({}, h.changes())
+        del h.rooms[:]
+        self.assertEqual({'unset': ['rooms.2', 'rooms.1', 'rooms.0']},
+                         h.changes())
+        self.assertRaises(ValueError, Room(name='x').changes)
+
+    def test_diff_and_apply_patch(self):
+        old, new = hotel(), hotel()
+        new.name = 'Rome'
+        new.owner.name = 'Anna'
+        new.rooms[0].tags.extend(['b', 'c'])
+        new.rooms.pop()
+        new.address['codes'] = {1: 'P1'}
+        patch = old.diff(new)
+        self.assertEqual({'codes': {1: 'P1'}},
+                         {k[8:]: v for k, v in patch['set'].items()
+                          if k.startswith('address.')})
+        self.assertEqual(patch, old.diff(new.attributes))
+
+        old.apply_patch(patch)
+        self.assertEqual(new.attributes, old.attributes)
+        self.assertEqual({}, old.diff(new))
+        self.assertIsInstance(old.owner, Object)
+
+        self.assertRaises(AttributeError, old.apply_patch,
+                          {'set': {'unknown': 1}})
+        self.assertRaises(KeyError, old.apply_patch,
+                          {'set': {'rooms.9.name': 1}})
+
+    def test_apply_patch_typed(self):
+        class Priced(Model):
+            track_changes = True
+
+            def properties(self):
+                return {
+                    'owner': ('owner', Object),
+                    'price': ('price', Decimal),
+                }
+
+        old = Priced(owner=None, price=Decimal('100.10'))
+        new = Priced(owner={'name': 'Anna'}, price=Decimal('80.30'))
+        old.apply_patch(old.diff(new))
+        self.assertIsInstance(old.owner, Object)
+        self.assertEqual('Anna', old.owner.name)
+        self.assertEqual(new.attributes, old.attributes)
+
+        new.price = Decimal('75.15')
+        other = Priced(owner={'name': 'Anna'}, price=Decimal('80.30'))
+        other.apply_patch(json.loads(new.to_json(changes=True)))
+        self.assertEqual(Decimal('75.15'), other.price)
+
+    def test_delta_serialization(self):
+        h = hotel()
+        h.rooms[0].price = 80
+        self.assertEqual('{"set":{"rooms.0.price":80}}',
+                         h.to_json(encoder='json', changes=True))
+        self.assertEqual({'set': {'rooms.0.price': 80}},
+                         unpackb(h.to_msgpack(changes=True)))
+
+        class Cached(Hotel):
+            cache_attributes = True
+
+        other = Cached(**hotel()._raw_attributes)
+        self.assertEqual(100, other.attributes['rooms'][0]['price'])
+        other.apply_patch(json.loads(h.to_json(changes=True)))
+        self.assertEqual(80, other.attributes['rooms'][0]['price'])
+
+        other.apply_patch({'set': {'address.city': 'Rome'}})
+        self.assertEqual('Rome', other.attributes['address']['city'])
+        self.assertEqual({'address'}, other._changes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import unittest
+from unittest import mock
+from rebase.core import Object, Path, MISSING
+
+
+class TestPath(unittest.TestCase):
+    def setUp(self):
+        self.data = {
+            'location': {'city': 'Paris', 'country': None},
+            'rooms': [
+                {'name': 'single', 'price': 80},
+                {'name': 'double', 'price': 120},
+                {'name': 'suite'},
+            ],
+            'owner': Object(name='Lucie', address={'city': 'Lyon'}),
+        }
+
+    def test_path_compile(self):
+        self.assertIs(Path.compile('a.b.c'), Path.compile('a.b.c'))
+        self.assertEqual(Path.compile('a.0.c').segments,
+                         (('a', None), ('0', 0), ('c', None)))
+
+    def test_path_cache_size(self):
+        with mock.patch.object(Path, '_cache', {}), \
+                mock.patch.object(Path, 'max_size', 10):
+            for i in range(50):
+                Object(**{f'key{i}': i})
+                Path.compile(f'a.{i}')
+            self.assertEqual(10, len(Path._cache))
+            self.assertEqual('a.49', Path.compile('a.49').path)
+
+    def test_path_resolve(self):
+        self.assertEqual(Path.compile('location.city').resolve(self.data), 'Paris')
+        self.assertIsNone(Path.compile('location.country').resolve(self.data))
+        self.assertEqual(Path.compile('rooms.1.price').resolve(self.data), 120)
+        self.assertEqual(Path.compile('rooms.-1.name').resolve(self.data), 'suite')
+        self.assertEqual(Path.compile('owner.address.city').resolve(self.data), 'Lyon')
+
+    def test_path_missing(self):
+        self.assertIs(Path.compile('location.zip').resolve(self.data), MISSING)
+        self.assertIs(Path.compile('rooms.9.price').resolve(self.data), MISSING)
+        self.assertIs(Path.compile('rooms.name').resolve(self.data), MISSING)
+        self.assertIs(Path.compile('location.country.code').resolve(self.data, None), None)
+        self.assertEqual(Path.compile('location.zip').resolve(self.data, 0), 0)
+
+    def test_path_wildcard(self):
+        self.assertEqual(Path.compile('rooms.*.price').resolve(self.data), [80, 120])
+        self.assertEqual(Path.compile('location.*').resolve(self.data), ['Paris', None])
+        self.assertIs(Path.compile('owner.name.*').resolve(self.data), MISSING)
@@ -0,0 +1,149 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import copy
+import pickle
+import unittest
+from unittest import mock
+from rebase.core import Model, Object, packb, slotted, unpackb
+from rebase.core.lazy import Lazy
+from rebase.validators import RangeValidator
+
+
+class Room(Object):
+    def properties(self):
+        return {
+            'id': 'id',
+            'price': ('price', lambda x: round(x * 1.19, 2)),
+        }
+
+
+class Hotel(Model):
+    def properties(self):
+        return {
+            'name': 'name',
+            'stars': ('rating.stars', int),
+            'gender': ('owner.gender', lambda x: int(x == 'Male')),
+            'rooms': ('rooms', lambda x: [Room(**r) for r in x]),
+            'main': ('main', Room),
+        }
+
+    def rules(self):
+        return {
+            'stars': [RangeValidator(min=1, max=5)],
+        }
+
+
+@slotted
+class SlottedRoom(Room):
+    pass
+
+
+class LazyHotel(Hotel):
+    lazy_nested = True
+
+
+class TaggedHotel(Hotel):
+    def __init__(self, extra=None, **attributes):
+        super().__init__(**attributes)
+        self.extra = extra
+
+    def _properties(self):
+        return [*super()._properties(), 'extra']
+
+
+RECORD = {
+    'name': 'Hotel Paris',
+    'rating': {'stars': 9},
+    'owner': {'gender': 'Male'},
+    'rooms': [{'id': 1, 'price': 100}, {'id': 2, 'price': 80}],
+    'main': {'id': 1, 'price': 100},
+}
+
+
+class TestPickle(unittest.TestCase):
+    def test_pickle_model(self):
+        hotel = Hotel(context='public', **RECORD)
+        hotel.validate()
+        hotel.name = 'Hotel Lyon'
+        hotel.get_id()
+
+        data = pickle.dumps(hotel)
+        self.assertNotIn(b'owner', data)
+        clone = pickle.loads(data)
+
+        self.assertIs(Hotel, type(clone))
+        self.assertEqual(hotel.attributes, clone.attributes)
+        self.assertEqual(hotel.get_errors(), clone.get_errors())
+        self.assertEqual('public', clone.get_context())
+        self.assertEqual(hotel.get_id(), clone.get_id())
+        self.assertEqual(1, clone.gender)
+
+        clone.stars = 3
+        self.assertTrue(clone.validate())
+        with self.assertRaises(AttributeError):
+            clone.stars = '3'
+
+    def test_pickle_lazy_and_slotted(self):
+        hotel = LazyHotel(**RECORD)
+        self.assertIs(Lazy, type(hotel._attributes['main']))
+
+        clone = pickle.loads(pickle.dumps(hotel))
+        self.assertEqual(119.0, clone.main.price)
+        self.assertEqual(hotel.attributes, clone.attributes)
+
+        room = SlottedRoom(id=3, price=10)
+        clone = pickle.loads(pickle.dumps(room))
+        self.assertEqual({'id': 3, 'price': 11.9}, clone.attributes)
+
+    def test_pickle_instance_dict(self):
+        hotel = TaggedHotel(extra={'source': 'feed'}, **RECORD)
+
+        for clone in (pickle.loads(pickle.dumps(hotel)), copy.copy(hotel),
+                      copy.deepcopy(hotel)):
+            self.assertIs(TaggedHotel, type(clone))
+            self.assertEqual({'source': 'feed'}, clone.extra)
+            self.assertEqual(hotel.attributes, clone.attributes)
+
+    def test_pickle_plain_object(self):
+        obj = Object(name='Paul', age=35)
+        obj.age = 36
+        clone = pickle.loads(pickle.dumps(obj))
+
+        self.assertEqual({'name': 'Paul', 'age': 36}, clone.attributes)
+        self.assertEqual(repr(obj), repr(clone))
+
+    def test_msgpack(self):
+        hotel = Hotel(**RECORD)
+        data = hotel.to_msgpack()
+
+        self.assertEqual(hotel.attributes, unpackb(data))
+        self.assertLess(len(data), len(hotel.to_bytes()))
+
+        values = [None, True, False, 0, 127, 128, -1, -33, 2 ** 40,
+                  -2 ** 40, 1.5, '', 'é' * 40, b'\x00' * 300,
+                  list(range(20)), {'a': {'b': [1, 2]}, 1: None}]
+        for value in values:
+            self.assertEqual(value, unpackb(packb(value)))
+        self.assertEqual([1, 2], unpackb(packb((1, 2))))
+        with self.assertRaises(TypeError):
+            packb(object())
+        with self.assertRaises(ValueError):
+            unpackb(packb('truncated')[:-1])
+
+        with mock.patch('rebase.core.binary.msgpack', None):
+            with self.assertRaisesRegex(ImportError, r'rebase\[msgpack\]'):
+                hotel.to_msgpack()
+            with self.assertRaises(ImportError):
+                unpackb(data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import unittest
+import rebase
+from rebase.core import Model, profiling
+from rebase.validators import IntegerValidator, RangeValidator
+
+
+class Hotel(Model):
+    def properties(self):
+        return {
+            'name': 'name',
+            'stars': 'rating.stars',
+        }
+
+    def rules(self):
+        return {
+            'stars': [IntegerValidator(), RangeValidator(min=1, max=5)],
+        }
+
+
+class TestProfiling(unittest.TestCase):
+    def tearDown(self):
+        profiling.disable()
+        profiling.reset()
+
+    def test_disabled(self):
+        Hotel(name='Hotel', rating={'stars': 4}).validate()
+        self.assertEqual({}, rebase.stats())
+
+    def test_profile(self):
+        events = []
+        profiling.add_hook(lambda *event: events.append(event))
+        try:
+            with profiling.profile():
+                hotels = Hotel.from_records(
+                    [{'name': 'Hotel', 'rating': {'stars': 4}}] * 3)
+                for hotel in hotels:
+                    hotel.validate()
+        finally:
+            del profiling._hooks[:]
+        Hotel(name='Hotel').validate()
+
+        stats = rebase.stats()
+        classname = hotels[0].classname
+        self.assertEqual(3, stats['construct'][classname]['calls'])
+        self.assertEqual(
+            {f'{classname}.name', f'{classname}.stars'},
+            set(stats['mapping']))
+        self.assertEqual(3, stats['validator']['RangeValidator']['calls'])
+        self.assertEqual(6, stats['rule'][f'{classname}.stars']['calls'])
+        self.assertGreater(stats['rule'][f'{classname}.stars']['seconds'], 0)
+        self.assertEqual(
+            {'hits': 3, 'misses': 6, 'hit_rate': 1 / 3}, stats['cache']['memo'])
+        self.assertIn(('cache', 'memo', True), events)
+        self.assertEqual(
+            ('rule', f'{classname}.stars'), events[-1][:2])
+        self.assertEqual(
+            f'{classname}.stars', profiling.top('rule', 1)[0][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import itertools
+import unittest
+from unittest import mock
+from rebase.core import Model, Validator, profiling
+from rebase.validators import (AlnumValidator, BoolValidator,
+                               IntegerValidator, NestedValidator,
+                               RangeValidator, StringValidator)
+
+
+class EvenValidator(Validator):
+    def properties(self):
+        return {
+            **super().properties(),
+            'message': lambda: '{value} is odd'
+        }
+
+    def _check(self, value, memo=None):
+        result = super()._check(value, memo)
+        if not result:
+            return result
+        if value % 2:
+            return self.failure(value=value)
+        return result
+
+    def depends_on(self):
+        return {IntegerValidator()}
+
+
+class StrictRange(RangeValidator):
+    def _check(self, value, memo=None):
+        result = super()._check(value, memo)
+        if result and value == self.max:
+            return self.failure(value=value, min=self.min, max=self.max)
+        return result
+
+
+class Rate(Model):
+    def properties(self):
+        return {'price': 'price'}
+
+    def rules(self):
+        return {'price': [RangeValidator(min=0, max=1000)]}
+
+
+class Hotel(Model):
+    def properties(self):
+        return {
+            'name': 'name',
+            'code': 'code',
+            'stars': 'stars',
+            'rooms': 'rooms',
+            'open': 'open',
+            'even': 'even',
+            'strict': 'strict',
+            'rates': 'rates',
+            'unchecked': 'unchecked',
+        }
+
+    def rules(self):
+        return {
+            'name': [StringValidator(required=True)],
+            'code': [AlnumValidator(), StringValidator()],
+            'stars': [IntegerValidator(), RangeValidator(min=1, max=5)],
+            'rooms': [RangeValidator(min=1, max=9, required=True),
+                      AlnumValidator(message='{value}: no code')],
+            'open': [BoolValidator(message='{value}?')],
+            'even': [EvenValidator()],
+            'strict': [StrictRange(min=0, max=3)],
+            'rates': [NestedValidator(required=False)],
+            'unchecked': [],
+        }
+
+
+class CompiledHotel(Hotel):
+    compile_rules = True
+
+
+class CompiledRate(Rate):
+    compile_rules = True
+
+
+VALUES = [None, 0, 1, 3, 4, 7, 12, -1, True, False, 2.0, '', 'abc', 'a b',
+          'PAR1', [], 'é']
+
+
+class TestRuleCompiler(unittest.TestCase):
+    def assertSame(self, **attributes):
+        expected, compiled = Hotel(**attributes), CompiledHotel(**attributes)
+        try:
+            valid = expected.validate()
+        except Exception as e:
+            with self.assertRaises(type(e)):
+                compiled.validate()
+            return
+        self.assertEqual(valid, compiled.validate(), attributes)
+        self.assertEqual(expected.get_errors(), compiled.get_errors(),
+                         attributes)
+        self.assertEqual(list(expected.get_errors()),
+                         list(compiled.get_errors()))
+
+    def test_differential(self):
+        for name, value in itertools.product(
+                ['name', 'code', 'stars', 'rooms', 'open', 'even', 'strict'],
+                VALUES):
+            self.assertSame(**{
+                'name': 'a', 'code': 'A1', 'stars': 3, 'rooms': 2,
+                'open': True, 'even': 2, 'strict': 1, name: value,
+            })
+
+        for values in itertools.product(VALUES, repeat=3):
+            self.assertSame(**dict(zip(('name', 'code', 'stars'), values)))
+            self.assertSame(**dict(zip(('rooms', 'open', 'even'), values)))
+
+    def test_nested(self):
+        rates = [CompiledRate(price=p) for p in (1, -1, 'x')]
+        hotel = CompiledHotel(name='a', rates=rates)
+        expected = Hotel(name='a', rates=[Rate(price=p) for p in (1, -1, 'x')])
+        self.assertEqual(expected.validate(), hotel.validate())
+        self.assertEqual(expected.get_error_paths(), hotel.get_error_paths())
+
+    def test_compiled(self):
+        hotel = CompiledHotel(name='a')
+        hotel.validate()
+        compiled = hotel._get_compiled()
+        # the built-in validators and their dependencies run inline
+        self.assertEqual((8, 3), (compiled.inlined, compiled.fallback))
+        self.assertIn("value = attributes.get('stars')", compiled.source)
+        self.assertIs(compiled, CompiledHotel(name='b')._get_compiled())
+
+
+    def test_interpreted(self):
+        hotel = CompiledHotel(name=1, stars=9)
+        with mock.patch.object(CompiledHotel, '_get_compiled') as compiled:
+            hotel.validate('stars')
+            hotel.validate(max_errors=1)
+            hotel.validate(messages=False)
+            with profiling.profile():
+                hotel.validate()
+        compiled.assert_not_called()
+
+        class Dynamic(CompiledHotel):
+            dynamic_rules = True
+
+        self.assertIsNone(Dynamic()._get_compiled())
+        self.assertFalse(Dynamic(name=1).validate())
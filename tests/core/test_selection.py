@@ -0,0 +1,113 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import unittest
+from collections.abc import Mapping, Sequence
+from unittest import mock
+from rebase.core import Model, Object, View
+
+
+class Room(Object):
+    def properties(self):
+        return {'name': 'name', 'price': 'price', 'rates': 'rates'}
+
+
+class Hotel(Model):
+    lazy_nested = True
+
+    def properties(self):
+        return {
+            'name': 'name',
+            'location': 'location',
+            'mother': ('mother', Object),
+            'rooms': ('rooms', lambda x: [Room(**r) for r in x]),
+        }
+
+    def scenarios(self):
+        return {
+            'public': ['name', 'location.city', 'rooms.*.price'],
+            'private': ['-mother', '-rooms.*.rates'],
+        }
+
+
+def hotel(context=None):
+    return Hotel(
+        context=context,
+        name='Paris',
+        location={'city': 'Paris', 'country': 'France'},
+        mother={'name': 'Lucie', 'age': 46},
+        rooms=[{'name': f'r{i}', 'price': 100 + i, 'rates': [1, 2]}
+               for i in range(3)],
+    )
+
+
+class TestSelection(unittest.TestCase):
+    def test_get_paths(self):
+        h = hotel()
+        self.assertEqual({'name': 'Paris'}, h.get('name'))
+        self.assertEqual(
+            {'location': {'city': 'Paris'},
+             'rooms': [{'price': 100}, {'price': 101}, {'price': 102}]},
+            h.get('location.city', 'rooms.*.price'))
+        self.assertEqual({'rooms': [{'name': 'r1', 'price': 101}]},
+                         h.get('rooms.1', '-rooms.*.rates'))
+        self.assertEqual({'rooms': [{'name': 'r0', 'rates': [1, 2]}]},
+                         h.get('rooms.0.name', 'rooms.0.rates'))
+        self.assertEqual({'location': {}}, h.get('location.city.zip'))
+
+        everything = h.attributes
+        del everything['mother']
+        self.assertEqual(everything, h.get('-mother'))
+
+    def test_get_walks_selected_branches_only(self):
+        h = hotel()
+        with mock.patch.object(Room, '_json_fields') as fields:
+            h.get('-mother', '-rooms')
+            h.get('name', 'location.city')
+        fields.assert_not_called()
+        self.assertEqual('Lazy', type(h._attributes['mother']).__name__)
+
+    def test_scenarios_with_paths(self):
+        self.assertEqual(
+            {'name': 'Paris', 'location': {'city': 'Paris'},
+             'rooms': [{'price': 100}, {'price': 101}, {'price': 102}]},
+            hotel('public').attributes)
+        private = hotel('private').attributes
+        self.assertNotIn('mother', private)
+        self.assertEqual({'name': 'r0', 'price': 100}, private['rooms'][0])
+        self.assertEqual(private, {**hotel().get('-mother', '-rooms.*.rates')})
+
+    def test_view(self):
+        h = hotel()
+        view = h.view('location.city', 'rooms.*.price', 'mother')
+        self.assertIsInstance(view, Mapping)
+        self.assertEqual(['location', 'mother', 'rooms'], list(view))
+        self.assertEqual({'city': 'Paris'}, dict(view['location']))
+        rooms = view['rooms']
+        self.assertIsInstance(rooms, Sequence)
+        self.assertEqual(3, len(rooms))
+        self.assertEqual({'price': 102}, dict(rooms[-1]))
+        self.assertEqual('Lucie', view['mother']['name'])
+        self.assertRaises(KeyError, view.__getitem__, 'name')
+        with self.assertRaises(TypeError):
+            view['name'] = 'x'
+
+        h.rooms[2].price = 80
+        self.assertEqual(80, rooms[2]['price'])
+
+        view = h.view('-rooms', '-location.country')
+        self.assertEqual({'name', 'location', 'mother'}, set(view))
+        self.assertEqual({'city': 'Paris'}, dict(view['location']))
+        self.assertIsInstance(h.view(), View)
+        self.assertEqual(4, len(h.view()))
+
+
+if __name__ == '__main__':
+    unittest.main()
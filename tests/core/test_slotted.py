@@ -0,0 +1,103 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import tracemalloc
+import unittest
+from rebase.core import Model, Object, slotted
+from rebase.validators import RangeValidator
+
+
+class Hotel(Model):
+    def properties(self):
+        return {
+            'name': 'name',
+            'stars': ('rating.stars', int),
+            'city': 'location.city',
+            'owner': ('owner', Object),
+        }
+
+    def rules(self):
+        return {'stars': [RangeValidator(min=1, max=5)]}
+
+    def validate(self, attribute=None):
+        return super().validate(attribute)
+
+
+SlottedHotel = slotted(Hotel)
+
+
+class TestSlotted(unittest.TestCase):
+    def setUp(self):
+        self.record = {
+            'name': 'Hotel Paris',
+            'rating': {'stars': '4'},
+            'location': {'city': 'Paris'},
+            'owner': {'name': 'Lucie'},
+        }
+        self.hotel = SlottedHotel(**self.record)
+
+    def test_slotted_basic(self):
+        self.assertIsInstance(self.hotel, Model)
+        self.assertFalse(hasattr(self.hotel, '__dict__'))
+        self.assertEqual(self.hotel.name, 'Hotel Paris')
+        self.assertEqual(self.hotel.stars, 4)
+        self.assertIsInstance(self.hotel.owner, Object)
+        self.assertDictEqual(self.hotel.attributes, Hotel(**self.record).attributes)
+        self.assertTrue(self.hotel.validate())
+
+    def test_slotted_keep_raw(self):
+        class Raw(Hotel):
+            keep_raw = True
+
+        self.assertEqual({}, self.hotel._raw_attributes)
+        self.assertTrue(Hotel.keep_raw)
+        self.assertEqual(self.record, slotted(Raw)(**self.record)._raw_attributes)
+
+    def test_slotted_setattr(self):
+        self.hotel.stars = 9
+        self.assertFalse(self.hotel.validate())
+        self.assertIsNone(setattr(self.hotel, 'stars', None))
+        self.assertRaises(AttributeError, setattr, self.hotel, 'stars', '3')
+        self.assertRaises(AttributeError, setattr, self.hotel, 'qwerty', 1)
+        self.assertRaises(AttributeError, getattr, self.hotel, 'qwerty')
+
+    def test_slotted_super(self):
+        hotel = Hotel(**self.record)
+
+        self.assertTrue(self.hotel.validate())
+        self.assertTrue(hotel.validate())
+        self.assertIsNot(Hotel.validate, SlottedHotel.validate)
+        self.assertIs(Hotel.validate.__closure__[0].cell_contents, Hotel)
+        self.assertIs(
+            SlottedHotel.validate.__closure__[0].cell_contents, SlottedHotel)
+
+    def test_slotted_invalid(self):
+        class Default(Object):
+            pass
+
+        class Shadowing(Object):
+            def properties(self):
+                return {'get': 'get'}
+
+        self.assertRaises(TypeError, slotted, Default)
+        self.assertRaises(TypeError, slotted, Shadowing)
+        self.assertRaises(TypeError, slotted, dict)
+
+    def test_slotted_memory(self):
+        def retained(cls):
+            records = [dict(self.record, owner=None) for _ in range(1000)]
+            tracemalloc.start()
+            objects = [cls(**record) for record in records]
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del objects
+            return size
+
+        self.assertLess(retained(SlottedHotel), retained(Hotel))
@@ -0,0 +1,117 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import os
+import tempfile
+import tracemalloc
+import unittest
+from rebase.core import Model, iter_records, iter_validate
+from rebase.validators import RangeValidator
+
+
+class Hotel(Model):
+    def properties(self):
+        return {
+            'name': 'name',
+            'stars': 'rating.stars',
+        }
+
+    def rules(self):
+        return {
+            'stars': [RangeValidator(min=1, max=5)],
+        }
+
+
+def lines(count):
+    for i in range(count):
+        yield b'{"name": "h%d", "rating": {"stars": %d}}\n' % (i, i % 7)
+
+
+class TestStream(unittest.TestCase):
+    def test_iter_records(self):
+        with tempfile.TemporaryDirectory() as path:
+            path = os.path.join(path, 'hotels.jsonl')
+            with open(path, 'wb') as f:
+                f.writelines(lines(3))
+                f.write(b'\n')
+
+            self.assertEqual(
+                ['h0', 'h1', 'h2'], [r['name'] for r in iter_records(path)])
+
+        with self.assertRaisesRegex(ValueError, 'Line 2'):
+            list(iter_records(['{}', '{', '{}']))
+
+    def test_iter_validate(self):
+        results = list(iter_validate(Hotel, lines(7), attributes=True))
+
+        self.assertEqual(7, len(results))
+        self.assertEqual({'name': 'h3', 'stars': 3}, results[3][0])
+        self.assertEqual({}, results[3][1])
+        self.assertEqual(
+            {'stars': ['0 is not within the range 1 and 5']}, results[0][1])
+        self.assertEqual(
+            [0, 6], [i for i, (_, errors) in enumerate(results) if errors])
+
+    def test_iter_validate_routing(self):
+        rejected = []
+        reports = []
+        source = list(lines(14)) + [b'{"name": \n']
+
+        results = list(iter_validate(
+            Hotel, source,
+            invalid=lambda row, errors: rejected.append(errors),
+            progress=reports.append, progress_every=5
+        ))
+
+        self.assertEqual(10, len(results))
+        self.assertTrue(all(not errors for _, errors in results))
+        self.assertEqual(5, len(rejected))
+        self.assertIn(None, rejected[-1])
+        self.assertEqual([5, 10, 15, 15], [p.rows for p in reports])
+        self.assertEqual(5, reports[-1].invalid)
+        self.assertEqual(sum(map(len, source)), reports[-1].bytes)
+
+        self.assertEqual(
+            10, len(list(iter_validate(Hotel, source, skip_invalid=True))))
+        with self.assertRaises(ValueError):
+            list(iter_validate(Hotel, source))
+
+    def test_iter_validate_not_object(self):
+        rejected = []
+        source = [b'[1, 2]\n', b'5\n', b'"x"\n'] + list(lines(3))
+
+        results = list(iter_validate(
+            Hotel, source,
+            invalid=lambda row, errors: rejected.append(errors)))
+
+        self.assertEqual(3 - len([e for e in rejected if None not in e]),
+                         len(results))
+        self.assertEqual(['Line 1 is not a JSON object.'], rejected[0][None])
+        self.assertEqual(3, len([e for e in rejected if None in e]))
+        self.assertEqual(len(results), len(list(
+            iter_validate(Hotel, source, skip_invalid=True))))
+        with self.assertRaisesRegex(ValueError, 'Line 1 is not a JSON object'):
+            list(iter_validate(Hotel, source))
+
+    def test_iter_validate_memory(self):
+        def peak(count):
+            tracemalloc.start()
+            for _ in iter_validate(Hotel, lines(count)):
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return peak
+
+        peak(100)
+        self.assertLess(peak(20000), 2 * peak(1000))
+
+
+if __name__ == '__main__':
+    unittest.main()
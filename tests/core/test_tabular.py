@@ -0,0 +1,148 @@
+"""This file is part of the trivago/rebase library.
+
+# Copyright (c) 2018 trivago N.V.
+# License: Apache 2.0
+# Source: https://github.com/trivago/rebase
+# Version: 1.2.2
+# Python Version: 3.7
+# Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from rebase.core import (ConversionError, Model, ModelBatch, Object,
+                         TableLoader, read_csv, read_tsv)
+
+
+class Hotel(Model):
+    def properties(self):
+        return {
+            'name': 'name',
+            'stars': ('rating.stars', int),
+            'price': ('price', Decimal),
+            'open': ('open', bool),
+            'tag': lambda: 'csv',
+        }
+
+
+class Legacy(Model):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def properties(self):
+        return {
+            'name': 'name',
+            'stars': ('rating.stars', int),
+        }
+
+
+CSV = (
+    'name,rating.stars,price,open\n'
+    'Paris,4,99.90,yes\n'
+    'Rome,,120,false\n'
+    'Berlin,x,80,1\n'
+)
+
+
+class TestTabular(unittest.TestCase):
+    def test_read_csv(self):
+        hotels = list(read_csv(Hotel, io.StringIO(CSV), on_error='keep'))
+        self.assertEqual(3, len(hotels))
+        self.assertEqual(
+            {'name': 'Paris', 'stars': 4, 'price': Decimal('99.90'),
+             'open': True, 'tag': 'csv'},
+            hotels[0].attributes)
+        self.assertEqual(['name', 'stars', 'price', 'open', 'tag'],
+                         list(hotels[0].attributes))
+        self.assertIsNone(hotels[1].stars)
+        self.assertIs(False, hotels[1].open)
+        self.assertEqual('x', hotels[2].stars)
+
+    def test_read_tsv_from_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'hotels.tsv')
+            with open(path, 'w') as f:
+                f.write(CSV.replace(',', '\t'))
+            hotels = list(read_tsv(Hotel, path, on_error='skip',
+                                   context='public'))
+        self.assertEqual(['Paris', 'Rome'], [h.name for h in hotels])
+        self.assertEqual('public', hotels[0].get_context())
+
+    def test_errors(self):
+        with self.assertRaises(ConversionError) as e:
+            list(read_csv(Hotel, io.StringIO(CSV)))
+        self.assertEqual((4, 1, 'rating.stars', 'x'),
+                         (e.exception.row, e.exception.column,
+                          e.exception.name, e.exception.value))
+        self.assertIn('Row 4, column 1', str(e.exception))
+
+        loader = TableLoader(Hotel, on_error='skip', chunk_size=2)
+        hotels = list(loader.load(io.StringIO(CSV + 'Oslo,3,7\n\n')))
+        self.assertEqual(['Paris', 'Rome'], [h.name for h in hotels])
+        self.assertEqual([4, 5], sorted(e.row for e in loader.errors))
+
+        with self.assertRaises(ValueError):
+            TableLoader(Hotel, on_error='ignore')
+
+    def test_converters_and_header(self):
+        loader = TableLoader(Hotel, converters={'price': float},
+                             null_values=('', 'n/a'), on_error='keep')
+        lines = ['Paris;4;n/a;on', 'Rome;5;10.5;off']
+        hotels = list(TableLoader(
+            Hotel, delimiter=';', converters={'price': float},
+            null_values=('', 'n/a')).load(
+                lines, header=['name', 'rating.stars', 'price', 'open']))
+        self.assertEqual([None, 10.5], [h.price for h in hotels])
+        self.assertEqual([True, False], [h.open for h in hotels])
+        self.assertEqual([], list(loader.load(io.StringIO(''))))
+
+    def test_load_batch(self):
+        batch = TableLoader(Hotel, on_error='skip').load_batch(io.StringIO(CSV))
+        self.assertIsInstance(batch, ModelBatch)
+        self.assertEqual(2, len(batch))
+        self.assertEqual([4, None], list(batch.column('stars')))
+        self.assertEqual(['Paris', 'Rome'], list(batch.column('name')))
+
+    def test_track_changes(self):
+        class Tracked(Model):
+            track_changes = True
+
+            def properties(self):
+                return {'name': 'name', 'stars': ('stars', int)}
+
+        hotel, = read_csv(Tracked, io.StringIO('name,stars\nA,4\n'))
+        self.assertEqual({}, hotel.changes())
+        hotel.stars = 5
+        self.assertEqual({'set': {'stars': 5}}, hotel.changes())
+
+    def test_keep_raw(self):
+        class Mapped(Model):
+            keep_raw = 'mapped'
+
+            def properties(self):
+                return {'name': 'name', 'stars': ('stars', int)}
+
+        hotel, = read_csv(Mapped, io.StringIO('name,stars,extra\nA,4,x\n'))
+        self.assertEqual({'name': 'A', 'stars': '4'}, hotel._raw_attributes)
+        self.assertIn("'name': 'A'", repr(hotel))
+
+    def test_default_properties(self):
+        class Plain(Model):
+            pass
+
+        for cls in (Object, Plain):
+            row, = read_csv(cls, io.StringIO('name,rating.stars\nA,3\n'))
+            self.assertEqual('A', row.name)
+            self.assertEqual({'name': 'A', 'rating': {'stars': '3'}},
+                             row.attributes)
+
+    def test_custom_init(self):
+        hotels = list(read_csv(Legacy, io.StringIO('name,rating.stars\nOslo,3\n')))
+        self.assertEqual({'name': 'Oslo', 'stars': 3}, hotels[0].attributes)
+
+
+if __name__ == '__main__':
+    unittest.main()
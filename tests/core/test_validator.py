@@ -4,13 +4,15 @@
 # License: Apache 2.0
 # Source: https://github.com/trivago/rebase
 # Version: 1.2.0
-# Python Version: 3.6
+# Python Version: 3.7
 # Author: Yuv Joodhisty <yuvrajsingh.joodhisty@trivago.com>
 """
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
-from rebase.core import Validator
+from rebase.core import ValidationResult, Validator
+from rebase.validators import IntegerValidator, RangeValidator
 
 
 @mock.patch.multiple(
@@ -34,3 +36,52 @@ class TestValidator(unittest.TestCase):
 
         self.assertFalse(v.validate('123'))
         self.assertIn('Error 2', v.errors)
+
+
+class TestValidatorCheck(unittest.TestCase):
+    def test_validator_check(self):
+        v = RangeValidator(min=1, max=5)
+
+        self.assertEqual(v.check(3), ValidationResult(True, ()))
+        self.assertEqual(
+            v.check('3'), ValidationResult(False, ('`3` is not an integer',)))
+        self.assertEqual(v.check(9).errors, ('9 is not within the range 1 and 5',))
+        self.assertEqual(v.errors, [])
+        self.assertIs(v.dependencies(), v.dependencies())
+
+    def test_validator_legacy(self):
+        class EvenValidator(IntegerValidator):
+            def validate(self, value):
+                if not super().validate(value):
+                    return False
+                if value % 2:
+                    self.errors.append(f'{value} is odd')
+                    return False
+                return True
+
+        v = EvenValidator()
+
+        self.assertFalse(v.is_stateless())
+        self.assertEqual(v.check(3), ValidationResult(False, ('3 is odd',)))
+        self.assertEqual(v.check('a').errors, ('`a` is not an integer',))
+        self.assertTrue(v.check(4))
+
+    def test_validator_deduplication(self):
+        memo = {}
+        with mock.patch.object(
+                IntegerValidator, '_check', autospec=True,
+                side_effect=lambda self, value, memo=None: ValidationResult(True)) as check:
+            Validator.result(RangeValidator(min=1, max=5), 3, memo)
+            Validator.result(IntegerValidator(), 3, memo)
+            Validator.result(RangeValidator(min=2, max=4), 3, memo)
+
+        self.assertEqual(check.call_count, 1)
+
+    def test_validator_threads(self):
+        v = RangeValidator(min=0, max=100)
+        values = list(range(-50, 150)) * 20
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(v.check, values))
+
+        self.assertEqual([r.valid for r in results], [0 <= x <= 100 for x in values])